@@ -0,0 +1,43 @@
+import logging
+import pytest
+from src.cell.triangle_cell import Triangle
+from src.cell.line_cell import Line
+
+@pytest.fixture(autouse=True)
+def restore_root_logger_handlers():
+    """Restores the root logger handlers after each test, since setup_logging replaces them."""
+    root = logging.getLogger()
+    handlers = root.handlers[:]
+    level = root.level
+    yield
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+@pytest.fixture
+def graded_mesh():
+    """Create a strip of triangles whose width halves towards a boundary line on the right."""
+    class Point:
+        def __init__(self, x, y):
+            self.x = x
+            self.y = y
+
+    class MockMesh:
+        def __init__(self):
+            self.points = []
+            self.cells = []
+
+    xs = [0.0, 0.5, 0.75, 0.875, 0.9375, 0.96875, 1.0]
+    mesh = MockMesh()
+    for x in xs:
+        mesh.points.extend([Point(x, 0.0), Point(x, 1.0)])
+
+    for i in range(len(xs) - 1):
+        bottom, top = 2 * i, 2 * i + 1
+        mesh.cells.append(Triangle(len(mesh.cells), [bottom, bottom + 2, top], mesh))
+        mesh.cells.append(Triangle(len(mesh.cells), [bottom + 2, top + 2, top], mesh))
+    mesh.cells.append(Line(len(mesh.cells), [2 * len(xs) - 2, 2 * len(xs) - 1], mesh))
+
+    for cell in mesh.cells:
+        cell.store_neighbours_and_edges()
+        cell.store_outward_normals()
+    return mesh
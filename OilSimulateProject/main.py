@@ -2,13 +2,20 @@ import time
 import logging
 import os
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 from src.io.mesh_reader import Mesh
 from src.simulation.simulator import Simulation
+from src.simulation.ensemble import EnsembleSimulation
+from src.simulation.velocity import create_velocity_provider
 from src.io.config_reader import (
     load_single_config_file,
-    load_all_configs_in_folder
+    load_all_configs_in_folder,
+    is_ensemble,
+    DEFAULT_FPS,
+    DEFAULT_CFL,
+    DEFAULT_MAX_LEVEL
 )
 
 def setup_logging(log_filename: str = 'default.log', level: int = logging.INFO) -> logging.Logger:
@@ -37,13 +44,21 @@ def setup_logging(log_filename: str = 'default.log', level: int = logging.INFO)
 
     return logger
 
-def run_simulation_for_config(config: dict, config_filename: str) -> None:
+def run_simulation_for_config(config: dict, config_filename: str, meshes: dict = None) -> dict:
     """
     Runs the simulation for a given configuration file.
 
     Args:
         config (dict): Parsed configuration dictionary.
         config_filename (str): Name of the configuration file being used.
+        meshes (dict): Meshes already loaded by earlier runs, keyed by mesh file path and cell
+            ordering. A mesh found here is reused, and a newly loaded mesh is added. If None, the
+            mesh is always loaded.
+
+    Returns:
+        dict: Summary of the run with the config file name, the runtime in seconds, the total
+            oil in the fishing grounds at the final time step (a list with the oil of each member
+            for an ensemble) and the number of time steps taken.
     """
     logger = logging.getLogger(__name__)
 
@@ -68,23 +83,42 @@ def run_simulation_for_config(config: dict, config_filename: str) -> None:
             logger.info(f"  {key} = {value}")
 
     # Extract simulation settings
-    n_steps = config["settings"]["nSteps"]
+    n_steps = config["settings"].get("nSteps")
     t_start = config["settings"]["tStart"]
     t_end = config["settings"]["tEnd"]
+    engine = config["settings"].get("engine", "object")
+    update_mode = config["settings"].get("updateMode")
+    time_stepping = config["settings"].get("timeStepping", "fixed")
+    cfl = config["settings"].get("cfl", DEFAULT_CFL)
+    max_level = config["settings"].get("maxLevel", DEFAULT_MAX_LEVEL)
+    active_threshold = config["settings"].get("activeThreshold")
+    sparse_jump = config["settings"].get("sparseJump", "matvec")
 
     geometry = config["geometry"]
     mesh_name = geometry["meshName"]
     oil_spill_center = geometry["oilSpillCenter"]
     fishing_grounds = geometry["borders"]
+    named_fishing_grounds = geometry.get("fishingGrounds")
+    zones = geometry.get("zones")
 
     io_section = config["IO"]
     write_frequency = io_section.get("writeFrequency")
+    fps = io_section.get("fps", DEFAULT_FPS) if write_frequency is not None else None
     restart_file = io_section.get("restartFile")
+    use_mesh_cache = io_section.get("meshCache", True)
+    cell_ordering = io_section.get("cellOrdering")
+    solution_format = io_section.get("solutionFormat", "text")
+    checkpoint_frequency = io_section.get("checkpointFrequency")
+    video_format = io_section.get("videoFormat", "gif")
+    render_workers = io_section.get("renderWorkers", 0)
+
+    # Velocity provider replacing the default velocity field of the cells
+    velocity = create_velocity_provider(config["velocity"]) if "velocity" in config else None
 
     if write_frequency is None:
         logger.info("No write frequency specified. Video output will not be generated.")
     else:
-        logger.info(f"Video output frequency set to: {write_frequency}")
+        logger.info(f"Video output frequency set to: every {write_frequency} steps, played at {fps} fps")
 
     if restart_file is not None:
         logger.info(f"Restart file provided: {restart_file}")
@@ -92,30 +126,168 @@ def run_simulation_for_config(config: dict, config_filename: str) -> None:
     # Measure execution time
     start_time = time.time()
 
-    # Load the simulation mesh
+    # Load the simulation mesh, or reuse it if an earlier run already loaded it
     file_path = f"data/mesh/{mesh_name}"
-    mesh = Mesh(file_path)
-
-    # Initialize and run the simulator
-    sim = Simulation(
-        mesh,
-        oil_spill_center,
-        fishing_grounds,
-        n_steps,
-        t_start,
-        t_end,
-        write_frequency,
-        results_folder,
-        restart_file,
-        config_basename
-    )
+    mesh_key = (file_path, cell_ordering)
+    if meshes is not None and mesh_key in meshes:
+        logger.info(f"Reusing loaded mesh: {file_path}")
+        mesh = meshes[mesh_key]
+    else:
+        mesh = Mesh(file_path, use_cache=use_mesh_cache, cell_ordering=cell_ordering)
+        if meshes is not None:
+            meshes[mesh_key] = mesh
+
+    # Initialize and run the simulator, a list of oil spill centers runs all of them as members of one ensemble
+    ensemble = is_ensemble(oil_spill_center)
+    if ensemble:
+        sim = EnsembleSimulation(
+            mesh,
+            oil_spill_center,
+            fishing_grounds,
+            n_steps,
+            t_start,
+            t_end,
+            results_folder,
+            config_basename,
+            engine=engine,
+            write_frequency=write_frequency or 1,
+            named_fishing_grounds=named_fishing_grounds,
+            time_stepping=time_stepping,
+            cfl=cfl,
+            velocity=velocity,
+            sparse_jump=sparse_jump
+        )
+    else:
+        sim = Simulation(
+            mesh,
+            oil_spill_center,
+            fishing_grounds,
+            n_steps,
+            t_start,
+            t_end,
+            fps,
+            results_folder,
+            restart_file,
+            config_basename,
+            engine=engine,
+            update_mode=update_mode,
+            solution_format=solution_format,
+            checkpoint_frequency=checkpoint_frequency,
+            video_format=video_format,
+            write_frequency=write_frequency or 1,
+            render_workers=render_workers,
+            named_fishing_grounds=named_fishing_grounds,
+            zones=zones,
+            time_stepping=time_stepping,
+            cfl=cfl,
+            max_level=max_level,
+            active_threshold=active_threshold,
+            velocity=velocity,
+            sparse_jump=sparse_jump
+        )
 
-    sim.run_simulation()
+    final_oil = sim.run_simulation()
+    if ensemble:
+        final_oil = final_oil.tolist()  # Oil of each member
 
     elapsed = time.time() - start_time
     logger.info(f"Execution time for '{config_filename}': {elapsed:.2f} seconds\n")
-def test():
-    pass
+
+    return {"config": config_filename, "runtime": elapsed, "fishing_grounds_oil": final_oil, "steps": sim.steps_taken}
+
+# Meshes loaded by the current worker process, shared by the configs it runs
+_worker_meshes = {}
+
+def _run_config_in_worker(config: dict, config_filename: str) -> dict:
+    """
+    Runs one config in a worker process of the batch pool, reusing the meshes loaded by that worker.
+
+    Args:
+        config (dict): Parsed configuration dictionary.
+        config_filename (str): Name of the configuration file being used.
+
+    Returns:
+        dict: Summary of the run, see run_simulation_for_config.
+    """
+    return run_simulation_for_config(config, config_filename, _worker_meshes)
+
+def run_batch(configs_dict: dict, jobs: int = 1) -> list[dict]:
+    """
+    Runs every configuration of a batch, either one after another or in a pool of worker processes.
+
+    Each run writes its own log file and results folder. Run one after another, the batch stops
+    at the first failing config as before. In a pool, a failing config does not stop the
+    remaining ones, its error is reported in the summary instead.
+
+    Args:
+        configs_dict (dict): Validated configurations keyed by config file name.
+        jobs (int): Number of worker processes. 1 runs the configs in this process, 0 uses all CPU cores.
+
+    Returns:
+        list[dict]: Summary of each run in the order of configs_dict.
+
+    Raises:
+        Exception: The error of the first failing config when the configs run in this process.
+    """
+    if jobs == 0:
+        jobs = os.cpu_count() or 1
+
+    summaries = []
+    if jobs == 1:
+        # Each distinct mesh is loaded once and shared, every simulation keeps its own oil state
+        meshes = {}
+        for cfg_filename, cfg in configs_dict.items():
+            summaries.append(run_simulation_for_config(cfg, cfg_filename, meshes))
+        return summaries
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        futures = {
+            cfg_filename: executor.submit(_run_config_in_worker, cfg, cfg_filename)
+            for cfg_filename, cfg in configs_dict.items()
+        }
+        for cfg_filename, future in futures.items():
+            try:
+                summaries.append(future.result())
+            except Exception as e:
+                summaries.append({"config": cfg_filename, "error": str(e)})
+    return summaries
+
+def print_batch_summary(summaries: list[dict]) -> None:
+    """
+    Prints a table with the runtime, number of time steps and final oil in the fishing grounds of every run in a batch.
+
+    Args:
+        summaries (list[dict]): Summaries returned by run_batch.
+    """
+    if not summaries:
+        return
+
+    name_width = max(len("Config"), *(len(summary["config"]) for summary in summaries))
+    print(f"\n{'Config':<{name_width}}  {'Runtime [s]':>11}  {'Steps':>7}  {'Oil in fishing grounds':>22}")
+    print("-" * (name_width + 46))
+    for summary in summaries:
+        if "error" in summary:
+            print(f"{summary['config']:<{name_width}}  FAILED: {summary['error']}")
+        else:
+            print(
+                f"{summary['config']:<{name_width}}  {summary['runtime']:>11.2f}  "
+                f"{summary.get('steps', '-'):>7}  {format_fishing_grounds_oil(summary['fishing_grounds_oil']):>22}"
+            )
+
+def format_fishing_grounds_oil(oil) -> str:
+    """
+    Formats the final oil in the fishing grounds of a run for the batch summary.
+
+    Args:
+        oil: Oil of a single run, or a list with the oil of each member of an ensemble.
+
+    Returns:
+        str: The oil, or the range over the members of an ensemble.
+    """
+    if isinstance(oil, list):
+        return f"{min(oil):.4f} to {max(oil):.4f}"
+    return f"{oil:.4f}"
+
 def main() -> None:
     """
     Main entry point for the simulation script, Parses command-line arguments and runs simulations accordingly.
@@ -144,6 +316,12 @@ def main() -> None:
         default=None,
         help="Path to a single TOML configuration file (e.g., 'example.toml')."
     )
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=1,
+        help="Number of worker processes used with --find all (default: 1, 0 uses all CPU cores)."
+    )
 
     args = parser.parse_args()
 
@@ -151,8 +329,10 @@ def main() -> None:
         # Search for all configurations in the specified folder or default to current directory.
         search_folder = args.folder if args.folder else "config_files"
         configs_dict = load_all_configs_in_folder(search_folder)
-        for cfg_filename, cfg in configs_dict.items():
-            run_simulation_for_config(cfg, cfg_filename)
+
+        if args.jobs < 0:
+            parser.error("--jobs cannot be negative.")
+        print_batch_summary(run_batch(configs_dict, args.jobs))
     else:
         # Handle single configuration file scenario.
         if args.config_file:
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+import numpy as np
 import logging
 
 logger = logging.getLogger(__name__)
@@ -34,24 +35,53 @@ class Cell(ABC):
         """
         pass
 
-    @abstractmethod
-    def calculate_velocity_field(self):
+    def calculate_velocity_field(self) -> tuple[float, float]:
         """
-        Calculate the velocity field for the cell based on physical parameters.
+        Calculate the default velocity field at the cell's midpoint.
+
+        The mesh evaluates the field for all cells at once, it is only evaluated here for
+        cells of a mesh without precomputed velocities.
+
+        Returns:
+            tuple[float, float]: Velocity field vector at the midpoint.
         """
-        pass
+        velocity = self.precomputed_geometry("velocities")
+        if velocity is None:
+            from ..simulation.velocity import DEFAULT_VELOCITY
+            velocity = DEFAULT_VELOCITY.velocities(np.array([self._midpoint], dtype=float))[0]
+        self._velocity_field = tuple(velocity.tolist())
+        return self._velocity_field
 
     @abstractmethod
-    def store_neighbours_and_edges(self):
+    def store_neighbours_and_edges(self, candidates: list = None):
         """
         Populate the neighbours and edge information for the cell.
+
+        Args:
+            candidates: Cells to compare against. Defaults to all cells in the mesh.
         """
         pass
 
+    def store_cached_neighbours_and_edges(self, neighbours: list, edge_vectors: list, edge_points: list):
+        """
+        Store neighbours and edges found earlier, e.g. read from a compiled-mesh cache.
+
+        Args:
+            neighbours: Neighbouring cells, in the order store_neighbours_and_edges finds them.
+            edge_vectors: Vector of each shared edge.
+            edge_points: Start and end point of each shared edge.
+        """
+        self._neighbours = neighbours
+        self._edge_vectors = edge_vectors
+        self._edge_points = edge_points
+
     @abstractmethod
-    def store_outward_normals(self):
+    def store_outward_normals(self, normals: list = None):
         """
         Calculate and store outward-facing normal vectors for each edge of the cell.
+
+        Args:
+            normals: Precomputed outward normals, one per edge. Calculated from the edges if not given.
         """
         pass
 
@@ -65,6 +95,40 @@ class Cell(ABC):
         """
         pass
     
+    def point_coordinates(self, point_indices=None) -> list[list[float]]:
+        """
+        Get the coordinates of points of the mesh, read from the coordinate array of the mesh
+        when it has one.
+
+        Args:
+            point_indices: Indices of the points. Defaults to the points of the cell.
+
+        Returns:
+            list[list[float]]: [x, y] coordinates of each point.
+        """
+        if point_indices is None:
+            point_indices = self._points
+        coordinates = getattr(self._mesh, "point_coordinates", None)
+        if isinstance(coordinates, np.ndarray):
+            return coordinates[list(point_indices)].tolist()
+        return [[self._mesh.points[i].x, self._mesh.points[i].y] for i in point_indices]
+
+    def precomputed_geometry(self, name: str):
+        """
+        Get the value for this cell from a geometry array computed by the mesh, such as
+        "midpoints" or "areas".
+
+        Args:
+            name: Name of the mesh property holding the array.
+
+        Returns:
+            The row of the array for this cell, or None if the mesh has no such array.
+        """
+        values = getattr(self._mesh, name, None)
+        if isinstance(values, np.ndarray) and self._index < len(values):
+            return values[self._index]
+        return None
+
     @property
     def index(self):
         """Get the index of the cell."""
@@ -89,6 +153,11 @@ class Cell(ABC):
     def edge_vectors(self):
         """Get the edge vectors of the cell."""
         return self._edge_vectors
+
+    @property
+    def edge_points(self):
+        """Get the start and end points of each edge of the cell."""
+        return self._edge_points
         
     @abstractmethod
     def __str__(self):
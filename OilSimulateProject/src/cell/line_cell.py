@@ -24,18 +24,25 @@ class Line(Cell):
         """
         super().__init__(index, points, mesh)
         self._oil_amount = 0 # Line cells should always have 0 oil amount
-        self._midpoint = self.calculate_midpoint()
+        midpoint = self.precomputed_geometry("midpoints")
+        self._midpoint = tuple(midpoint.tolist()) if midpoint is not None else self.calculate_midpoint()
         self._velocity_field = self.calculate_velocity_field()
 
-    def store_neighbours_and_edges(self):
+    def store_neighbours_and_edges(self, candidates: list = None):
         """
         Populate the neighbours list for the cell based on shared points with other cells.
 
-        Compares the line cell with all other cells in the mesh to determine if they share
+        Compares the line cell with the candidate cells to determine if they share
         the required number of points to qualify as neighbours.
+
+        Args:
+            candidates: Cells to compare against, in mesh order. Defaults to all cells in the mesh.
         """
+        if candidates is None:
+            candidates = self._mesh.cells
+
         self_set = set(self._points)
-        for cell in self._mesh.cells:
+        for cell in candidates:
             point_set = set(cell.points)
             matching_points = point_set.intersection(self_set)
             if isinstance(self, Line) and isinstance(cell, Line):
@@ -47,7 +54,7 @@ class Line(Cell):
                 if len(matching_points) == 2:
                     self._neighbours.append(cell)
 
-    def store_outward_normals(self):
+    def store_outward_normals(self, normals: list = None):
         """
         The simulation does not require outward normals for Line cells.
         """
@@ -60,24 +67,12 @@ class Line(Cell):
         Returns:
             tuple[float, float]: Coordinates of the midpoint.
         """
-        point_coordinates = [self._mesh.points[i] for i in self._points]
-        x = sum(p.x for p in point_coordinates) / 2
-        y = sum(p.y for p in point_coordinates) / 2
+        point_coordinates = self.point_coordinates()
+        x = sum(p[0] for p in point_coordinates) / 2
+        y = sum(p[1] for p in point_coordinates) / 2
         self._midpoint = (x, y)
         return self._midpoint
     
-    def calculate_velocity_field(self) -> tuple[float, float]:
-        """
-        Calculate the velocity field for the cell based on its midpoint.
-
-        Returns:
-            tuple[float, float]: Velocity field vector at the midpoint.
-        """
-        x = self._midpoint[0]
-        y = self._midpoint[1]
-        self._velocity_field = (y - (0.2*x), -x)
-        return self._velocity_field
-    
     def is_boundary(self) -> bool:
         """
         Determine if the line cell is a boundary cell.
@@ -25,20 +25,30 @@ class Triangle(Cell):
             mesh: The mesh this triangle cell belongs to.
         """
         super().__init__(index, points, mesh)
-        self._midpoint = self.calculate_midpoint()
-        self._area = self.calculate_area()
+
+        # Use the geometry computed for the whole mesh when available
+        midpoint = self.precomputed_geometry("midpoints")
+        area = self.precomputed_geometry("areas")
+        self._midpoint = tuple(midpoint.tolist()) if midpoint is not None else self.calculate_midpoint()
+        self._area = float(area) if area is not None else self.calculate_area()
         self._velocity_field = self.calculate_velocity_field()
         self._outward_normals = []
 
-    def store_neighbours_and_edges(self):
+    def store_neighbours_and_edges(self, candidates: list = None):
         """
         Populate the neighbours list for the cell based on shared points with other cells.
 
-        Compares the Triangle cell with all other cells in the mesh to determine if they share
+        Compares the Triangle cell with the candidate cells to determine if they share
         the required number of points to qualify as neighbours.
+
+        Args:
+            candidates: Cells to compare against, in mesh order. Defaults to all cells in the mesh.
         """
+        if candidates is None:
+            candidates = self._mesh.cells
+
         self_set = set(self._points)
-        for cell in self._mesh.cells:
+        for cell in candidates:
             point_set = set(cell.points)
             matching_points = point_set.intersection(self_set)
             point_coordinates = [self._mesh.points[i] for i in matching_points]
@@ -58,9 +68,9 @@ class Triangle(Cell):
         Returns:
             tuple[float, float]: Coordinates of the midpoint.
         """
-        point_coordinates = [self._mesh.points[i] for i in self._points]
-        x = sum(p.x for p in point_coordinates) / 3
-        y = sum(p.y for p in point_coordinates) / 3
+        point_coordinates = self.point_coordinates()
+        x = sum(p[0] for p in point_coordinates) / 3
+        y = sum(p[1] for p in point_coordinates) / 3
         self._midpoint = (x, y)
         return self._midpoint
 
@@ -71,10 +81,7 @@ class Triangle(Cell):
         Returns:
             float: 2D area of Triangle
         """
-        point_coordinates = [self._mesh.points[i] for i in self._points]
-        x1, y1 = point_coordinates[0].x, point_coordinates[0].y
-        x2, y2 = point_coordinates[1].x, point_coordinates[1].y
-        x3, y3 = point_coordinates[2].x, point_coordinates[2].y
+        (x1, y1), (x2, y2), (x3, y3) = self.point_coordinates()
 
         self._area = 0.5 * abs(
                 (x1-x3)*(y2-y1) - (x1-x2)*(y3-y1)
@@ -97,22 +104,17 @@ class Triangle(Cell):
         self._oil_amount = math.exp(- ((midpoint[0] - oil_spill_center[0])**2 + (midpoint[1] - oil_spill_center[1])**2) / (0.01))
         return self._oil_amount
 
-    def calculate_velocity_field(self) -> tuple[float, float]:
+    def store_outward_normals(self, normals: list = None):
         """
-        Calculate the velocity field for the cell based on its midpoint.
+        Calculate and store outward normal vectors for each triangle edge.
 
-        Returns:
-            tuple[float, float]: Velocity field vector at the midpoint.
+        Args:
+            normals: Precomputed outward normals, one per edge. Calculated from the edges if not given.
         """
-        x = self._midpoint[0]
-        y = self._midpoint[1]
-        self._velocity_field = (y - (0.2*x), -x)
-        return self._velocity_field
+        if normals is not None:
+            self._outward_normals = [np.asarray(normal, dtype=float) for normal in normals]
+            return
 
-    def store_outward_normals(self):
-        """
-        Calculate and store outward normal vectors for each triangle edge.
-        """
         for i, edge in enumerate(self._edge_vectors):
             perp_vector = np.array([-edge[1], edge[0]])
             normal = perp_vector / np.linalg.norm(perp_vector)
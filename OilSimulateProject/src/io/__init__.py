@@ -3,4 +3,6 @@ from .config_reader import (
     load_single_config_file,
     load_all_configs_in_folder
 )
-from .solution_reader import initialize_oil_spill
\ No newline at end of file
+from .solution_reader import initialize_oil_spill, read_oil_amounts, read_solution_metadata
+from .checkpoint_store import CheckpointWriter, CheckpointStore
+from .zone_series import ZoneSeriesWriter, read_zone_series
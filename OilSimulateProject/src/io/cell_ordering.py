@@ -0,0 +1,151 @@
+import numpy as np
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Supported cell orderings of Mesh, besides keeping the order of the mesh file
+CELL_ORDERINGS = ("rcm", "morton")
+
+def compute_cell_order(ordering: str, midpoints: np.ndarray, connectivity_blocks: list) -> np.ndarray:
+    """
+    Computes a new order of the cells that places neighbouring cells close together in memory.
+
+    Args:
+        ordering (str): "rcm" (reverse Cuthill-McKee on the cell adjacency) or "morton"
+            (Z-order curve through the cell midpoints).
+        midpoints (np.ndarray): Midpoint of each cell in file order, shape (n_cells, 2).
+        connectivity_blocks (list): Point indices of the cells, one (n_cells, n_points) block per
+            cell type, in file order.
+
+    Returns:
+        np.ndarray: Index in the mesh file of each cell in the new order.
+
+    Raises:
+        ValueError: If the ordering is not supported.
+    """
+    if ordering == "rcm":
+        return rcm_order(connectivity_blocks)
+    if ordering == "morton":
+        return morton_order(midpoints)
+    raise ValueError(f"Unknown cell ordering: {ordering}. Supported orderings are: {list(CELL_ORDERINGS)}")
+
+def morton_order(midpoints: np.ndarray) -> np.ndarray:
+    """
+    Orders the cells along a Z-order (Morton) curve through their midpoints.
+
+    The midpoints are quantized to 16 bits per axis and the bits of x and y are interleaved,
+    so sorting by the resulting key visits the domain block by block.
+
+    Args:
+        midpoints (np.ndarray): Midpoint of each cell, shape (n_cells, 2).
+
+    Returns:
+        np.ndarray: Cell indices in Morton order.
+    """
+    midpoints = np.asarray(midpoints, dtype=float).reshape(-1, 2)
+    if len(midpoints) == 0:
+        return np.empty(0, dtype=np.int64)
+    lower = midpoints.min(axis=0)
+    extent = max(float((midpoints.max(axis=0) - lower).max()), np.finfo(float).tiny)
+    quantized = ((midpoints - lower) / extent * 0xFFFF).astype(np.uint64)
+
+    def spread_bits(values):
+        # Moves bit i of a 16-bit value to bit 2i
+        for shift, mask in ((8, 0x00FF00FF), (4, 0x0F0F0F0F), (2, 0x33333333), (1, 0x55555555)):
+            values = (values | (values << np.uint64(shift))) & np.uint64(mask)
+        return values
+
+    keys = spread_bits(quantized[:, 0]) | (spread_bits(quantized[:, 1]) << np.uint64(1))
+    return np.argsort(keys, kind="stable")
+
+def rcm_order(connectivity_blocks: list) -> np.ndarray:
+    """
+    Orders the cells with the reverse Cuthill-McKee algorithm on the graph of cells sharing an edge,
+    which keeps the indices of neighbouring cells close together.
+
+    Args:
+        connectivity_blocks (list): Point indices of the cells, one (n_cells, n_points) block per
+            cell type, in file order.
+
+    Returns:
+        np.ndarray: Cell indices in reverse Cuthill-McKee order.
+    """
+    from scipy import sparse
+    from scipy.sparse.csgraph import reverse_cuthill_mckee
+
+    # Every edge of a cell as a (smaller point, larger point) pair, lines are a single edge
+    edge_cells = []
+    edge_points = []
+    offset = 0
+    for data in connectivity_blocks:
+        data = np.asarray(data, dtype=np.int64).reshape(len(data), -1)
+        corners = data.shape[1]
+        ends = np.roll(data, -1, axis=1) if corners > 2 else data[:, ::-1]
+        pairs = np.stack([data, ends], axis=2)[:, :corners if corners > 2 else 1]
+        edge_points.append(np.sort(pairs, axis=2).reshape(-1, 2))
+        edge_cells.append(np.repeat(np.arange(offset, offset + len(data)), pairs.shape[1]))
+        offset += len(data)
+
+    n_cells = offset
+    if n_cells == 0:
+        return np.arange(n_cells)
+    edge_cells = np.concatenate(edge_cells)
+    edge_points = np.concatenate(edge_points)
+    edge_ids = edge_points[:, 0] * (edge_points.max() + 1) + edge_points[:, 1]
+
+    # Cells sharing an edge are adjacent, found as consecutive entries after sorting by edge
+    order = np.argsort(edge_ids, kind="stable")
+    same_edge = edge_ids[order][1:] == edge_ids[order][:-1]
+    first, second = edge_cells[order][:-1][same_edge], edge_cells[order][1:][same_edge]
+    adjacency = sparse.csr_matrix(
+        (np.ones(2 * len(first)), (np.concatenate([first, second]), np.concatenate([second, first]))),
+        shape=(n_cells, n_cells))
+    return np.asarray(reverse_cuthill_mckee(adjacency, symmetric_mode=True), dtype=np.int64)
+
+def mesh_cell_order(mesh):
+    """
+    Gets the permutation of a reordered mesh.
+
+    Args:
+        mesh: The computational mesh.
+
+    Returns:
+        np.ndarray | None: Index in the mesh file of each cell, None if the cells keep the file order.
+    """
+    cell_order = getattr(mesh, "cell_order", None)
+    return cell_order if isinstance(cell_order, np.ndarray) else None
+
+def to_original_order(mesh, values):
+    """
+    Reorders per-cell values from the cell order of the mesh to the order of the mesh file.
+
+    Args:
+        mesh: The computational mesh.
+        values: One value per cell, indexed by cell index.
+
+    Returns:
+        The values indexed by the cell number in the mesh file, unchanged if the mesh is not reordered.
+    """
+    cell_order = mesh_cell_order(mesh)
+    if cell_order is None:
+        return values
+    values = np.asarray(values)
+    original = np.empty_like(values)
+    original[cell_order] = values
+    return original
+
+def from_original_order(mesh, values):
+    """
+    Reorders per-cell values from the order of the mesh file to the cell order of the mesh.
+
+    Args:
+        mesh: The computational mesh.
+        values: One value per cell, indexed by the cell number in the mesh file.
+
+    Returns:
+        The values indexed by cell index, unchanged if the mesh is not reordered.
+    """
+    cell_order = mesh_cell_order(mesh)
+    if cell_order is None:
+        return values
+    return np.asarray(values)[cell_order]
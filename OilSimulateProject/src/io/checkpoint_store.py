@@ -0,0 +1,189 @@
+import glob
+import os
+import numpy as np
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Number of oil states gathered in memory before they are written as one chunk
+DEFAULT_CHUNK_SIZE = 16
+
+INDEX_FILE = "index.txt"
+CHUNK_PATTERN = "chunk_{:06d}.npy"
+
+class CheckpointWriter:
+    """
+    Streams oil states to a checkpoint directory during a simulation.
+
+    States are gathered in a buffer of one chunk and written as one .npy file per chunk,
+    so at most one chunk of the history is held in memory. Every written state gets a line
+    in an append-only index with its step, time, chunk and row.
+
+    Attributes:
+        _directory (str): Directory holding the chunks and the index.
+        _n_cells (int): Number of cells in each oil state.
+        _chunk_size (int): Number of states per chunk.
+        _buffer (np.ndarray): States of the chunk currently being filled.
+        _buffered_entries (list): Step and time of each buffered state.
+        _chunk_id (int): Number of the chunk currently being filled.
+    """
+    def __init__(self, directory: str, n_cells: int, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Creates the checkpoint directory, removing checkpoints of an earlier run.
+
+        Args:
+            directory (str): Directory to write the checkpoints to.
+            n_cells (int): Number of cells in each oil state.
+            chunk_size (int): Number of states per chunk.
+
+        Raises:
+            ValueError: If the chunk size is not positive.
+        """
+        if chunk_size < 1:
+            raise ValueError("Checkpoint chunk size must be at least 1.")
+
+        self._directory = directory
+        self._n_cells = n_cells
+        self._chunk_size = chunk_size
+        self._buffer = np.empty((chunk_size, n_cells))
+        self._buffered_entries = []
+        self._chunk_id = 0
+
+        os.makedirs(directory, exist_ok=True)
+        for old_chunk in glob.glob(os.path.join(directory, "chunk_*.npy")):
+            os.remove(old_chunk)
+        with open(os.path.join(directory, INDEX_FILE), "w") as index:
+            index.write("# step time chunk row\n")
+
+    def append(self, step: int, time_val: float, oil_amounts: np.ndarray) -> None:
+        """
+        Adds an oil state to the history, writing the chunk once it is full.
+
+        Args:
+            step (int): Simulation step of the state.
+            time_val (float): Simulation time of the state.
+            oil_amounts (np.ndarray): Oil amount of each cell.
+        """
+        self._buffer[len(self._buffered_entries)] = oil_amounts
+        self._buffered_entries.append((step, time_val))
+        if len(self._buffered_entries) == self._chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """
+        Writes the buffered states as one chunk and appends them to the index.
+        """
+        if not self._buffered_entries:
+            return
+
+        chunk_file = CHUNK_PATTERN.format(self._chunk_id)
+        np.save(os.path.join(self._directory, chunk_file), self._buffer[:len(self._buffered_entries)])
+
+        # The index is only extended once the chunk it refers to is complete
+        with open(os.path.join(self._directory, INDEX_FILE), "a") as index:
+            for row, (step, time_val) in enumerate(self._buffered_entries):
+                index.write(f"{step} {float(time_val)!r} {self._chunk_id} {row}\n")
+
+        self._buffered_entries = []
+        self._chunk_id += 1
+
+    def close(self) -> None:
+        """
+        Writes the last, possibly partial, chunk.
+        """
+        self.flush()
+        logger.info(f"Checkpoints written to: {self._directory}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+class CheckpointStore:
+    """
+    Random access to the oil states in a checkpoint directory written by CheckpointWriter.
+
+    Chunks are memory mapped, so reading a state only loads that state from disk.
+
+    Attributes:
+        _directory (str): Directory holding the chunks and the index.
+        _steps (np.ndarray): Step of each saved state.
+        _times (np.ndarray): Time of each saved state.
+        _chunks (np.ndarray): Chunk holding each saved state.
+        _rows (np.ndarray): Row of each saved state within its chunk.
+    """
+    def __init__(self, directory: str):
+        """
+        Reads the index of a checkpoint directory.
+
+        Args:
+            directory (str): Directory holding the checkpoints.
+
+        Raises:
+            FileNotFoundError: If the directory has no checkpoint index.
+        """
+        index_file = os.path.join(directory, INDEX_FILE)
+        if not os.path.isfile(index_file):
+            raise FileNotFoundError(f"No checkpoint index found in: {directory}")
+
+        self._directory = directory
+        index = np.loadtxt(index_file, ndmin=2).reshape(-1, 4)
+        self._steps = index[:, 0].astype(np.int64)
+        self._times = index[:, 1]
+        self._chunks = index[:, 2].astype(np.int64)
+        self._rows = index[:, 3].astype(np.int64)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of saved states.
+
+        Returns:
+            int: Number of saved states.
+        """
+        return len(self._steps)
+
+    def read(self, i: int) -> np.ndarray:
+        """
+        Reads one saved state.
+
+        Args:
+            i (int): Position of the state in the index.
+
+        Returns:
+            np.ndarray: Oil amount of each cell.
+        """
+        chunk_file = os.path.join(self._directory, CHUNK_PATTERN.format(self._chunks[i]))
+        chunk = np.load(chunk_file, mmap_mode="r")
+        return np.array(chunk[self._rows[i]])
+
+    def oil_at_time(self, time_val: float) -> np.ndarray:
+        """
+        Reads the state saved at the given time.
+
+        Args:
+            time_val (float): Simulation time of the state.
+
+        Returns:
+            np.ndarray: Oil amount of each cell.
+
+        Raises:
+            ValueError: If no state was saved at that time.
+        """
+        matches = np.flatnonzero(np.isclose(self._times, time_val, rtol=0.0, atol=1e-9))
+        if len(matches) == 0:
+            raise ValueError(
+                f"No checkpoint saved at t = {time_val} in {self._directory}. "
+                f"Saved times are: {self._times.tolist()}"
+            )
+        return self.read(matches[-1])
+
+    @property
+    def steps(self) -> np.ndarray:
+        """Get the step of each saved state."""
+        return self._steps
+
+    @property
+    def times(self) -> np.ndarray:
+        """Get the time of each saved state."""
+        return self._times
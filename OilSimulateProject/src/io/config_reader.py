@@ -2,6 +2,8 @@ import os
 import tomllib
 import logging
 from typing import Dict
+from ..simulation.engine_options import (
+    ENGINES, UPDATE_MODES, TIME_STEPPINGS, SPARSE_JUMPS, default_engine, validate_engine_options)
 
 logger = logging.getLogger(__name__)
 
@@ -9,9 +11,42 @@ logger = logging.getLogger(__name__)
 REQUIRED_TOP_LEVEL_KEYS = ["settings", "geometry"]
 
 # Required keys
-REQUIRED_SETTINGS_KEYS = ["nSteps", "tEnd"]  # tStart required if restart file is provided
+REQUIRED_SETTINGS_KEYS = ["nSteps", "tEnd"]  # tStart required if restart file is provided, nSteps not with adaptive or local time stepping
 REQUIRED_GEOMETRY_KEYS = ["meshName", "oilSpillCenter", "borders"]
 
+# Supported values for optional 'settings.engine'
+SUPPORTED_ENGINES = list(ENGINES)
+
+# Supported values for optional 'settings.sparseJump'
+SUPPORTED_SPARSE_JUMPS = list(SPARSE_JUMPS)
+
+# Supported values for optional 'settings.updateMode'
+SUPPORTED_UPDATE_MODES = list(UPDATE_MODES)
+
+# Supported values for optional 'settings.timeStepping'
+SUPPORTED_TIME_STEPPINGS = list(TIME_STEPPINGS)
+
+# Fraction of the largest stable time step taken if 'settings.cfl' is not provided
+DEFAULT_CFL = 0.9
+
+# Highest sub-cycling level of local time stepping if 'settings.maxLevel' is not provided
+DEFAULT_MAX_LEVEL = 3
+
+# Supported values for optional 'velocity.type'
+SUPPORTED_VELOCITY_TYPES = ["analytic", "gridded", "snapshots"]
+
+# Supported values for optional 'IO.cellOrdering'
+SUPPORTED_CELL_ORDERINGS = ["rcm", "morton"]
+
+# Supported values for optional 'IO.solutionFormat'
+SUPPORTED_SOLUTION_FORMATS = ["text", "binary"]
+
+# Playback speed of the animation if 'IO.fps' is not provided
+DEFAULT_FPS = 10
+
+# Supported values for optional 'IO.videoFormat'
+SUPPORTED_VIDEO_FORMATS = ["gif", "mp4", "webm"]
+
 def read_toml_file(filepath: str) -> Dict:
     """
     Reads a TOML file and returns its contents as a dictionary.
@@ -38,6 +73,55 @@ def read_toml_file(filepath: str) -> Dict:
     logger.debug(f"Successfully read TOML file: {filepath}")
     return config
 
+def is_rectangle(bounds) -> bool:
+    """
+    Checks if a value describes an axis-aligned rectangle as [[x_min, x_max], [y_min, y_max]].
+
+    Args:
+        bounds: Value read from the TOML file.
+
+    Returns:
+        bool: True if the value is two pairs of numbers, each with the minimum first.
+    """
+    if not isinstance(bounds, list) or len(bounds) != 2:
+        return False
+    for pair in bounds:
+        if not isinstance(pair, list) or len(pair) != 2:
+            return False
+        if not all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in pair) or pair[0] > pair[1]:
+            return False
+    return True
+
+def is_polygon(vertices) -> bool:
+    """
+    Checks if a value describes a polygon as a list of at least three [x, y] vertices.
+
+    Args:
+        vertices: Value read from the TOML file.
+
+    Returns:
+        bool: True if the value is at least three pairs of numbers.
+    """
+    if not isinstance(vertices, list) or len(vertices) < 3:
+        return False
+    return all(
+        isinstance(vertex, list) and len(vertex) == 2 and
+        all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in vertex)
+        for vertex in vertices
+    )
+
+def is_ensemble(oil_spill_center) -> bool:
+    """
+    Checks if 'geometry.oilSpillCenter' lists one center per ensemble member instead of a single center.
+
+    Args:
+        oil_spill_center: Value read from the TOML file.
+
+    Returns:
+        bool: True if the value is a list of lists.
+    """
+    return isinstance(oil_spill_center, list) and any(isinstance(center, list) for center in oil_spill_center)
+
 def validate_and_fill_defaults(config: Dict, filepath: str) -> Dict:
     """
     Validates the configuration dictionary against required keys and sections.
@@ -60,22 +144,176 @@ def validate_and_fill_defaults(config: Dict, filepath: str) -> Dict:
 
     # Validate and handle 'settings' section
     settings = config["settings"]
+
+    # Set default value for optional key 'timeStepping', adaptive time stepping chooses the number of steps
+    settings.setdefault("timeStepping", "fixed")
+    if settings["timeStepping"] not in SUPPORTED_TIME_STEPPINGS:
+        raise ValueError(
+            f"Unknown 'settings.timeStepping' = '{settings['timeStepping']}' in {filepath}. "
+            f"Supported time steppings are: {SUPPORTED_TIME_STEPPINGS}"
+        )
+    settings.setdefault("cfl", DEFAULT_CFL)
+    if not isinstance(settings["cfl"], (int, float)) or not 0 < settings["cfl"] <= 1:
+        raise ValueError(f"'settings.cfl' in {filepath} must be a number in (0, 1].")
+    settings.setdefault("maxLevel", DEFAULT_MAX_LEVEL)
+    if not isinstance(settings["maxLevel"], int) or settings["maxLevel"] < 0:
+        raise ValueError(f"'settings.maxLevel' in {filepath} must be a non-negative integer.")
+
     for key in REQUIRED_SETTINGS_KEYS:
+        if key == "nSteps" and settings["timeStepping"] != "fixed":
+            continue
         if key not in settings:
             raise ValueError(f"Missing required 'settings.{key}' in {filepath}.")
 
     # Set default value for optional key 'tStart'
     settings.setdefault("tStart", 0)
 
+    # Set default value for optional key 'engine', local time stepping needs the face data of the vectorized engine
+    if "engine" not in settings:
+        settings["engine"] = default_engine(settings["timeStepping"])
+        if settings["timeStepping"] == "local":
+            logger.info(f"Config {filepath} uses local time stepping, the engine defaults to '{settings['engine']}'.")
+    if settings["engine"] not in SUPPORTED_ENGINES:
+        raise ValueError(
+            f"Unknown 'settings.engine' = '{settings['engine']}' in {filepath}. "
+            f"Supported engines are: {SUPPORTED_ENGINES}"
+        )
+
+    # Optional key 'updateMode', its default depends on the engine and is set with the engine options below
+    if "updateMode" in settings and settings["updateMode"] not in SUPPORTED_UPDATE_MODES:
+        raise ValueError(
+            f"Unknown 'settings.updateMode' = '{settings['updateMode']}' in {filepath}. "
+            f"Supported update modes are: {SUPPORTED_UPDATE_MODES}"
+        )
+
+    # Set default value for optional key 'sparseJump', how the sparse engine applies the steps between outputs
+    settings.setdefault("sparseJump", "matvec")
+    if settings["sparseJump"] not in SUPPORTED_SPARSE_JUMPS:
+        raise ValueError(
+            f"Unknown 'settings.sparseJump' = '{settings['sparseJump']}' in {filepath}. "
+            f"Supported sparse jumps are: {SUPPORTED_SPARSE_JUMPS}"
+        )
+
+    # Optional key 'activeThreshold', only faces touching cells with more oil are evaluated
+    active_threshold = settings.get("activeThreshold")
+    if active_threshold is not None and (not isinstance(active_threshold, (int, float)) or active_threshold < 0):
+        raise ValueError(f"'settings.activeThreshold' in {filepath} must be a non-negative number.")
+
     # Validate 'geometry' section
     geometry = config["geometry"]
     for key in REQUIRED_GEOMETRY_KEYS:
         if key not in geometry:
             raise ValueError(f"Missing required 'geometry.{key}' in {filepath}.")
 
+    # The combinations of engine, update mode and time stepping follow the rules of the simulation
+    try:
+        settings["updateMode"] = validate_engine_options(
+            settings["engine"], settings.get("updateMode"), settings["timeStepping"], settings["sparseJump"],
+            active_threshold, is_ensemble(geometry["oilSpillCenter"]),
+            config.get("IO", {}).get("cellOrdering") is not None)
+    except ValueError as e:
+        raise ValueError(f"Config {filepath} has incompatible settings: {e}") from e
+
+    # A list of [x, y] centers runs an ensemble with one member per center
+    if is_ensemble(geometry["oilSpillCenter"]):
+        centers = geometry["oilSpillCenter"]
+        if not all(
+            isinstance(center, list) and len(center) == 2 and
+            all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in center)
+            for center in centers
+        ):
+            raise ValueError(f"'geometry.oilSpillCenter' in {filepath} must be [x, y] or a list of [x, y] centers.")
+        unsupported = [
+            key for key, used in (
+                ("settings.activeThreshold", "activeThreshold" in settings),
+                ("geometry.zones", "zones" in geometry),
+                ("IO.restartFile", "restartFile" in config.get("IO", {})),
+                ("IO.checkpointFrequency", "checkpointFrequency" in config.get("IO", {})),
+            ) if used
+        ]
+        if unsupported:
+            raise ValueError(f"Config {filepath} runs an ensemble, which cannot be used with {', '.join(unsupported)}.")
+
+    # Optional 'fishingGrounds' table of named rectangles [[x_min, x_max], [y_min, y_max]]
+    fishing_grounds = geometry.get("fishingGrounds", {})
+    if not isinstance(fishing_grounds, dict):
+        raise ValueError(f"'geometry.fishingGrounds' in {filepath} must be a table of named rectangles.")
+    for name, bounds in fishing_grounds.items():
+        if name == "borders":
+            raise ValueError(f"'geometry.fishingGrounds' in {filepath} cannot use the reserved name 'borders'.")
+        if not is_rectangle(bounds):
+            raise ValueError(
+                f"'geometry.fishingGrounds.{name}' in {filepath} must be [[x_min, x_max], [y_min, y_max]]."
+            )
+
+    # Optional 'zones' table of named polygons [[x, y], ...]
+    zones = geometry.get("zones", {})
+    if not isinstance(zones, dict):
+        raise ValueError(f"'geometry.zones' in {filepath} must be a table of named polygons.")
+    for name, vertices in zones.items():
+        if not is_polygon(vertices):
+            raise ValueError(
+                f"'geometry.zones.{name}' in {filepath} must be a list of at least three [x, y] vertices."
+            )
+
+    # Validate optional 'velocity' section, the cells use the default velocity field without it
+    velocity = config.get("velocity")
+    if velocity is not None:
+        velocity.setdefault("type", "analytic")
+        if velocity["type"] not in SUPPORTED_VELOCITY_TYPES:
+            raise ValueError(
+                f"Unknown 'velocity.type' = '{velocity['type']}' in {filepath}. "
+                f"Supported velocity types are: {SUPPORTED_VELOCITY_TYPES}"
+            )
+        if velocity["type"] == "analytic":
+            for key in ("u", "v"):
+                if key in velocity and not isinstance(velocity[key], (str, int, float)):
+                    raise ValueError(f"'velocity.{key}' in {filepath} must be an expression in x, y and t.")
+        elif not isinstance(velocity.get("file"), str):
+            raise ValueError(f"Config {filepath} uses a '{velocity['type']}' velocity, which requires 'velocity.file'.")
+        if velocity["type"] in ("analytic", "snapshots"):
+            refresh_interval = velocity.get("refreshInterval")
+            if refresh_interval is not None and (not isinstance(refresh_interval, (int, float)) or refresh_interval <= 0):
+                raise ValueError(f"'velocity.refreshInterval' in {filepath} must be a positive number.")
+
     # Handle optional 'IO' section and set default values
     io_section = config.setdefault("IO", {})
     io_section.setdefault("logName", "logfile")
+    io_section.setdefault("meshCache", True)
+    # Optional key 'cellOrdering', the cells keep the order of the mesh file if it is not provided
+    cell_ordering = io_section.get("cellOrdering")
+    if cell_ordering is not None and cell_ordering not in SUPPORTED_CELL_ORDERINGS:
+        raise ValueError(
+            f"Unknown 'IO.cellOrdering' = '{cell_ordering}' in {filepath}. "
+            f"Supported cell orderings are: {SUPPORTED_CELL_ORDERINGS}"
+        )
+    io_section.setdefault("solutionFormat", "text")
+    if io_section["solutionFormat"] not in SUPPORTED_SOLUTION_FORMATS:
+        raise ValueError(
+            f"Unknown 'IO.solutionFormat' = '{io_section['solutionFormat']}' in {filepath}. "
+            f"Supported solution formats are: {SUPPORTED_SOLUTION_FORMATS}"
+        )
+    # 'writeFrequency' is the number of steps between frames, 'fps' the playback speed of the animation
+    write_frequency = io_section.get("writeFrequency")
+    if write_frequency is not None and (not isinstance(write_frequency, int) or write_frequency < 1):
+        raise ValueError(f"'IO.writeFrequency' in {filepath} must be a positive integer.")
+    io_section.setdefault("fps", DEFAULT_FPS)
+    if not isinstance(io_section["fps"], (int, float)) or io_section["fps"] <= 0:
+        raise ValueError(f"'IO.fps' in {filepath} must be a positive number.")
+
+    io_section.setdefault("renderWorkers", 0)
+    if not isinstance(io_section["renderWorkers"], int) or io_section["renderWorkers"] < 0:
+        raise ValueError(f"'IO.renderWorkers' in {filepath} must be a non-negative integer.")
+
+    io_section.setdefault("videoFormat", "gif")
+    if io_section["videoFormat"] not in SUPPORTED_VIDEO_FORMATS:
+        raise ValueError(
+            f"Unknown 'IO.videoFormat' = '{io_section['videoFormat']}' in {filepath}. "
+            f"Supported video formats are: {SUPPORTED_VIDEO_FORMATS}"
+        )
+    checkpoint_frequency = io_section.get("checkpointFrequency")
+    if checkpoint_frequency is not None and (not isinstance(checkpoint_frequency, int) or checkpoint_frequency < 1):
+        raise ValueError(f"'IO.checkpointFrequency' in {filepath} must be a positive integer.")
 
     # Check consistency between 'restartFile' and 'tStart'
     restart_file = io_section.get("restartFile")
@@ -0,0 +1,145 @@
+import hashlib
+import os
+import zipfile
+import numpy as np
+from ..cell.line_cell import Line
+from ..cell.triangle_cell import Triangle
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Bump when the layout of the cache file changes, older caches are then rebuilt
+CACHE_VERSION = 2
+
+# Cell types stored in the cache, the code of a cell is its position in this tuple
+CACHE_CELL_TYPES = ("line", "triangle")
+
+# Code of every cached cell class, subclasses are stored with the code of their base class
+CACHE_CELL_CODES = {Line: 0, Triangle: 1}
+
+def mesh_file_hash(file_name: str) -> str:
+    """
+    Computes the SHA-256 hash of the content of a mesh file.
+
+    Args:
+        file_name (str): Path to the mesh file.
+
+    Returns:
+        str: Hexadecimal digest of the file content.
+    """
+    digest = hashlib.sha256()
+    with open(file_name, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def cache_file_for(file_name: str, cell_ordering: str = None) -> str:
+    """
+    Returns the path of the compiled-mesh cache stored next to a mesh file.
+
+    Args:
+        file_name (str): Path to the mesh file.
+        cell_ordering (str): Cell ordering of the mesh, each ordering has its own cache.
+
+    Returns:
+        str: Path to the cache file.
+    """
+    if cell_ordering is not None:
+        return f"{file_name}.{cell_ordering}.cache.npz"
+    return f"{file_name}.cache.npz"
+
+def cache_cell_code(cell) -> int:
+    """
+    Gets the code under which a cell is stored in the cache.
+
+    Args:
+        cell: A cell of the mesh.
+
+    Returns:
+        int: Position of the cell type in CACHE_CELL_TYPES.
+
+    Raises:
+        ValueError: If the cell is not an instance of a cached cell class.
+    """
+    for cell_class, code in CACHE_CELL_CODES.items():
+        if isinstance(cell, cell_class):
+            return code
+    raise ValueError(f"Cells of type {type(cell).__name__} cannot be stored in the mesh cache.")
+
+def save_mesh_cache(mesh, cache_file: str, mesh_hash: str) -> None:
+    """
+    Writes the points, cells, neighbour tables, faces and geometry of a mesh to a binary cache file.
+
+    Ragged data (cell connectivity and neighbours) is padded with -1. The faces are stored in
+    the face order of the mesh with their owner, neighbour, edge vector, edge points and outward
+    normal. The permutation of a renumbered mesh is stored as cell_order.
+
+    Args:
+        mesh: The mesh to store.
+        cache_file (str): Path to the cache file.
+        mesh_hash (str): Hash of the mesh file the mesh was read from.
+    """
+    cells = mesh.cells
+    n_cells = len(cells)
+    max_points = max((len(cell.points) for cell in cells), default=0)
+    max_neighbours = max((len(cell.neighbours) for cell in cells), default=0)
+
+    connectivity = np.full((n_cells, max_points), -1, dtype=np.int64)
+    neighbours = np.full((n_cells, max_neighbours), -1, dtype=np.int64)
+    cell_types = np.empty(n_cells, dtype=np.int8)
+    edge_points = []
+
+    for i, cell in enumerate(cells):
+        cell_types[i] = cache_cell_code(cell)
+        connectivity[i, :len(cell.points)] = cell.points
+        neighbours[i, :len(cell.neighbours)] = [ngh.index for ngh in cell.neighbours]
+        edge_points.extend([[p.x, p.y] for p in face_points] for face_points in cell.edge_points)
+
+    arrays = dict(
+        version=np.array(CACHE_VERSION),
+        mesh_hash=np.array(mesh_hash),
+        points=mesh.point_coordinates,
+        cell_types=cell_types,
+        connectivity=connectivity,
+        neighbours=neighbours,
+        midpoints=mesh.midpoints,
+        areas=mesh.areas,
+        face_owners=mesh.face_owners,
+        face_neighbours=mesh.face_neighbours,
+        face_edge_vectors=mesh.face_edge_vectors,
+        face_edge_points=np.array(edge_points, dtype=float).reshape(-1, 2, 2),
+        face_normals=mesh.face_normals
+    )
+    if getattr(mesh, "cell_order", None) is not None:
+        arrays["cell_order"] = mesh.cell_order
+
+    # Write to a temporary file first, so concurrent runs never read a half-written cache
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    with open(tmp_file, "wb") as f:
+        np.savez(f, **arrays)
+    os.replace(tmp_file, cache_file)
+    logger.info(f"Compiled mesh cache written to: {cache_file}")
+
+def load_mesh_cache(cache_file: str, mesh_hash: str) -> dict | None:
+    """
+    Loads a compiled-mesh cache if it exists and belongs to the given mesh file content.
+
+    Args:
+        cache_file (str): Path to the cache file.
+        mesh_hash (str): Hash of the current mesh file.
+
+    Returns:
+        dict | None: The cached arrays, or None if the cache is missing, outdated or unreadable.
+    """
+    if not os.path.isfile(cache_file):
+        return None
+
+    try:
+        with np.load(cache_file) as data:
+            if int(data["version"]) != CACHE_VERSION or str(data["mesh_hash"]) != mesh_hash:
+                logger.info(f"Compiled mesh cache {cache_file} is outdated and will be rebuilt.")
+                return None
+            return {key: data[key] for key in data.files}
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile) as e:
+        logger.warning(f"Ignoring unreadable compiled mesh cache {cache_file}: {e}")
+        return None
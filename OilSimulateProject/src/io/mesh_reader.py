@@ -1,5 +1,17 @@
 import meshio
+import numpy as np
+from collections import defaultdict
+from collections.abc import Sequence
+from itertools import combinations
 from ..cell.base_cell import CellFactory
+from .mesh_cache import (
+    mesh_file_hash,
+    cache_file_for,
+    save_mesh_cache,
+    load_mesh_cache,
+    CACHE_CELL_TYPES
+)
+from .cell_ordering import compute_cell_order
 import logging
 
 # Configure logging for this module
@@ -11,53 +23,191 @@ class Mesh:
 
     Attributes:
         _file_name (str): Path to the mesh file.
-        _points (list[Point]): List of 2D points in the mesh.
+        _coordinates (np.ndarray): Coordinates of the 2D points in the mesh, shape (n_points, 2).
+        _points (PointList): Point views over the coordinates, for code using .x and .y.
         _cells (list): List of cells in the mesh, created using the CellFactory.
+        _midpoints (np.ndarray): Midpoint of each cell, shape (n_cells, 2).
+        _areas (np.ndarray): Area of each cell, NaN for cells without an area.
+        _velocities (np.ndarray): Default velocity field at each cell midpoint, shape (n_cells, 2).
+        _face_owners (np.ndarray): Index of the cell each edge (face) belongs to, shape (n_faces,).
+        _face_neighbours (np.ndarray): Index of the neighbouring cell across each face, shape (n_faces,).
+        _face_edge_vectors (np.ndarray): Edge vector of each face, shape (n_faces, 2).
+        _face_normals (np.ndarray): Unit outward normal of each face, shape (n_faces, 2).
+        _cell_order (np.ndarray): Index in the mesh file of each cell, None if the cells keep the file order.
     """
 
-    def __init__(self, file_name: str):
+    def __init__(self, file_name: str, use_cache: bool = False, cell_ordering: str = None):
         """
         Initializes the Mesh object by reading points and cells from the file.
 
         Args:
             file_name (str): Path to the mesh file.
+            use_cache (bool): Load the mesh from a compiled cache next to the mesh file if one exists
+                for the current file content, and write the cache otherwise.
+            cell_ordering (str): Renumber the cells for memory locality, "rcm" or "morton". The cells
+                keep the order of the mesh file if None. See cell_order for the permutation.
         """
         self._file_name = file_name
+        self._cell_order = None
+
+        cached = None
+        if use_cache:
+            mesh_hash = mesh_file_hash(file_name)
+            cache_file = cache_file_for(file_name, cell_ordering)
+            cached = load_mesh_cache(cache_file, mesh_hash)
+
+        if cached is not None:
+            logger.info(f"Loading compiled mesh from cache: {cache_file}")
+            self.load_from_cache(cached)
+            return
+
         logger.info(f"Reading mesh from: {file_name}")
         msh = meshio.read(file_name)
 
         # Read points from the mesh file (assuming 2D points only)
-        self._points = [Point(*point[:2]) for point in msh.points]
-
-        # Read cells and create corresponding cell objects
-        self._cells = []
-        create_cell = CellFactory()
-        index = 0
+        self._coordinates = np.ascontiguousarray(np.asarray(msh.points, dtype=float)[:, :2])
+        self._points = PointList(self._coordinates)
 
+        supported_blocks = [block for block in msh.cells if block.type in ("line", "triangle")]
         for block in msh.cells:
-            if block.type in ("line", "triangle"):
-                for cell_points in block.data:
-                    cell_obj = create_cell(cell_points, block.type, index, self)
-                    self._cells.append(cell_obj)
-                    index += 1
-            else:
+            if block.type not in ("line", "triangle"):
                 # Skipping unsupported cell types (e.g., higher-dimensional cells)
                 logger.debug(f"Skipping unsupported cell type: {block.type}")
 
+        # Cell geometry is computed for all cells at once, the cells read their values from these arrays
+        self.compute_cell_geometry([block.data for block in supported_blocks])
+
+        # Cells in file order, renumbered before the cell objects are created
+        cell_types = [block.type for block in supported_blocks for _ in range(len(block.data))]
+        cell_points = [cell_points for block in supported_blocks for cell_points in block.data]
+        if cell_ordering is not None:
+            self.reorder_cells(compute_cell_order(
+                cell_ordering, self._midpoints, [block.data for block in supported_blocks]))
+            cell_types = [cell_types[i] for i in self._cell_order]
+            cell_points = [cell_points[i] for i in self._cell_order]
+            logger.info(f"Cells of {file_name} renumbered in {cell_ordering} order")
+
+        # Create the cell objects
+        self._cells = []
+        create_cell = CellFactory()
+        for index, (cell_type, points) in enumerate(zip(cell_types, cell_points)):
+            self._cells.append(create_cell(points, cell_type, index, self))
+
         # Establish relationships and compute additional properties
         self.find_neighbours_and_edges()
         self.find_outward_normals()
 
+        if use_cache:
+            save_mesh_cache(self, cache_file, mesh_hash)
+
+    def load_from_cache(self, cached: dict) -> None:
+        """
+        Creates the points and cells from a compiled-mesh cache. The stored neighbours, edges
+        and outward normals are assigned to the cells directly, so neither the neighbour search
+        nor the face gathering of find_outward_normals runs again.
+
+        Args:
+            cached (dict): Arrays loaded by load_mesh_cache.
+        """
+        self._coordinates = np.ascontiguousarray(cached["points"], dtype=float)
+        self._points = PointList(self._coordinates)
+        self._midpoints = cached["midpoints"]
+        self._areas = cached["areas"]
+        self._velocities = self.compute_velocities()
+        self._cell_order = cached.get("cell_order")
+
+        self._cells = []
+        create_cell = CellFactory()
+        for index, (type_code, cell_points) in enumerate(zip(cached["cell_types"], cached["connectivity"])):
+            cell_type = CACHE_CELL_TYPES[type_code]
+            self._cells.append(create_cell(cell_points[cell_points >= 0], cell_type, index, self))
+
+        self._face_owners = cached["face_owners"]
+        self._face_neighbours = cached["face_neighbours"]
+        self._face_edge_vectors = cached["face_edge_vectors"]
+        self._face_normals = cached["face_normals"]
+
+        # The faces of a cell are contiguous and in the order of its neighbours with an edge
+        face_starts = np.concatenate(([0], np.cumsum(np.bincount(self._face_owners, minlength=len(self._cells)))))
+        edge_vectors = self._face_edge_vectors.tolist()
+        edge_points = [
+            [Point(x0, y0), Point(x1, y1)] for (x0, y0), (x1, y1) in cached["face_edge_points"].tolist()]
+        normals = list(self._face_normals)
+
+        cells = self._cells
+        for cell, neighbour_row, start, end in zip(
+                cells, cached["neighbours"].tolist(), face_starts[:-1].tolist(), face_starts[1:].tolist()):
+            cell.store_cached_neighbours_and_edges(
+                [cells[j] for j in neighbour_row if j >= 0], edge_vectors[start:end], edge_points[start:end])
+            cell.store_outward_normals(normals[start:end])
+
+    def compute_cell_geometry(self, connectivity_blocks: list) -> None:
+        """
+        Computes the midpoint and area of every cell with array operations over the
+        connectivity of each block of cells.
+
+        Args:
+            connectivity_blocks (list): Point indices of the cells, one (n_cells, n_points) block per
+                cell type, in the order the cells are created.
+        """
+        midpoints = []
+        areas = []
+        for data in connectivity_blocks:
+            data = np.asarray(data, dtype=np.int64)
+            if data.size == 0:
+                continue
+            corners = self._coordinates[data]
+            midpoints.append(corners.sum(axis=1) / data.shape[1])
+
+            if data.shape[1] == 3:
+                x1, y1 = corners[:, 0, 0], corners[:, 0, 1]
+                x2, y2 = corners[:, 1, 0], corners[:, 1, 1]
+                x3, y3 = corners[:, 2, 0], corners[:, 2, 1]
+                areas.append(0.5 * np.abs((x1-x3)*(y2-y1) - (x1-x2)*(y3-y1)))
+            else:
+                # Only triangles have an area
+                areas.append(np.full(len(data), np.nan))
+
+        self._midpoints = np.concatenate(midpoints) if midpoints else np.empty((0, 2))
+        self._areas = np.concatenate(areas) if areas else np.empty(0)
+        self._velocities = self.compute_velocities()
+
+    def reorder_cells(self, cell_order: np.ndarray) -> None:
+        """
+        Renumbers the cell geometry computed in file order, before the cells are created.
+
+        Args:
+            cell_order (np.ndarray): Index in the mesh file of each cell in the new order.
+        """
+        self._cell_order = np.asarray(cell_order, dtype=np.int64)
+        self._midpoints = self._midpoints[self._cell_order]
+        self._areas = self._areas[self._cell_order]
+        self._velocities = self._velocities[self._cell_order]
+
+    def compute_velocities(self) -> np.ndarray:
+        """
+        Evaluates the default velocity field at all cell midpoints at once.
+
+        Returns:
+            np.ndarray: Velocity at each cell midpoint, shape (n_cells, 2).
+        """
+        from ..simulation.velocity import DEFAULT_VELOCITY
+        return DEFAULT_VELOCITY.velocities(self._midpoints)
+
     def find_neighbours_and_edges(self) -> None:
         """
         Computes and stores the neighbors and edges for each cell in the mesh.
+
+        Each cell is only compared against the candidates found in the edge index
+        instead of every cell in the mesh, which keeps this step linear in the mesh size.
         """
+        candidates = self.find_candidate_neighbours()
         total_cells = len(self._cells)
         print_interval = max(1, total_cells // 100)  # Update progress every 1%
         print(f"Storing neighbors for each cell in {self._file_name}:")
 
         for i, cell in enumerate(self._cells):
-            cell.store_neighbours_and_edges()
+            cell.store_neighbours_and_edges(candidates[i])
 
             # Print progress at regular intervals
             if i % print_interval == 0 or i == total_cells - 1:
@@ -66,12 +216,88 @@ class Mesh:
 
         print("\nNeighbor storage complete.\n")
 
+    def find_candidate_neighbours(self) -> list[list]:
+        """
+        Builds an index from sorted node pairs (edges) and nodes to the cells using them,
+        and looks up the cells that can possibly be neighbours of each cell.
+
+        Cells sharing an edge are candidates for every cell type, while line cells are
+        also candidates for other line cells sharing a single node. The candidates are
+        returned in mesh order so the neighbour ordering matches a full scan of the mesh.
+
+        Returns:
+            list[list]: Candidate neighbour cells for each cell in the mesh.
+        """
+        from ..cell.line_cell import Line
+
+        edge_to_cells = defaultdict(list)
+        node_to_lines = defaultdict(list)
+        cell_edges = []
+
+        for i, cell in enumerate(self._cells):
+            nodes = [int(p) for p in cell.points]
+            edges = {tuple(sorted(pair)) for pair in combinations(nodes, 2)}
+            cell_edges.append(edges)
+            for edge in edges:
+                edge_to_cells[edge].append(i)
+            if isinstance(cell, Line):
+                for node in nodes:
+                    node_to_lines[node].append(i)
+
+        candidates = []
+        for i, cell in enumerate(self._cells):
+            found = set()
+            for edge in cell_edges[i]:
+                found.update(edge_to_cells[edge])
+            if isinstance(cell, Line):
+                for node in cell.points:
+                    found.update(node_to_lines[int(node)])
+            found.discard(i)
+            candidates.append([self._cells[j] for j in sorted(found)])
+
+        return candidates
+
     def find_outward_normals(self) -> None:
         """
         Computes and stores outward normals for all cells in the mesh.
+
+        The edges of all cells are gathered into face arrays, and the normals of all faces
+        are computed at once: each edge vector is rotated by 90 degrees, normalized, and
+        flipped where it points towards the midpoint of its cell.
         """
+        owners = []
+        neighbours = []
+        edge_vectors = []
+        edge_starts = []
+        face_counts = []
+
         for cell in self._cells:
-            cell.store_outward_normals()
+            count = 0
+            for ngh, edge, edge_points in zip(cell.neighbours, cell.edge_vectors, cell.edge_points):
+                owners.append(cell.index)
+                neighbours.append(ngh.index)
+                edge_vectors.append(edge)
+                edge_starts.append((edge_points[0].x, edge_points[0].y))
+                count += 1
+            face_counts.append(count)
+
+        self._face_owners = np.array(owners, dtype=np.int64)
+        self._face_neighbours = np.array(neighbours, dtype=np.int64)
+        self._face_edge_vectors = np.array(edge_vectors, dtype=float).reshape(-1, 2)
+
+        edge_starts = np.array(edge_starts, dtype=float).reshape(-1, 2)
+        perp_vectors = np.column_stack((-self._face_edge_vectors[:, 1], self._face_edge_vectors[:, 0]))
+        normals = perp_vectors / np.linalg.norm(perp_vectors, axis=1)[:, None]
+
+        to_p = edge_starts - self._midpoints[self._face_owners]
+        inward = np.einsum("ij,ij->i", normals, to_p) < 0
+        normals[inward] = -normals[inward]
+        self._face_normals = normals
+
+        start = 0
+        for cell, count in zip(self._cells, face_counts):
+            cell.store_outward_normals(list(self._face_normals[start:start + count]))
+            start += count
 
         print(f"Outward normals computed for {self._file_name}")
 
@@ -86,15 +312,149 @@ class Mesh:
         return self._cells
 
     @property
-    def points(self) -> list:
+    def point_coordinates(self) -> np.ndarray:
+        """
+        Returns the coordinates of all points in the mesh.
+
+        Returns:
+            np.ndarray: Point coordinates, shape (n_points, 2).
+        """
+        return self._coordinates
+
+    @property
+    def midpoints(self) -> np.ndarray:
+        """
+        Returns the midpoints of all cells in the mesh.
+
+        Returns:
+            np.ndarray: Cell midpoints, shape (n_cells, 2).
+        """
+        return self._midpoints
+
+    @property
+    def areas(self) -> np.ndarray:
+        """
+        Returns the areas of all cells in the mesh, NaN for cells without an area.
+
+        Returns:
+            np.ndarray: Cell areas, shape (n_cells,).
+        """
+        return self._areas
+
+    @property
+    def cell_order(self) -> np.ndarray | None:
         """
-        Returns the list of points in the mesh.
+        Returns the permutation of a renumbered mesh. Solution, restart and checkpoint files
+        always use the numbering of the mesh file, see to_original_order and from_original_order.
 
         Returns:
-            list: List of Point objects.
+            np.ndarray | None: Index in the mesh file of each cell, None if the cells keep the file order.
+        """
+        return self._cell_order
+
+    @property
+    def velocities(self) -> np.ndarray:
+        """
+        Returns the default velocity field at the midpoints of all cells in the mesh.
+
+        Returns:
+            np.ndarray: Cell velocities, shape (n_cells, 2).
+        """
+        return self._velocities
+
+    @property
+    def face_owners(self) -> np.ndarray:
+        """
+        Returns the index of the cell each face belongs to.
+
+        Returns:
+            np.ndarray: Owning cell of each face, shape (n_faces,).
+        """
+        return self._face_owners
+
+    @property
+    def face_neighbours(self) -> np.ndarray:
+        """
+        Returns the index of the neighbouring cell across each face.
+
+        Returns:
+            np.ndarray: Neighbouring cell of each face, shape (n_faces,).
+        """
+        return self._face_neighbours
+
+    @property
+    def face_edge_vectors(self) -> np.ndarray:
+        """
+        Returns the edge vector of each face.
+
+        Returns:
+            np.ndarray: Edge vectors, shape (n_faces, 2).
+        """
+        return self._face_edge_vectors
+
+    @property
+    def face_normals(self) -> np.ndarray:
+        """
+        Returns the unit outward normal of each face.
+
+        Returns:
+            np.ndarray: Outward normals, shape (n_faces, 2).
+        """
+        return self._face_normals
+
+    @property
+    def points(self) -> "PointList":
+        """
+        Returns the points in the mesh.
+
+        Returns:
+            PointList: Sequence of Point views over the coordinate array.
         """
         return self._points
 
+class PointList(Sequence):
+    """
+    Read-only sequence of points backed by an (n_points, 2) coordinate array.
+
+    Points are created on access, so the mesh only stores the contiguous array.
+
+    Attributes:
+        _coordinates (np.ndarray): Coordinates of the points, shape (n_points, 2).
+    """
+
+    def __init__(self, coordinates: np.ndarray):
+        """
+        Initializes the sequence with the coordinate array it reads from.
+
+        Args:
+            coordinates (np.ndarray): Coordinates of the points, shape (n_points, 2).
+        """
+        self._coordinates = coordinates
+
+    def __len__(self) -> int:
+        """
+        Returns the number of points.
+
+        Returns:
+            int: Number of points.
+        """
+        return len(self._coordinates)
+
+    def __getitem__(self, index):
+        """
+        Returns the point (or list of points for a slice) at the given index.
+
+        Args:
+            index: Index or slice of the points.
+
+        Returns:
+            Point | list[Point]: The requested point(s).
+        """
+        if isinstance(index, slice):
+            return [Point(x, y) for x, y in self._coordinates[index].tolist()]
+        x, y = self._coordinates[index]
+        return Point(x, y)
+
 class Point:
     """
     Represents a 2D point with x and y coordinates.
@@ -103,6 +463,7 @@ class Point:
         _x (float): The x-coordinate of the point.
         _y (float): The y-coordinate of the point.
     """
+    __slots__ = ("_x", "_y")
 
     def __init__(self, x: float, y: float):
         """
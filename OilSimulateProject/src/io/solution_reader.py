@@ -1,21 +1,51 @@
-def initialize_oil_spill(mesh, solution_file):
+import struct
+import zipfile
+import numpy as np
+
+# Leading bytes of the binary formats, every other file is read as text
+NPZ_MAGIC = b"PK\x03\x04"
+NPY_MAGIC = b"\x93NUMPY"
+
+def solution_format(solution_file: str) -> str:
     """
-    Initializes the oil distribution on the computational mesh by reading oil amounts
-    from a solution file and assigning them to the corresponding cells.
+    Detects the format of a solution file from its first bytes.
+
+    Args:
+        solution_file (str): Path to the solution file.
+
+    Returns:
+        str: "binary" for .npz/.npy files, "text" otherwise.
+    """
+    with open(solution_file, "rb") as file:
+        magic = file.read(len(NPY_MAGIC))
+    if magic[:len(NPZ_MAGIC)] == NPZ_MAGIC or magic == NPY_MAGIC:
+        return "binary"
+    return "text"
+
+def read_oil_amounts(solution_file: str, n_cells: int) -> np.ndarray:
+    """
+    Reads the oil amount of each cell from a solution file, in either the text or
+    the binary format.
 
     Args:
-        mesh: The computational mesh containing cells as objects with an 'oil_amount' attribute.
         solution_file (str): Path to the file containing oil distribution data.
+        n_cells (int): Number of cells in the mesh.
+
+    Returns:
+        np.ndarray: Oil amount of each cell, 0.0 for cells missing in the file.
 
     Raises:
         FileNotFoundError: If the solution file cannot be found.
         ValueError: If the file contains invalid or improperly formatted data.
     """
+    if solution_format(solution_file) == "binary":
+        return read_binary_oil_amounts(solution_file, n_cells)
+
     # Open and read the file
     with open(solution_file, "r") as file:
         lines = file.readlines()
 
-    cell_oil_values = {}
+    oil_amounts = np.zeros(n_cells)
 
     # Process each line
     for line in lines:
@@ -28,9 +58,141 @@ def initialize_oil_spill(mesh, solution_file):
             cell_parts = line.split(":")
             cell_id = int(cell_parts[0].split()[1])
             oil_amount = float(cell_parts[1].strip())
-            cell_oil_values[cell_id] = oil_amount
+            if oil_amount < 0:
+                raise ValueError("Oil amount cannot be negative.")
+            if cell_id < n_cells:
+                oil_amounts[cell_id] = oil_amount
+
+    return oil_amounts
+
+def read_binary_oil_amounts(solution_file: str, n_cells: int) -> np.ndarray:
+    """
+    Reads the oil amount of each cell from a binary solution file by memory mapping
+    the stored array. The mapping is copy-on-write, so the returned array can be
+    updated by the simulation without changing the file.
+
+    Args:
+        solution_file (str): Path to a .npz solution file, or a plain .npy array.
+        n_cells (int): Number of cells in the mesh.
+
+    Returns:
+        np.ndarray: Oil amount of each cell.
+
+    Raises:
+        ValueError: If the stored array does not match the mesh or contains negative values.
+    """
+    if is_npz_file(solution_file):
+        oil_amounts = memmap_npz_array(solution_file, "oil")
+    else:
+        oil_amounts = np.load(solution_file, mmap_mode="c")
+
+    if oil_amounts.shape != (n_cells,):
+        raise ValueError(
+            f"Solution file {solution_file} holds oil amounts of shape {oil_amounts.shape}, "
+            f"but the mesh has {n_cells} cells."
+        )
+    if np.any(oil_amounts < 0):
+        raise ValueError("Oil amount cannot be negative.")
+    return oil_amounts
+
+def is_npz_file(solution_file: str) -> bool:
+    """
+    Checks if a binary solution file is an .npz archive rather than a plain .npy array.
+
+    Args:
+        solution_file (str): Path to the solution file.
+
+    Returns:
+        bool: True for .npz archives.
+    """
+    with open(solution_file, "rb") as file:
+        return file.read(len(NPZ_MAGIC)) == NPZ_MAGIC
+
+def memmap_npz_array(npz_file: str, name: str) -> np.ndarray:
+    """
+    Memory maps an array stored uncompressed in an .npz archive, without reading it.
+
+    Compressed arrays cannot be mapped and are loaded into memory instead.
+
+    Args:
+        npz_file (str): Path to the .npz archive.
+        name (str): Name of the array in the archive.
+
+    Returns:
+        np.ndarray: Copy-on-write mapping of the array.
+    """
+    with zipfile.ZipFile(npz_file) as archive:
+        info = archive.getinfo(f"{name}.npy")
+
+    if info.compress_type != zipfile.ZIP_STORED:
+        with np.load(npz_file) as data:
+            return data[name]
+
+    with open(npz_file, "rb") as file:
+        # Skip the local file header of the member, its variable part follows the 30 fixed bytes
+        file.seek(info.header_offset)
+        local_header = file.read(30)
+        name_length, extra_length = struct.unpack("<HH", local_header[26:30])
+        file.seek(info.header_offset + 30 + name_length + extra_length)
+
+        version = np.lib.format.read_magic(file)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(file)
+        offset = file.tell()
+
+    return np.memmap(npz_file, dtype=dtype, mode="c", offset=offset, shape=shape,
+                     order="F" if fortran_order else "C")
+
+def read_solution_metadata(solution_file: str) -> dict:
+    """
+    Reads the time and the oil in the fishing grounds stored with a solution.
+
+    Args:
+        solution_file (str): Path to the solution file, in either format.
+
+    Returns:
+        dict: "time" and "total_oil_in_fishing_grounds", None if not stored in the file.
+    """
+    metadata = {"time": None, "total_oil_in_fishing_grounds": None}
+
+    if solution_format(solution_file) == "binary":
+        if is_npz_file(solution_file):
+            with np.load(solution_file) as data:
+                for key in metadata:
+                    if key in data.files:
+                        metadata[key] = float(data[key])
+        return metadata
+
+    # The text format stores both values in the header line
+    with open(solution_file, "r") as file:
+        header = file.readline().strip()
+    if header.startswith("t ="):
+        for part in header.split(","):
+            key, _, value = part.partition("=")
+            key = "time" if key.strip() == "t" else key.strip()
+            if key in metadata:
+                metadata[key] = float(value)
+    return metadata
+
+def initialize_oil_spill(mesh, solution_file):
+    """
+    Initializes the oil distribution on the computational mesh by reading oil amounts
+    from a solution file and assigning them to the corresponding cells.
+
+    Args:
+        mesh: The computational mesh containing cells as objects with an 'oil_amount' attribute.
+        solution_file (str): Path to the file containing oil distribution data.
+
+    Raises:
+        FileNotFoundError: If the solution file cannot be found.
+        ValueError: If the file contains invalid or improperly formatted data.
+    """
+    from .cell_ordering import from_original_order
+    oil_amounts = from_original_order(mesh, read_oil_amounts(solution_file, len(mesh.cells)))
 
     # Assign oil amounts to the mesh cells        
     for i, cell in enumerate(mesh.cells):
         # Use oil amount from file if available, otherwise default to 0.0
-        cell.oil_amount = cell_oil_values.get(i, 0.0)
\ No newline at end of file
+        cell.oil_amount = oil_amounts[i]
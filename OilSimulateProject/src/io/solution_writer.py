@@ -1,21 +1,46 @@
+import io
 import os
+import numpy as np
+from .cell_ordering import mesh_cell_order, to_original_order
 
-def write_solution(mesh, time_val: float, total_oil: float, config_name: str):
+# Supported solution file formats
+SOLUTION_FORMATS = ("text", "binary")
+
+def write_solution(mesh, time_val: float, total_oil: float, config_name: str, oil_amounts=None,
+                   solution_format: str = "text"):
     """
-    Writes the oil value of each cell in the mesh to a .txt file in the 'solutions' directory.
+    Writes the oil value of each cell in the mesh to a .txt file in the 'solutions' directory,
+    or to a .npz file when the binary format is selected.
 
     Args:
         mesh: The computational mesh containing cells as objects with an 'oil_amount' attribute.
         time_val (float): The current simulation time.
         total_oil (float): Total amount of oil in the fishing grounds at the current time step.
         config_name (str): Name used to identify the output file.
+        oil_amounts: Oil amount of each cell, indexed by cell index. Read from the cells if not given.
+        solution_format (str): Either "text" or "binary".
 
     Creates:
         A text file in the 'solutions' directory with the oil values for each cell in the mesh.
+
+    Raises:
+        ValueError: If the solution format is not supported.
     """
+    if solution_format not in SOLUTION_FORMATS:
+        raise ValueError(f"Unknown solution format: {solution_format}. Supported formats are: {list(SOLUTION_FORMATS)}")
 
     output_dir = "solutions"
     os.makedirs(output_dir, exist_ok=True) # Ensure the directory exists
+
+    # Solution files use the cell numbering of the mesh file, also for a renumbered mesh
+    if mesh_cell_order(mesh) is not None:
+        if oil_amounts is None:
+            oil_amounts = [cell.oil_amount for cell in mesh.cells]
+        oil_amounts = to_original_order(mesh, oil_amounts)
+
+    if solution_format == "binary":
+        write_binary_solution(mesh, time_val, total_oil, config_name, oil_amounts, output_dir)
+        return
     
     lines = []
 
@@ -24,7 +49,7 @@ def write_solution(mesh, time_val: float, total_oil: float, config_name: str):
 
     # Add the oil values for each cell
     for cell_index, cell in enumerate(mesh.cells):
-        oil_value = cell.oil_amount  
+        oil_value = cell.oil_amount if oil_amounts is None else oil_amounts[cell_index]
         lines.append(f"Cell {cell_index}: {oil_value}\n")
     
     # Define the output file path
@@ -34,4 +59,69 @@ def write_solution(mesh, time_val: float, total_oil: float, config_name: str):
     with open(solution_file, "w") as file:
         file.writelines(lines)
     
-    print(f"Oil values successfully written to {solution_file}")
\ No newline at end of file
+    print(f"Oil values successfully written to {solution_file}")
+
+def write_binary_solution(mesh, time_val: float, total_oil: float, config_name: str, oil_amounts, output_dir: str):
+    """
+    Writes the oil values of all cells as one array to an uncompressed .npz file, with the time
+    and the oil in the fishing grounds stored next to it. The uncompressed array can be
+    memory mapped when the file is used as a restart file.
+
+    Args:
+        mesh: The computational mesh containing cells as objects with an 'oil_amount' attribute.
+        time_val (float): The current simulation time.
+        total_oil (float): Total amount of oil in the fishing grounds at the current time step.
+        config_name (str): Name used to identify the output file.
+        oil_amounts: Oil amount of each cell, indexed by cell index. Read from the cells if not given.
+        output_dir (str): Directory the solution file is written to.
+    """
+    if oil_amounts is None:
+        oil_amounts = [cell.oil_amount for cell in mesh.cells]
+
+    # Build the whole file in memory and write it with a single call
+    buffer = io.BytesIO()
+    np.savez(
+        buffer,
+        oil=np.ascontiguousarray(oil_amounts, dtype=float),
+        time=np.array(time_val, dtype=float),
+        total_oil_in_fishing_grounds=np.array(total_oil, dtype=float)
+    )
+
+    solution_file = os.path.join(output_dir, f"{config_name}_solution.npz")
+    with open(solution_file, "wb") as file:
+        file.write(buffer.getbuffer())
+
+    print(f"Oil values successfully written to {solution_file}")
+
+def write_ensemble_solution(mesh, time_val: float, oil_spill_centers, fishing_ground_oil, config_name: str,
+                            oil_amounts: np.ndarray):
+    """
+    Writes the oil values of all members of an ensemble to 'solutions/<config>_ensemble.npz',
+    one row per member, together with the time, the oil spill center of each member and the
+    oil of each member in the fishing grounds.
+
+    Args:
+        mesh: The computational mesh.
+        time_val (float): The current simulation time.
+        oil_spill_centers: Oil spill center of each member, shape (n_members, 2).
+        fishing_ground_oil: Oil of each member in the fishing grounds, shape (n_members,).
+        config_name (str): Name used to identify the output file.
+        oil_amounts (np.ndarray): Oil amount of each member in each cell, shape (n_members, n_cells).
+    """
+    output_dir = "solutions"
+    os.makedirs(output_dir, exist_ok=True)
+
+    buffer = io.BytesIO()
+    np.savez(
+        buffer,
+        oil=np.ascontiguousarray(to_original_order(mesh, np.asarray(oil_amounts).T).T, dtype=float),
+        time=np.array(time_val, dtype=float),
+        oil_spill_centers=np.asarray(oil_spill_centers, dtype=float),
+        total_oil_in_fishing_grounds=np.asarray(fishing_ground_oil, dtype=float)
+    )
+
+    solution_file = os.path.join(output_dir, f"{config_name}_ensemble.npz")
+    with open(solution_file, "wb") as file:
+        file.write(buffer.getbuffer())
+
+    print(f"Oil values of {len(oil_amounts)} ensemble members successfully written to {solution_file}")
@@ -0,0 +1,79 @@
+import csv
+import os
+import numpy as np
+import logging
+
+logger = logging.getLogger(__name__)
+
+class ZoneSeriesWriter:
+    """
+    Streams the oil in each monitoring zone to a CSV file during a simulation.
+
+    The file has a "time" column followed by one column per zone, and one row per logged
+    step. Rows are written as they arrive, so the time series is never held in memory.
+
+    Attributes:
+        _filename (str): Path of the CSV file.
+        _file: The open CSV file.
+        _writer: CSV writer of the file.
+        _n_zones (int): Number of zone columns.
+    """
+    def __init__(self, filename: str, zone_names: list):
+        """
+        Creates the CSV file and writes the header.
+
+        Args:
+            filename (str): Path of the CSV file.
+            zone_names (list): Name of each zone, in the order of the columns.
+        """
+        os.makedirs(os.path.dirname(filename) or ".", exist_ok=True)
+        self._filename = filename
+        self._file = open(filename, "w", newline="")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(["time", *zone_names])
+        self._n_zones = len(zone_names)
+
+    def append(self, time_val: float, zone_oil: np.ndarray) -> None:
+        """
+        Writes the oil in every zone at one time.
+
+        Args:
+            time_val (float): Simulation time.
+            zone_oil (np.ndarray): Oil in each zone, in the order of the columns.
+
+        Raises:
+            ValueError: If the number of values does not match the number of zones.
+        """
+        if len(zone_oil) != self._n_zones:
+            raise ValueError(f"Expected oil amounts of {self._n_zones} zones, got {len(zone_oil)}.")
+        self._writer.writerow([f"{time_val:.10g}", *(f"{oil:.6g}" for oil in zone_oil)])
+
+    def close(self) -> None:
+        """
+        Closes the CSV file.
+        """
+        if not self._file.closed:
+            self._file.close()
+            logger.info(f"Time series written to: {self._filename}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+def read_zone_series(filename: str) -> tuple:
+    """
+    Reads a time series written by ZoneSeriesWriter.
+
+    Args:
+        filename (str): Path of the CSV file.
+
+    Returns:
+        tuple: Array of the times and a dict with the oil array of each zone, by name.
+    """
+    with open(filename, newline="") as f:
+        rows = list(csv.reader(f))
+    names = rows[0][1:]
+    values = np.array(rows[1:], dtype=float).reshape(-1, len(names) + 1)
+    return values[:, 0], {name: values[:, i + 1] for i, name in enumerate(names)}
@@ -1 +1,3 @@
-from .simulator import Simulation
\ No newline at end of file
+from .simulator import Simulation
+from .ensemble import EnsembleSimulation
+from .flux_engine import FluxEngine
\ No newline at end of file
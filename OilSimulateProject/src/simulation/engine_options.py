@@ -0,0 +1,94 @@
+# Engines advancing the oil amounts of a simulation
+ENGINES = ("object", "vectorized", "sparse", "implicit")
+
+# Engine used if none is chosen, local time stepping needs the face data of the flux engine
+DEFAULT_ENGINE = "object"
+DEFAULT_LOCAL_ENGINE = "vectorized"
+
+# Engines computing all fluxes from the old state, they only support the two-phase update mode
+TWO_PHASE_ENGINES = ("vectorized", "sparse", "implicit")
+
+# Order in which the object engine applies the fluxes of a step
+UPDATE_MODES = ("sequential", "two-phase")
+
+# Ways of choosing the time step
+TIME_STEPPINGS = ("fixed", "adaptive", "local")
+
+# Ways the sparse engine applies the steps between two outputs
+SPARSE_JUMPS = ("matvec", "squaring")
+
+def default_engine(time_stepping: str = "fixed") -> str:
+    """
+    Gets the engine used if none is chosen.
+
+    Args:
+        time_stepping: One of TIME_STEPPINGS.
+
+    Returns:
+        str: The vectorized engine for local time stepping, the object engine otherwise.
+    """
+    return DEFAULT_LOCAL_ENGINE if time_stepping == "local" else DEFAULT_ENGINE
+
+def validate_engine_options(
+        engine: str, update_mode: str = None, time_stepping: str = "fixed", sparse_jump: str = "matvec",
+        active_threshold: float = None, ensemble: bool = False, reordered: bool = False) -> str:
+    """
+    Checks that the engine, update mode, time stepping and their options can be combined.
+
+    This is the only place where these rules are written down, both Simulation and the
+    config reader use it.
+
+    Args:
+        engine: One of ENGINES.
+        update_mode: One of UPDATE_MODES, or None for the default of the engine.
+        time_stepping: One of TIME_STEPPINGS.
+        sparse_jump: One of SPARSE_JUMPS.
+        active_threshold: Oil amount below which cells are skipped by the flux evaluation, or None.
+        ensemble: True if the options advance an ensemble of oil spills.
+        reordered: True if the cells of the mesh are renumbered.
+
+    Returns:
+        str: The update mode, the default of the engine if update_mode is None.
+
+    Raises:
+        ValueError: If an option is unknown or the options cannot be combined.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"Unknown engine: {engine}. Supported engines are: {list(ENGINES)}")
+    if time_stepping not in TIME_STEPPINGS:
+        raise ValueError(f"Unknown time stepping: {time_stepping}. Supported time steppings are: {list(TIME_STEPPINGS)}")
+    if sparse_jump not in SPARSE_JUMPS:
+        raise ValueError(f"Unknown sparse jump: {sparse_jump}. Supported jumps are: {list(SPARSE_JUMPS)}")
+
+    # The array-based engines never update cells during the sweep, and the sequential sweep
+    # visits the cells in mesh order, so renumbering them would change the solution
+    if update_mode is None:
+        update_mode = "two-phase" if engine in TWO_PHASE_ENGINES or reordered else "sequential"
+    if update_mode not in UPDATE_MODES:
+        raise ValueError(f"Unknown update mode: {update_mode}. Supported update modes are: {list(UPDATE_MODES)}")
+    if reordered and update_mode != "two-phase":
+        raise ValueError("Renumbered cells require the 'two-phase' update mode.")
+    if engine in TWO_PHASE_ENGINES and update_mode != "two-phase":
+        raise ValueError(f"The {engine} engine requires the 'two-phase' update mode.")
+
+    # Local time stepping has its own update, and the implicit steps are not limited by the stable time step
+    if engine in ("object", "sparse") and time_stepping == "local":
+        raise ValueError(f"The {engine} engine cannot be used with local time stepping.")
+    if engine == "implicit" and time_stepping != "fixed":
+        raise ValueError("The implicit engine requires fixed time stepping.")
+    if engine == "implicit" and sparse_jump != "matvec":
+        raise ValueError("The implicit engine requires the 'matvec' sparse jump.")
+
+    if active_threshold is not None:
+        if active_threshold < 0:
+            raise ValueError("Active threshold cannot be negative.")
+        if engine != "vectorized" or time_stepping == "local":
+            raise ValueError(
+                "Active-region flux evaluation requires the vectorized engine without local time stepping.")
+
+    if ensemble:
+        if engine not in TWO_PHASE_ENGINES:
+            raise ValueError(f"An ensemble requires one of the engines {list(TWO_PHASE_ENGINES)}, got: {engine}.")
+        if time_stepping == "local":
+            raise ValueError("An ensemble cannot be used with local time stepping.")
+    return update_mode
@@ -0,0 +1,200 @@
+import numpy as np
+import os
+import logging
+from .simulator import Simulation
+from .fishing_grounds import FishingGrounds
+from .engine_options import validate_engine_options
+
+logger = logging.getLogger(__name__)
+
+class EnsembleSimulation(Simulation):
+    """
+    Simulates many oil spills on the same mesh and velocity field in one run.
+
+    The members differ only in their oil spill center. The oil is stored as a matrix of shape
+    (n_members, n_cells), and every step advances all members together with the face fluxes
+    of the vectorized engine, or with one sparse matrix product (or one solve with the cached
+    factors) on all members for the sparse and implicit engines. The face data, the time steps,
+    the velocity refreshes and the Python overhead of a step are shared by all members.
+
+    The oil in every fishing ground is recorded for each member on every sampled step and
+    written to results_folder/fishing_grounds_<name>.csv, with a "time" column and one column
+    per member. No animation is rendered.
+
+    Attributes:
+        _oil_spill_centers: Oil spill center of each member, shape (n_members, 2).
+        _sample_times: Time of each sampled step.
+        _fishing_ground_series: Oil of each member on each sampled step, by fishing ground name.
+    """
+    def __init__(
+        self, mesh, oil_spill_centers, fishing_grounds: tuple,
+        nSteps: int, tStart: float, tEnd: float, results_folder: str, config_name: str,
+        engine: str = "vectorized", write_frequency: int = 1, named_fishing_grounds: dict = None,
+        time_stepping: str = "fixed", cfl: float = 0.9, velocity=None, sparse_jump: str = "matvec"):
+        """
+        Initializes the oil of all members.
+
+        Args:
+            mesh: The computational mesh representing the simulation domain.
+            oil_spill_centers: Oil spill center [x, y] of each member.
+            fishing_grounds: Boundary coordinates of the fishing grounds.
+            nSteps: Total number of simulation steps. Not used with adaptive time stepping.
+            tStart: Start time for the simulation.
+            tEnd: End time for the simulation.
+            results_folder: Directory where the fishing ground time series are stored.
+            config_name: The name of active toml file.
+            engine: Either "vectorized", "sparse" or "implicit".
+            write_frequency: Number of steps between sampled steps.
+            named_fishing_grounds: Boundary coordinates of additional fishing grounds by name.
+            time_stepping: Either "fixed" or "adaptive".
+            cfl: Fraction of the largest stable time step taken in adaptive mode.
+            velocity: Velocity provider shared by all members, see Simulation.
+            sparse_jump: How the sparse engine applies the steps between two sampled steps.
+
+        Raises:
+            ValueError: If no oil spill centers are given, or the engine or time stepping
+                cannot advance an ensemble.
+        """
+        centers = np.asarray(oil_spill_centers, dtype=float)
+        if centers.ndim != 2 or centers.shape[1] != 2 or len(centers) == 0:
+            raise ValueError("An ensemble needs an oil spill center [x, y] for each member.")
+        validate_engine_options(engine, None, time_stepping, sparse_jump, ensemble=True)
+        self._oil_spill_centers = centers
+
+        super().__init__(
+            mesh, tuple(centers[0]), fishing_grounds, nSteps, tStart, tEnd, None, results_folder, None,
+            config_name, engine=engine, write_frequency=write_frequency,
+            named_fishing_grounds=named_fishing_grounds, time_stepping=time_stepping, cfl=cfl,
+            velocity=velocity, sparse_jump=sparse_jump)
+
+        self._sample_times = []
+        self._fishing_ground_series = {}
+
+    def initialize_oil_spill(self):
+        """
+        Distributes the initial oil of every member around its spill center, with the gaussian
+        evaluated for all members and triangles at once.
+        """
+        self._oil = self.gaussian_oil(self._oil_spill_centers)
+        logger.info(f"Ensemble of {self.n_members} members initialized on {self._oil.shape[1]} cells")
+
+    def run_simulation(self) -> np.ndarray:
+        """
+        Advances all members from tStart to tEnd, recording the oil in the fishing grounds on
+        every sampled step, and writes the final oil of all members to solutions/<config>_ensemble.npz.
+
+        Returns:
+            np.ndarray: Oil of each member in the fishing grounds at the final time step.
+        """
+        from ..io.zone_series import ZoneSeriesWriter
+        from ..io.solution_writer import write_ensemble_solution
+
+        self._previous_mass = self.total_oil_mass()
+        logger.info(
+            f"Initial total oil mass = {self._previous_mass.min():.6g} to {self._previous_mass.max():.6g} "
+            f"over {self.n_members} members | Engine = {self._engine}")
+
+        self._fishing_ground_index = FishingGrounds(
+            self._mesh, {self.MAIN_FISHING_GROUNDS: self._fishing_grounds, **self._named_fishing_grounds})
+        member_names = [f"member_{k}" for k in range(self.n_members)]
+        series_writers = {
+            name: ZoneSeriesWriter(os.path.join(self._results_folder, f"fishing_grounds_{name}.csv"), member_names)
+            for name in self._fishing_ground_index.names
+        }
+        self._sample_times = []
+        self._fishing_ground_series = {name: [] for name in self._fishing_ground_index.names}
+
+        for n in self.time_steps():
+            sampled = self.is_sampled_step(n)
+            self.oil_movement(defer=not sampled)
+            if sampled:
+                self.record_sampled_step(series_writers)
+        logger.info(f"Time steps taken: {self._steps_taken} ({self._time_stepping} time stepping)")
+        if self._velocity is not None and self._velocity.time_dependent:
+            logger.info(f"Velocity field refreshes: {self._velocity_refreshes}")
+
+        for writer in series_writers.values():
+            writer.close()
+        if self._velocity is not None:
+            self._velocity.close()
+
+        self._final_oil_in_fishing_grounds = self._fishing_ground_oil[self.MAIN_FISHING_GROUNDS]
+        write_ensemble_solution(
+            mesh = self._mesh,
+            time_val = self._current_time,
+            oil_spill_centers = self._oil_spill_centers,
+            fishing_ground_oil = self._final_oil_in_fishing_grounds,
+            config_name = self._config_name,
+            oil_amounts = self._oil)
+        return self._final_oil_in_fishing_grounds
+
+    def record_sampled_step(self, series_writers: dict):
+        """
+        Records the oil of every member in each fishing ground and logs the spread over the members.
+
+        Args:
+            series_writers: Time series writer of each fishing ground, by name.
+        """
+        current_time = self._current_time
+        self._fishing_ground_oil = self._fishing_ground_index.oil_totals(self._oil)
+        self._sample_times.append(current_time)
+        for name, member_oil in self._fishing_ground_oil.items():
+            self._fishing_ground_series[name].append(member_oil)
+            series_writers[name].append(current_time, member_oil)
+
+        main_oil = self._fishing_ground_oil[self.MAIN_FISHING_GROUNDS]
+        _, mass_error = self.check_mass_balance()
+        logger.info(
+            f"Time = {current_time:.3f} | Oil in Fishing Grounds = {main_oil.min():.2f} to {main_oil.max():.2f} "
+            f"(mean {main_oil.mean():.2f}) | Max Mass Balance Error = {np.abs(mass_error).max():.3g}")
+        print(f"Oil in fishing grounds at t = {current_time:.3f}: {main_oil.mean():.4g} (ensemble mean)", end='\r')
+
+    def total_oil_mass(self) -> np.ndarray:
+        """
+        Calculates the total oil mass of every member.
+
+        Returns:
+            np.ndarray: Total oil mass in the domain of each member.
+        """
+        return self._oil @ self.triangle_areas()
+
+    def check_mass_balance(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Compares the change of total oil mass of every member since the last check with the
+        oil that left through the boundary, see Simulation.check_mass_balance.
+
+        Returns:
+            The current total oil mass and the mass balance error of each member.
+        """
+        total_mass = self.total_oil_mass()
+        mass_error = (self._previous_mass - total_mass) - self._boundary_outflow
+
+        if np.any(np.abs(mass_error) > 1e-9 * np.maximum(1.0, np.abs(total_mass))):
+            logger.warning(f"Mass is not conserved: largest mass balance error = {np.abs(mass_error).max():.3g}")
+
+        self._previous_mass = total_mass
+        self._boundary_outflow = 0.0
+        return total_mass, mass_error
+
+    @property
+    def n_members(self) -> int:
+        """Get the number of ensemble members."""
+        return len(self._oil_spill_centers)
+
+    @property
+    def oil_spill_centers(self) -> np.ndarray:
+        """Get the oil spill center of each member."""
+        return self._oil_spill_centers
+
+    @property
+    def sample_times(self) -> np.ndarray:
+        """Get the time of each sampled step."""
+        return np.array(self._sample_times)
+
+    @property
+    def fishing_ground_series(self) -> dict:
+        """Get the oil in each fishing ground by name, shape (n_samples, n_members)."""
+        return {
+            name: np.array(series).reshape(len(self._sample_times), self.n_members)
+            for name, series in self._fishing_ground_series.items()
+        }
@@ -0,0 +1,83 @@
+import numpy as np
+import logging
+
+logger = logging.getLogger(__name__)
+
+def triangle_midpoints(mesh) -> tuple:
+    """
+    Gets the midpoint of every cell and which cells are triangles.
+
+    Line cells never hold oil, so fishing grounds and monitoring zones only count triangles.
+
+    Args:
+        mesh: The computational mesh containing the cells.
+
+    Returns:
+        tuple: Midpoints of shape (n_cells, 2) and a boolean mask of the triangles.
+    """
+    from ..cell.triangle_cell import Triangle
+
+    cells = mesh.cells
+    midpoints = getattr(mesh, "midpoints", None)
+    if not isinstance(midpoints, np.ndarray):
+        midpoints = np.array([cell.midpoint for cell in cells], dtype=float).reshape(-1, 2)
+    is_triangle = np.array([isinstance(cell, Triangle) for cell in cells], dtype=bool)
+    return midpoints, is_triangle
+
+class FishingGrounds:
+    """
+    Precomputed membership of the triangles in one or more named fishing grounds.
+
+    Each fishing ground is an axis-aligned rectangle, and a triangle belongs to it if its
+    midpoint lies inside the rectangle (borders included). The membership is computed once,
+    so the oil in all fishing grounds is a single matrix-vector product with the oil array.
+
+    Attributes:
+        _names: Name of each fishing ground, in the order of the membership rows.
+        _membership: 1.0 where a cell lies in a fishing ground, shape (n_grounds, n_cells).
+    """
+    def __init__(self, mesh, fishing_grounds: dict):
+        """
+        Finds the cells inside each fishing ground.
+
+        Args:
+            mesh: The computational mesh containing the cells.
+            fishing_grounds: Rectangle [[x_min, x_max], [y_min, y_max]] of each fishing ground, by name.
+        """
+        midpoints, is_triangle = triangle_midpoints(mesh)
+
+        self._names = list(fishing_grounds)
+        self._membership = np.zeros((len(self._names), len(midpoints)))
+        for row, name in enumerate(self._names):
+            (x_min, x_max), (y_min, y_max) = fishing_grounds[name]
+            inside = (
+                (x_min <= midpoints[:, 0]) & (midpoints[:, 0] <= x_max) &
+                (y_min <= midpoints[:, 1]) & (midpoints[:, 1] <= y_max)
+            )
+            self._membership[row] = inside & is_triangle
+            logger.debug(f"Fishing ground '{name}' contains {int(self._membership[row].sum())} cells")
+
+    def oil_totals(self, oil: np.ndarray) -> dict:
+        """
+        Computes the oil in every fishing ground.
+
+        Args:
+            oil: Oil amount of each cell, indexed by cell index. An ensemble of oil states has
+                one row per member, shape (n_members, n_cells).
+
+        Returns:
+            dict: Total oil amount in each fishing ground, by name. For an ensemble, an array
+                with the oil of each member.
+        """
+        totals = self._membership @ np.asarray(oil).T
+        return dict(zip(self._names, totals.tolist() if totals.ndim == 1 else totals))
+
+    @property
+    def names(self) -> list:
+        """Get the names of the fishing grounds."""
+        return self._names
+
+    @property
+    def membership(self) -> np.ndarray:
+        """Get the membership matrix, 1.0 where a cell lies in a fishing ground."""
+        return self._membership
@@ -2,6 +2,14 @@ import numpy as np
 import os
 import logging
 from ..visualization.plotter import Animation
+from ..visualization.video_writer import VIDEO_FORMATS
+from .flux_engine import FluxEngine
+from .fishing_grounds import FishingGrounds, triangle_midpoints
+from .zones import MonitoringZones
+from .local_time_stepping import LocalTimeStepper, DEFAULT_MAX_LEVEL
+from .transport_operator import TransportOperator, ImplicitTransportOperator
+from .engine_options import ENGINES, TWO_PHASE_ENGINES, UPDATE_MODES, TIME_STEPPINGS, default_engine, validate_engine_options
+from ..io.cell_ordering import to_original_order, from_original_order
 import logging
 
 logger = logging.getLogger(__name__)
@@ -14,48 +22,188 @@ class Simulation:
         mesh: The computational mesh representing the simulation domain.
         oil_spill_center: Coordinates of the initial oil spill.
         fishing_grounds: Boundary coordinates of the fishing grounds.
-        nSteps: Total number of simulation steps.
+        named_fishing_grounds: Boundary coordinates of additional fishing grounds by name, whose
+            oil is logged next to the main fishing grounds.
+        nSteps: Total number of simulation steps. Not used with adaptive or local time stepping.
         tStart: Start time for the simulation.
         tEnd: End time for the simulation.
-        fps: Frames per second for animation output.
+        fps: Frames per second for animation output. No animation is made if None.
         results_folder: Directory where simulation results are stored.
         restart_file: File containing oil values for the intial oil spill.
         config_name: The name of active toml file.
+        oil: Oil amount of each cell, indexed by cell index. The mesh itself is not modified,
+            so one mesh can be shared by several simulations.
+        engine: Flux engine used for each step, either "object", "vectorized", "sparse" or "implicit".
+            Defaults to "object", or to "vectorized" with local time stepping, which needs its face data.
+            The sparse engine assembles the step into a sparse matrix and advances with mat-vecs,
+            the implicit engine takes backward Euler steps with a cached sparse LU factorization.
+        update_mode: Either "sequential" (cells are updated in place during the sweep) or
+            "two-phase" (all fluxes are computed from the old state before any cell is updated).
+            Defaults to "two-phase" for the vectorized, sparse and implicit engines and for a mesh with
+            renumbered cells, and "sequential" otherwise.
+        solution_format: Format of the final solution file, either "text" or "binary".
+        checkpoint_frequency: Number of steps between oil states streamed to the checkpoint
+            store in results_folder/checkpoints. No checkpoints are written if None.
+        video_format: Format of the animation, "gif", "mp4" or "webm". Frames are streamed to
+            the video file as they are rendered.
+        write_frequency: Number of steps between sampled steps. Frames, log lines and the
+            fishing ground check are only made on sampled steps and the last step.
+        render_workers: Number of background processes rendering frames while the simulation
+            continues, 0 renders the frames in the simulation process.
+        zones: Polygon vertices of the monitoring zones by name. The oil in every zone is
+            written to results_folder/zones.csv on every logged step.
+        time_stepping: "fixed" takes nSteps steps of (tEnd - tStart) / nSteps, "adaptive" takes
+            the largest stable steps from tStart to tEnd, "local" takes macro steps in which
+            every cell sub-cycles with a power-of-two fraction of the macro step.
+        cfl: Fraction of the largest stable time step taken in adaptive and local mode.
+        max_level: Highest sub-cycling level in local mode, the finest cells take 2**max_level
+            steps per macro step.
+        active_threshold: If provided, the vectorized engine only evaluates the faces touching
+            a cell with more oil than this threshold. No faces are skipped if None.
+        velocity: Velocity provider evaluated at the cell midpoints, replacing the velocity fields
+            of the cells. A time-dependent provider is evaluated again at the start of every step
+            in which its time index changes, and the face velocities are reused in between.
+        sparse_jump: How the sparse engine applies the steps between two outputs, "matvec" (one
+            product per step) or "squaring" (one product with a cached matrix power).
     """
+    ENGINES = ENGINES
+    TWO_PHASE_ENGINES = TWO_PHASE_ENGINES
+    UPDATE_MODES = UPDATE_MODES
+    SOLUTION_FORMATS = ("text", "binary")
+    MAIN_FISHING_GROUNDS = "borders"
+    TIME_STEPPINGS = TIME_STEPPINGS
+    ACTIVE_REGION_STEPS = 8
+
     def __init__(
         self, mesh, oil_spill_center: tuple, fishing_grounds: tuple,
         nSteps: int, tStart: float, tEnd: float, fps: int,
-        results_folder: str, restart_file: str, config_name: str):
+        results_folder: str, restart_file: str, config_name: str,
+        engine: str = None, update_mode: str = None, solution_format: str = "text",
+        checkpoint_frequency: int = None, video_format: str = "gif", write_frequency: int = 1,
+        render_workers: int = 0, named_fishing_grounds: dict = None, zones: dict = None,
+        time_stepping: str = "fixed", cfl: float = 0.9, max_level: int = DEFAULT_MAX_LEVEL,
+        active_threshold: float = None, velocity=None, sparse_jump: str = "matvec"):
         
         # Validate mesh (Issue 1)
         if mesh is None:
             raise ValueError("Mesh cannot be None for simulation.")
         
+        # Validate the engine, update mode, time stepping and how they are combined
+        if engine is None:
+            engine = default_engine(time_stepping)
+            if time_stepping == "local":
+                logger.info(f"Local time stepping uses the {engine} engine")
+        update_mode = validate_engine_options(
+            engine, update_mode, time_stepping, sparse_jump, active_threshold,
+            reordered=isinstance(getattr(mesh, "cell_order", None), np.ndarray))
+        if not 0 < cfl <= 1:
+            raise ValueError("CFL number must be in (0, 1].")
+
         # Validate nSteps (Issue 2)
-        if nSteps < 0:
+        if nSteps is None and time_stepping == "fixed":
+            raise ValueError("Number of steps (nSteps) is required for fixed time stepping.")
+        if nSteps is not None and nSteps < 0:
             raise ValueError("Number of steps (nSteps) cannot be negative.")
         
         # Validate tStart and tEnd (Issue 3)
         if tStart > tEnd:
             raise ValueError("Start time (tStart) cannot be greater than end time (tEnd).")
+
+        # Validate solution format
+        if solution_format not in self.SOLUTION_FORMATS:
+            raise ValueError(
+                f"Unknown solution format: {solution_format}. Supported formats are: {list(self.SOLUTION_FORMATS)}")
+
+        # Validate checkpoint frequency
+        if checkpoint_frequency is not None and checkpoint_frequency < 1:
+            raise ValueError("Checkpoint frequency must be at least 1.")
+
+        # Validate write frequency
+        if write_frequency < 1:
+            raise ValueError("Write frequency must be at least 1.")
+
+        # Validate render workers
+        if render_workers < 0:
+            raise ValueError("Number of render workers cannot be negative.")
+
+        # Validate video format
+        if video_format not in VIDEO_FORMATS:
+            raise ValueError(f"Unknown video format: {video_format}. Supported formats are: {list(VIDEO_FORMATS)}")
         
         # If all checks pass, initialize the simulation attributes
         self._mesh = mesh
         self._oil_spill_center = oil_spill_center
         self._fishing_grounds = fishing_grounds
+        self._named_fishing_grounds = dict(named_fishing_grounds or {})
+        self._zones = dict(zones or {})
         self._nSteps = nSteps
         self._tStart = tStart
         self._tEnd = tEnd
         self._fps = fps
-        self._delta_t = (self._tEnd - self._tStart) / self._nSteps
+        self._time_stepping = time_stepping
+        self._cfl = cfl
+        if time_stepping == "fixed":
+            self._delta_t = (self._tEnd - self._tStart) / self._nSteps
+        else:
+            self._delta_t = self._tEnd - self._tStart  # Replaced by the stable time step of every step
+        self._current_time = self._tStart  # Time reached by the current step
+        self._steps_taken = 0
+        self._active_threshold = active_threshold
+        self._active_engine = None  # Flux engine restricted to the faces of the active region
+        self._active_steps_left = 0  # Steps until the active region is found again
+        self._faces_evaluated = 0
+        self._sparse_jump = sparse_jump
+        self._transport_operator = None  # Step operator of the sparse or implicit engine, built on the first step
+        self._pending_steps = 0  # Steps of the sparse or implicit engine not yet applied to the oil
         self._results_folder = results_folder
         self._restart_file = restart_file
         self._config_name = config_name
+        self._engine = engine
+        self._update_mode = update_mode
+        self._solution_format = solution_format
+        self._checkpoint_frequency = checkpoint_frequency
+        self._video_format = video_format
+        self._write_frequency = write_frequency
+        self._render_workers = render_workers
+        self._boundary_outflow = 0.0  # Oil mass that left through the boundary since the last mass check
+        self._previous_mass = None
+        self._final_oil_in_fishing_grounds = None
+        self._oil = np.zeros(len(self._mesh.cells))
+        self._triangle_areas = None  # Area of each triangle, 0 for other cells, built on the first mass check
+        self._fishing_ground_oil = {}
+        self._fishing_ground_index = None
+        self._zone_index = None
+        self._zone_series = None
+        self._zone_oil = {}
+
+        # A velocity provider replaces the velocity fields of the cells, evaluated at all midpoints at once
+        self._velocity = velocity
+        self._velocity_index = None  # Time index of the current velocities
+        self._velocities = None
+        self._velocity_refreshes = 0
+        self._midpoints = None
+        if self._velocity is not None:
+            self._midpoints, _ = triangle_midpoints(self._mesh)
+            self._velocity_index = self._velocity.time_index(self._tStart)
+            self._velocities = self.evaluate_velocities(self._tStart)
 
         # Initialize the oil spill (this method is assumed to be already defined elsewhere in the class)
         self.initialize_oil_spill()
 
-
+        # The vectorized engine gathers the face data once for the whole run, adaptive and local
+        # time stepping use the same face data to find the stable time steps
+        self._flux_engine = None
+        self._local_stepper = None
+        self._max_level = max_level
+        self._stable_delta_t = None
+        if self._engine != "object" or self._time_stepping != "fixed":
+            self._flux_engine = FluxEngine(self._mesh, self._delta_t, self._velocities)
+        if self._time_stepping == "adaptive":
+            self._stable_delta_t = self._cfl * self._flux_engine.max_stable_time_step()
+            logger.info(f"Adaptive time stepping with CFL = {self._cfl}, stable time step = {self._stable_delta_t:.6g}")
+        elif self._time_stepping == "local":
+            self._local_stepper = LocalTimeStepper(self._flux_engine, self._cfl, self._max_level)
+            self._stable_delta_t = self._local_stepper.macro_delta_t
 
     def initialize_oil_spill(self):
         """
@@ -64,57 +212,159 @@ class Simulation:
         # Use gaussian function if tStart = 0, and there's no restart file
         if self._restart_file is None:
             self.gaussian_based_oil_spill()
+        elif os.path.isdir(self._restart_file): # Use the checkpoint saved at tStart
+            from ..io.checkpoint_store import CheckpointStore
+            oil = CheckpointStore(self._restart_file).oil_at_time(self._tStart)
+            if len(oil) != len(self._mesh.cells):
+                raise ValueError(
+                    f"Checkpoints in {self._restart_file} hold {len(oil)} cells, "
+                    f"but the mesh has {len(self._mesh.cells)} cells.")
+            self._oil = from_original_order(self._mesh, oil)
         else: # Use oil values from solution file
-            from ..io.solution_reader import initialize_oil_spill
-            initialize_oil_spill(self._mesh, self._restart_file)
+            from ..io.solution_reader import read_oil_amounts, read_solution_metadata
+            self._oil = from_original_order(self._mesh, read_oil_amounts(self._restart_file, len(self._mesh.cells)))
+            restart_time = read_solution_metadata(self._restart_file)["time"]
+            if restart_time is not None and not np.isclose(restart_time, self._tStart):
+                logger.warning(
+                    f"Restart file {self._restart_file} was written at t = {restart_time}, "
+                    f"but the simulation starts at tStart = {self._tStart}")
 
     def gaussian_based_oil_spill(self):
         """
         Distributes the initial oil amount across the mesh based on proximity to the spill center.
+        The oil is computed from the cell midpoints, so the cells of the shared mesh are not modified.
         """
         print("Initializing oil spill")
-        from ..cell.triangle_cell import Triangle
-        for cell in self._mesh.cells:
-            if isinstance(cell, Triangle):
-                cell.calculate_oil_amount(self._oil_spill_center)
+        self._oil = self.gaussian_oil([self._oil_spill_center])[0]
+
+    def gaussian_oil(self, oil_spill_centers) -> np.ndarray:
+        """
+        Evaluates the gaussian of Triangle.calculate_oil_amount for all triangles at once.
+
+        Args:
+            oil_spill_centers: Oil spill centers [x, y].
+
+        Returns:
+            np.ndarray: Oil amount of each cell for each center, shape (n_centers, n_cells). Cells
+                that are not triangles hold no oil.
+        """
+        midpoints, is_triangle = triangle_midpoints(self._mesh)
+        centers = np.asarray(oil_spill_centers, dtype=float).reshape(-1, 2)
+        squared_distance = (
+            (midpoints[:, 0] - centers[:, 0, None]) ** 2 + (midpoints[:, 1] - centers[:, 1, None]) ** 2)
+        return np.exp(-squared_distance / 0.01) * is_triangle
     
-    def run_simulation(self):
+    def run_simulation(self) -> float:
         """
         Executes the simulation by iterating over time steps and rendering animation frames.
+
+        Returns:
+            Total oil in the fishing grounds at the final time step.
         """
-        oil_animation = Animation(self._mesh, self._fps, self._fishing_grounds, self._results_folder)
+        oil_animation = Animation(
+            self._mesh, self._fps, self._fishing_grounds, self._results_folder,
+            video_format=self._video_format, stream=True, render_workers=self._render_workers)
+
+        self._previous_mass = self.total_oil_mass()
+        logger.info(f"Initial total oil mass = {self._previous_mass:.6g} | Update mode = {self._update_mode}")
 
         # Render the initial frame if write_frequency/fps is provided.
         if self._fps is not None:
             oil_animation.render_frame(
                 time_val = self._tStart, 
-                total_oil = self.check_fishing_grounds(0))
+                total_oil = self.check_fishing_grounds(0),
+                oil_amounts = self._oil)
+
+        # Stream the oil state to the checkpoint store if a checkpoint frequency is provided
+        checkpoints = None
+        if self._checkpoint_frequency is not None:
+            from ..io.checkpoint_store import CheckpointWriter
+            checkpoints = CheckpointWriter(os.path.join(self._results_folder, "checkpoints"), len(self._oil))
+
+        # Stream the oil in each monitoring zone to a time series if zones are provided
+        if self._zones:
+            from ..io.zone_series import ZoneSeriesWriter
+            self._zone_series = ZoneSeriesWriter(
+                os.path.join(self._results_folder, "zones.csv"), list(self._zones))
 
         # Calculate new oil spread for each step
-        for n in range(self._nSteps+1):
-            self.oil_movement()
-            # Frames will be rendered if fps is defined.
-            self.render_simulation_step(oil_animation, n)
+        for n in self.time_steps():
+            checkpoint = checkpoints is not None and (n % self._checkpoint_frequency == 0 or self.is_last_step(n))
+            # The oil is only needed on sampled and checkpointed steps
+            self.oil_movement(defer=not (checkpoint or self.is_sampled_step(n)))
+            # Frames will be rendered if fps is defined, only on sampled steps.
+            if self.is_sampled_step(n):
+                self.render_simulation_step(oil_animation, n)
+            if checkpoint:
+                checkpoints.append(n, self._current_time, to_original_order(self._mesh, self._oil))
+        logger.info(f"Time steps taken: {self._steps_taken} ({self._time_stepping} time stepping)")
+        if self._local_stepper is not None:
+            logger.info(f"Face fluxes evaluated: {self._faces_evaluated + self._local_stepper.flux_evaluations}")
+        elif self._active_threshold is not None:
+            logger.info(
+                f"Face fluxes evaluated: {self._faces_evaluated} of "
+                f"{self._steps_taken * self._flux_engine.n_faces} in full sweeps")
+        if self._velocity is not None and self._velocity.time_dependent:
+            logger.info(f"Velocity field refreshes: {self._velocity_refreshes}")
+
+        if checkpoints is not None:
+            checkpoints.close()
+        if self._velocity is not None:
+            self._velocity.close()
+        if self._zone_series is not None:
+            self._zone_series.close()
 
         # Render videoanimation with generated frames if fps is defined.
         if self._fps is not None:
-            oil_animation.create_gif()
+            oil_animation.finish_video()
+
+        return self._final_oil_in_fishing_grounds
+
+    def oil_movement(self, defer: bool = False):
+        """
+        Calculates and updates the oil distribution across the mesh for one time step,
+        using the selected engine, or the local time stepper in local mode.
+
+        Args:
+            defer: Allow the sparse engine to postpone the step until the oil is needed, so
+                that the steps between two outputs are applied together.
+        """
+        if self._local_stepper is not None:
+            self._boundary_outflow += self._local_stepper.step(self._oil, self._delta_t)
+        elif self._engine in ("sparse", "implicit"):
+            self._pending_steps += 1
+            if not defer:
+                self.apply_pending_steps()
+        elif self._engine == "vectorized":
+            self.vectorized_oil_movement()
+        else:
+            self.object_oil_movement()
 
-    def oil_movement(self):
+    def object_oil_movement(self):
         """
-        Calculates and updates the oil distribution across the mesh for one time step.
+        Calculates and updates the oil distribution by visiting every triangle and its neighbours.
+
+        In "sequential" mode cells are updated in place, so cells later in the sweep see the
+        updated oil amounts. In "two-phase" mode the fluxes of every cell are buffered and only
+        applied once all of them have been computed from the old state.
         """
         from ..cell.triangle_cell import Triangle
+        two_phase = self._update_mode == "two-phase"
+        pending_updates = []
+        # Indexing a Python list is much faster than indexing numpy scalars in the face loop
+        oil = self._oil.tolist()
+        velocities = self._velocities
+
         for cell in self._mesh.cells:
             oil_flux = []
             if isinstance(cell, Triangle):
                 for i, ngh in enumerate(cell.neighbours):
-                    v_i = np.array(cell.velocity_field)
+                    v_i = np.array(cell.velocity_field) if velocities is None else velocities[cell.index]
                     delta_t = self._delta_t
                     A_i = cell.area
-                    u_i = cell.oil_amount
-                    u_ngh = ngh.oil_amount
-                    v_ngh = np.array(ngh.velocity_field)
+                    u_i = oil[cell.index]
+                    u_ngh = oil[ngh.index]
+                    v_ngh = np.array(ngh.velocity_field) if velocities is None else velocities[ngh.index]
                     v_avg = 0.5 * (v_i + v_ngh)
 
                     v_vector = cell.outward_normals[i] * np.linalg.norm(cell.edge_vectors[i])
@@ -123,8 +373,193 @@ class Simulation:
                     flux = -((delta_t / A_i) * self.g(u_i, u_ngh, v_vector, v_avg))
                     oil_flux.append(flux)
 
+                    # Oil passing to a non-triangle neighbour leaves the domain
+                    if not isinstance(ngh, Triangle):
+                        self._boundary_outflow -= flux * A_i
+
                 # Update the cell's oil amount after processing all facets
-                cell.update_oil_amount(oil_flux)
+                if two_phase:
+                    pending_updates.append((cell.index, sum(oil_flux)))
+                else:
+                    oil[cell.index] += sum(oil_flux)
+
+        for index, oil_difference in pending_updates:
+            oil[index] += oil_difference
+        self._oil[:] = oil
+
+    def apply_pending_steps(self):
+        """
+        Applies the steps postponed by the sparse or implicit engine, with the operator of the
+        current time step and velocities. The operator is assembled (and for the implicit engine
+        factorized) again only after either of them changes.
+        """
+        if self._pending_steps == 0:
+            return
+        if self._transport_operator is None:
+            operator_class = ImplicitTransportOperator if self._engine == "implicit" else TransportOperator
+            self._transport_operator = operator_class(self._flux_engine)
+        # The operator takes the members of an ensemble as columns
+        oil, outflow = self._transport_operator.advance(self._oil.T, self._pending_steps, self._sparse_jump)
+        self._oil[:] = oil.T
+        self._boundary_outflow += outflow
+        self._pending_steps = 0
+
+    def vectorized_oil_movement(self):
+        """
+        Calculates and updates the oil distribution with the vectorized flux engine.
+        All fluxes are computed from the oil amounts at the start of the step.
+
+        With an active threshold, only the faces touching the active region are evaluated:
+        the cells with more oil than the threshold, grown by ACTIVE_REGION_STEPS layers of
+        neighbours. The region is found again every ACTIVE_REGION_STEPS steps, so it follows
+        the slick as it spreads.
+        """
+        engine = self._flux_engine
+        if self._active_threshold is not None:
+            # Oil spreads at most one cell per step, so a region grown by k layers holds all
+            # fluxes of the next k steps
+            if self._active_steps_left == 0:
+                faces = engine.active_faces(self._oil, self._active_threshold, self.ACTIVE_REGION_STEPS)
+                self._active_engine = engine.restrict(faces)
+                self._active_steps_left = self.ACTIVE_REGION_STEPS
+            self._active_steps_left -= 1
+            engine = self._active_engine
+            self._faces_evaluated += engine.n_faces
+
+        fluxes = engine.face_fluxes(self._oil)
+        self._oil += engine.oil_change(self._oil, fluxes)
+        self._boundary_outflow += engine.boundary_outflow(fluxes)
+
+    def time_steps(self):
+        """
+        Yields the index of every step, after setting its time step and the time it reaches.
+
+        Fixed time stepping takes nSteps + 1 steps of equal length. Adaptive time stepping takes
+        the largest stable steps, shortening the last one so that it ends exactly at tEnd. Local
+        time stepping does the same with macro steps. The velocities of a time-dependent velocity
+        provider are refreshed before each step, see refresh_velocities.
+
+        Yields:
+            Index of the step.
+        """
+        if self._time_stepping == "fixed":
+            for n in range(self._nSteps + 1):
+                self._current_time = self._tStart + (n * self._delta_t)
+                self.refresh_velocities(self._current_time)
+                self._steps_taken = n + 1
+                yield n
+            return
+
+        n = 0
+        self._current_time = self._tStart
+        while True:
+            self.refresh_velocities(self._current_time)
+            remaining = self._tEnd - self._current_time
+            if self._stable_delta_t >= remaining:
+                self.set_time_step(remaining)
+                self._current_time = self._tEnd
+            else:
+                self.set_time_step(self._stable_delta_t)
+                self._current_time += self._stable_delta_t
+            self._steps_taken = n + 1
+            yield n
+            if self._current_time >= self._tEnd:
+                return
+            n += 1
+
+    def refresh_velocities(self, time_val: float) -> bool:
+        """
+        Evaluates a time-dependent velocity provider again if its time index changed.
+
+        The face velocities of the flux engine are recomputed, and so are the stable time step
+        of adaptive time stepping, the levels of local time stepping and the active region.
+
+        Args:
+            time_val: Time at the start of the next step.
+
+        Returns:
+            True if the velocities were refreshed.
+        """
+        if self._velocity is None or not self._velocity.time_dependent:
+            return False
+        index = self._velocity.time_index(time_val)
+        if index == self._velocity_index:
+            return False
+
+        self.apply_pending_steps()
+        self._transport_operator = None
+        self._velocity_index = index
+        self._velocities = self.evaluate_velocities(time_val)
+        self._velocity_refreshes += 1
+        if self._flux_engine is not None:
+            self._flux_engine.set_velocities(self._velocities)
+            self._active_steps_left = 0  # The active engine holds the old face flows
+        if self._time_stepping == "adaptive":
+            self._stable_delta_t = self._cfl * self._flux_engine.max_stable_time_step()
+        elif self._time_stepping == "local":
+            self._faces_evaluated += self._local_stepper.flux_evaluations
+            self._local_stepper = LocalTimeStepper(self._flux_engine, self._cfl, self._max_level, logging.DEBUG)
+            self._stable_delta_t = self._local_stepper.macro_delta_t
+        logger.debug(f"Velocity field refreshed at t = {time_val:.6g} (time index {index})")
+        return True
+
+    def evaluate_velocities(self, time_val: float) -> np.ndarray:
+        """
+        Evaluates the velocity provider at the cell midpoints.
+
+        Args:
+            time_val: Simulation time.
+
+        Returns:
+            np.ndarray: Velocity of each cell, indexed by cell index.
+        """
+        velocities = self._velocity.velocities(self._midpoints, time_val)
+        if self._velocity.cell_values:
+            # Per-cell values follow the numbering of the mesh file
+            velocities = from_original_order(self._mesh, velocities)
+        return velocities
+
+    def set_time_step(self, delta_t: float):
+        """
+        Sets the time step of the next step for both engines.
+
+        Args:
+            delta_t: Time step.
+        """
+        if self._transport_operator is not None and self._transport_operator.delta_t != delta_t:
+            self.apply_pending_steps()
+            self._transport_operator = None
+        self._delta_t = delta_t
+        if self._flux_engine is not None:
+            self._flux_engine.set_time_step(delta_t)
+        if self._active_engine is not None:
+            self._active_engine.set_time_step(delta_t)
+
+    def is_last_step(self, n: int) -> bool:
+        """
+        Checks if a step is the last step of the simulation.
+
+        Args:
+            n: Current time step index.
+
+        Returns:
+            True if the step is the last step.
+        """
+        if self._time_stepping != "fixed":
+            return self._current_time >= self._tEnd
+        return n == self._nSteps
+
+    def is_sampled_step(self, n: int) -> bool:
+        """
+        Checks if a step is sampled for output, i.e. every write_frequency-th step and the last step.
+
+        Args:
+            n: Current time step index.
+
+        Returns:
+            True if the step is rendered, logged and checked for oil in the fishing grounds.
+        """
+        return n % self._write_frequency == 0 or self.is_last_step(n)
 
     def render_simulation_step(self, oil_animation: Animation, n: int):
         """
@@ -135,52 +570,150 @@ class Simulation:
             oil_animation: The Animation object handling rendering.
             n: Current time step index.
         """
-        current_time = self._tStart + (n * self._delta_t)
+        current_time = self._current_time
         total_oil_in_fishing_grounds = self.check_fishing_grounds(n)
-        logger.info(f"Time = {current_time:.3f} | Oil in Fishing Grounds = {total_oil_in_fishing_grounds:.2f}")
+        total_mass, mass_error = self.check_mass_balance()
+        logger.info(
+            f"Time = {current_time:.3f} | Oil in Fishing Grounds = {total_oil_in_fishing_grounds:.2f} | "
+            f"Total Oil Mass = {total_mass:.6g} | Mass Balance Error = {mass_error:.3g}" +
+            (f" | Active Faces = {self._active_engine.n_faces}/{self._flux_engine.n_faces}" if self._active_engine is not None else ""))
+        if self._named_fishing_grounds:
+            logger.info(f"Time = {current_time:.3f} | " + " | ".join(
+                f"Oil in {name} = {self._fishing_ground_oil[name]:.2f}" for name in self._named_fishing_grounds))
+        if self._zones:
+            zone_oil = self.check_zones()
+            if self._zone_series is not None:
+                self._zone_series.append(current_time, zone_oil)
 
         # Render next frame is fps is provided.
         if self._fps is not None:
             oil_animation.render_frame(
                 time_val = current_time, 
-                total_oil = total_oil_in_fishing_grounds)
+                total_oil = total_oil_in_fishing_grounds,
+                oil_amounts = self._oil)
 
         # Final solution will always be stored
-        if n == (self._nSteps):
+        if self.is_last_step(n):
+            self._final_oil_in_fishing_grounds = total_oil_in_fishing_grounds
             # Store image of final plot
             oil_animation.make_plot(
                 time_val = current_time, 
-                total_oil = total_oil_in_fishing_grounds)
+                total_oil = total_oil_in_fishing_grounds,
+                oil_amounts = self._oil)
             # Store oil amount for each cell as solution / restart file
             from ..io.solution_writer import write_solution
             write_solution(
                 mesh = self._mesh,
                 time_val = current_time, # this value tells the user what to use as tStart
                 total_oil = total_oil_in_fishing_grounds,
-                config_name = self._config_name)
+                config_name = self._config_name,
+                oil_amounts = self._oil,
+                solution_format = self._solution_format)
 
     def check_fishing_grounds(self, n: int) -> float:
         """
         Calculates the total amount of oil within the fishing grounds at a given time step.
 
+        The oil in the additional named fishing grounds is computed in the same reduction and
+        is available through fishing_ground_oil.
+
         Args:
             n: Current time step index.
 
         Returns:
             Total oil in the fishing grounds.
         """
-        total_oil = 0
-        for cell in self._mesh.cells:
-            x, y = cell.midpoint
-            x_min, x_max = self._fishing_grounds[0]
-            y_min, y_max = self._fishing_grounds[1]
+        if self._fishing_ground_index is None:
+            # The cells inside each fishing ground are found once, the main fishing grounds come first
+            self._fishing_ground_index = FishingGrounds(
+                self._mesh, {self.MAIN_FISHING_GROUNDS: self._fishing_grounds, **self._named_fishing_grounds})
 
-            if x_min <= x <= x_max and y_min <= y <= y_max:
-                total_oil += cell.oil_amount
+        self._fishing_ground_oil = self._fishing_ground_index.oil_totals(self._oil)
+        total_oil = self._fishing_ground_oil[self.MAIN_FISHING_GROUNDS]
 
-        print(f"Oil in fishing grounds at t = {self._tStart + (n * self._delta_t):.3f}: {total_oil:.4g}", end='\r')
+        print(f"Oil in fishing grounds at t = {self._current_time:.3f}: {total_oil:.4g}", end='\r')
         return total_oil
 
+    def total_oil_mass(self) -> float:
+        """
+        Calculates the total oil mass in the domain, i.e. the oil amount of each triangle times its area.
+
+        Returns:
+            Total oil mass in the domain.
+        """
+        return float(self._oil @ self.triangle_areas())
+
+    def triangle_areas(self) -> np.ndarray:
+        """
+        Gets the area of each triangle, built on the first call.
+
+        Returns:
+            np.ndarray: Area of each triangle, 0 for other cells, indexed by cell index.
+        """
+        if self._triangle_areas is None:
+            from ..cell.triangle_cell import Triangle
+            self._triangle_areas = np.array(
+                [cell.area if isinstance(cell, Triangle) else 0.0 for cell in self._mesh.cells], dtype=float)
+        return self._triangle_areas
+
+    def check_zones(self) -> np.ndarray:
+        """
+        Calculates the total amount of oil within each monitoring zone.
+
+        Returns:
+            Total oil in each zone, in the order the zones were given.
+        """
+        if self._zone_index is None:
+            # The triangles inside each zone are found once with a spatial index
+            self._zone_index = MonitoringZones(self._mesh, self._zones)
+
+        zone_oil = self._zone_index.oil_totals(self._oil)
+        self._zone_oil = dict(zip(self._zone_index.names, zone_oil.tolist()))
+        return zone_oil
+
+    def check_mass_balance(self) -> tuple[float, float]:
+        """
+        Compares the change of total oil mass since the last check with the oil that left through the boundary.
+
+        In "two-phase" mode the upwind scheme conserves mass, so the error should stay at round-off level
+        and a warning is logged otherwise. In "sequential" mode the error shows how much mass the in-place
+        updates create or destroy.
+
+        Returns:
+            The current total oil mass and the mass balance error since the last check.
+        """
+        total_mass = self.total_oil_mass()
+        if self._previous_mass is None:
+            self._previous_mass = total_mass
+        mass_error = (self._previous_mass - total_mass) - self._boundary_outflow
+
+        if self._update_mode == "two-phase" and abs(mass_error) > 1e-9 * max(1.0, abs(total_mass)):
+            logger.warning(f"Mass is not conserved: mass balance error = {mass_error:.3g}")
+
+        self._previous_mass = total_mass
+        self._boundary_outflow = 0.0
+        return total_mass, mass_error
+
+    @property
+    def fishing_ground_oil(self) -> dict:
+        """Get the oil in each fishing ground at the last check, by name. The main fishing grounds are named "borders"."""
+        return self._fishing_ground_oil
+
+    @property
+    def steps_taken(self) -> int:
+        """Get the number of time steps taken so far."""
+        return self._steps_taken
+
+    @property
+    def zone_oil(self) -> dict:
+        """Get the oil in each monitoring zone at the last check, by name."""
+        return self._zone_oil
+
+    @property
+    def oil_amounts(self) -> np.ndarray:
+        """Get the oil amount of each cell, indexed by cell index."""
+        return self._oil
+
     def g(self, u_i: float, u_ngh: float, v_vector: np.ndarray, v_avg: np.ndarray) -> float:
         """
         Computes the flux function based on oil amounts and velocity fields.
@@ -0,0 +1,487 @@
+import ast
+import math
+import numpy as np
+import logging
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# Components of the velocity field used when no velocity provider is configured
+DEFAULT_U = "y - 0.2*x"
+DEFAULT_V = "-x"
+
+# Re-evaluations of velocity snapshots per interval between two snapshots if no refresh interval is given
+DEFAULT_SNAPSHOT_REFRESHES = 10
+
+# Supported values for the 'velocity.type' config key
+VELOCITY_TYPES = ("analytic", "gridded", "snapshots")
+
+# Names available in analytic velocity expressions, besides the coordinates x, y and the time t
+EXPRESSION_FUNCTIONS = {
+    "sin": np.sin, "cos": np.cos, "tan": np.tan, "exp": np.exp, "log": np.log,
+    "sqrt": np.sqrt, "abs": np.abs, "arctan2": np.arctan2, "pi": np.pi
+}
+
+# Coordinates and time available in analytic velocity expressions
+EXPRESSION_VARIABLES = ("x", "y", "t")
+
+# Syntax allowed in analytic velocity expressions, besides names, numbers and calls of the functions
+EXPRESSION_NODES = (ast.Expression, ast.BinOp, ast.UnaryOp, ast.operator, ast.unaryop, ast.Load)
+
+def parse_expression(expression: str, component: str) -> ast.Expression:
+    """
+    Parses an analytic velocity expression and checks every node of its syntax tree.
+
+    Only numbers, the variables x, y and t, the names of EXPRESSION_FUNCTIONS, arithmetic
+    operators and calls of the functions are allowed. Attributes, subscripts, lambdas and
+    comprehensions are rejected, so the expression cannot reach other objects through eval.
+
+    Args:
+        expression: Source of the expression.
+        component: Name of the velocity component, used in error messages.
+
+    Returns:
+        ast.Expression: The syntax tree of the expression.
+
+    Raises:
+        ValueError: If the expression cannot be parsed, uses unknown names or unsupported syntax.
+    """
+    try:
+        tree = ast.parse(str(expression), mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid velocity expression {component} = '{expression}': {e}")
+
+    functions = {name for name, value in EXPRESSION_FUNCTIONS.items() if callable(value)}
+    unknown = {
+        node.id for node in ast.walk(tree)
+        if isinstance(node, ast.Name) and node.id not in EXPRESSION_VARIABLES and node.id not in EXPRESSION_FUNCTIONS
+    }
+    if unknown:
+        raise ValueError(f"Unknown names in velocity expression {component} = '{expression}': {sorted(unknown)}")
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name):
+            continue
+        if isinstance(node, ast.Constant):
+            if isinstance(node.value, bool) or not isinstance(node.value, (int, float)):
+                raise ValueError(f"Velocity expression {component} = '{expression}' may only contain numbers as constants.")
+        elif isinstance(node, ast.Call):
+            if not isinstance(node.func, ast.Name) or node.func.id not in functions or node.keywords:
+                raise ValueError(
+                    f"Velocity expression {component} = '{expression}' may only call the functions {sorted(functions)}.")
+        elif not isinstance(node, EXPRESSION_NODES):
+            raise ValueError(
+                f"Unsupported syntax in velocity expression {component} = '{expression}': {type(node).__name__}")
+    return tree
+
+class VelocityProvider(ABC):
+    """
+    Source of the velocity field, evaluated at many points at once.
+
+    The velocities of a time-dependent provider only change when time_index changes, so a
+    simulation refreshes its face velocities only at those times. Piecewise constant fields
+    return the index of the time interval, fields changing continuously return the index of
+    the interval between two re-evaluations.
+    """
+    @abstractmethod
+    def velocities(self, points: np.ndarray, time_val: float = 0.0) -> np.ndarray:
+        """
+        Evaluates the velocity field.
+
+        Args:
+            points: Coordinates of the points, shape (n_points, 2).
+            time_val: Simulation time.
+
+        Returns:
+            np.ndarray: Velocity at each point, shape (n_points, 2).
+        """
+
+    def time_index(self, time_val: float) -> int:
+        """
+        Gets the index of the time interval in which the velocities are constant.
+
+        Args:
+            time_val: Simulation time.
+
+        Returns:
+            int: Index of the time interval, always 0 for steady fields.
+        """
+        return 0
+
+    def close(self) -> None:
+        """
+        Releases resources held between evaluations, such as background threads.
+        """
+
+    @property
+    def time_dependent(self) -> bool:
+        """Check if the velocities change with time."""
+        return False
+
+    @property
+    def cell_values(self) -> bool:
+        """Check if the velocities are stored per cell in the order of the mesh file."""
+        return False
+
+class AnalyticVelocity(VelocityProvider):
+    """
+    Velocity field given by two expressions in x, y and t, evaluated on whole coordinate arrays.
+
+    Attributes:
+        _expressions: Source of the u and v expressions.
+        _codes: Compiled u and v expressions.
+        _time_dependent: True if an expression uses t.
+        _refresh_interval: Length of the time intervals in which a time-dependent field is constant.
+    """
+    def __init__(self, u: str = DEFAULT_U, v: str = DEFAULT_V, refresh_interval: float = None):
+        """
+        Compiles the expressions of the velocity components.
+
+        Args:
+            u: Expression of the x-component, e.g. "y - 0.2*x".
+            v: Expression of the y-component, e.g. "-x".
+            refresh_interval: Time between re-evaluations of a time-dependent field.
+
+        Raises:
+            ValueError: If an expression cannot be compiled or uses unknown names, or if a
+                time-dependent field has no positive refresh interval.
+        """
+        self._expressions = (u, v)
+        self._codes = []
+        names = set()
+        for component, expression in zip("uv", self._expressions):
+            tree = parse_expression(expression, component)
+            self._codes.append(compile(tree, f"<velocity {component}>", "eval"))
+            names.update(node.id for node in ast.walk(tree) if isinstance(node, ast.Name))
+
+        self._time_dependent = "t" in names
+        if self._time_dependent and (refresh_interval is None or refresh_interval <= 0):
+            raise ValueError("A time-dependent velocity expression requires a positive refresh interval.")
+        self._refresh_interval = refresh_interval
+
+    def velocities(self, points: np.ndarray, time_val: float = 0.0) -> np.ndarray:
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        namespace = {"x": points[:, 0], "y": points[:, 1], "t": time_val, **EXPRESSION_FUNCTIONS}
+        result = np.empty((len(points), 2))
+        for column, code in enumerate(self._codes):
+            # Constant expressions are broadcast to every point
+            result[:, column] = eval(code, {"__builtins__": {}}, namespace)
+        return result
+
+    def time_index(self, time_val: float) -> int:
+        if not self._time_dependent:
+            return 0
+        return math.floor(time_val / self._refresh_interval)
+
+    @property
+    def time_dependent(self) -> bool:
+        return self._time_dependent
+
+    @property
+    def expressions(self) -> tuple[str, str]:
+        """Get the expressions of the u and v components."""
+        return self._expressions
+
+class GriddedVelocity(VelocityProvider):
+    """
+    Velocity field sampled on a rectilinear grid, interpolated bilinearly at the points.
+
+    The grid is read from an .npz file with the arrays x (nx,) and y (ny,), the grid lines in
+    increasing order, and u and v of shape (ny, nx) for a steady field. A time-dependent field
+    adds the snapshot times t (nt,) in increasing order, with u and v of shape (nt, ny, nx), and
+    uses the latest snapshot at or before the simulation time. Points outside the grid take the
+    velocity of the nearest grid edge.
+
+    Attributes:
+        _x: X-coordinates of the grid lines.
+        _y: Y-coordinates of the grid lines.
+        _u: X-component on the grid, shape (nt, ny, nx).
+        _v: Y-component on the grid, shape (nt, ny, nx).
+        _times: Time of each snapshot, None for a steady field.
+    """
+    def __init__(self, file_name: str):
+        """
+        Loads the gridded velocity field.
+
+        Args:
+            file_name: Path to the .npz file.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If arrays are missing or their shapes do not match.
+        """
+        with np.load(file_name) as data:
+            missing = {"x", "y", "u", "v"} - set(data.files)
+            if missing:
+                raise ValueError(f"Gridded velocity file {file_name} is missing the arrays {sorted(missing)}.")
+            self._x = np.asarray(data["x"], dtype=float)
+            self._y = np.asarray(data["y"], dtype=float)
+            u = np.asarray(data["u"], dtype=float)
+            v = np.asarray(data["v"], dtype=float)
+            self._times = np.asarray(data["t"], dtype=float).reshape(-1) if "t" in data.files else None
+
+        if len(self._x) < 2 or len(self._y) < 2 or np.any(np.diff(self._x) <= 0) or np.any(np.diff(self._y) <= 0):
+            raise ValueError(f"Grid lines in {file_name} must be increasing, with at least two lines in x and y.")
+        grid_shape = (len(self._y), len(self._x))
+        if self._times is None:
+            self._u, self._v = u[None], v[None]
+        else:
+            self._u, self._v = u, v
+            grid_shape = (len(self._times),) + grid_shape
+        if u.shape != grid_shape or v.shape != grid_shape:
+            raise ValueError(f"Velocity components in {file_name} must have shape {grid_shape}, got {u.shape} and {v.shape}.")
+
+        logger.info(f"Gridded velocity field loaded from {file_name}: {len(self._u)} snapshot(s) on a {grid_shape[-1]}x{grid_shape[-2]} grid")
+
+    def velocities(self, points: np.ndarray, time_val: float = 0.0) -> np.ndarray:
+        points = np.asarray(points, dtype=float).reshape(-1, 2)
+        ix, fx = self.grid_weights(self._x, points[:, 0])
+        iy, fy = self.grid_weights(self._y, points[:, 1])
+        k = self.time_index(time_val)
+
+        result = np.empty((len(points), 2))
+        for column, values in enumerate((self._u[k], self._v[k])):
+            result[:, column] = (
+                (1 - fy) * ((1 - fx) * values[iy, ix] + fx * values[iy, ix + 1]) +
+                fy * ((1 - fx) * values[iy + 1, ix] + fx * values[iy + 1, ix + 1])
+            )
+        return result
+
+    @staticmethod
+    def grid_weights(lines: np.ndarray, coordinates: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Finds the grid interval of each coordinate and its position inside the interval.
+
+        Args:
+            lines: Coordinates of the grid lines in increasing order.
+            coordinates: Coordinates of the points.
+
+        Returns:
+            tuple: Index of the lower grid line and the interpolation weight in [0, 1] of the upper one.
+        """
+        index = np.clip(np.searchsorted(lines, coordinates, side="right") - 1, 0, len(lines) - 2)
+        weight = (coordinates - lines[index]) / (lines[index + 1] - lines[index])
+        return index, np.clip(weight, 0.0, 1.0)
+
+    def time_index(self, time_val: float) -> int:
+        if self._times is None:
+            return 0
+        return int(np.clip(np.searchsorted(self._times, time_val, side="right") - 1, 0, len(self._times) - 1))
+
+    @property
+    def time_dependent(self) -> bool:
+        return self._times is not None and len(self._times) > 1
+
+class SnapshotVelocity(VelocityProvider):
+    """
+    Velocity of every cell at a sequence of times, streamed from a memory-mapped file and
+    interpolated linearly in time.
+
+    The file is an uncompressed .npz archive with the snapshot times t (n_times,) in increasing
+    order and the velocities (n_times, n_cells, 2), given at the cells in mesh order. Only the
+    two snapshots bracketing the current time are held in memory, and the snapshot after them
+    is read on a background thread, so the simulation rarely waits for the disk. Before the
+    first and after the last snapshot the velocities are constant.
+
+    The field is evaluated again every refresh interval and held constant in between, so the
+    face data of the engines is not rebuilt on every step. By default the interval is a tenth
+    of the shortest time between two snapshots.
+
+    Attributes:
+        _file_name: Path to the .npz file.
+        _times: Time of each snapshot.
+        _data: Memory map of the velocities, shape (n_times, n_cells, 2).
+        _resident: Snapshots held in memory, by index.
+        _prefetch: Read the snapshot after the resident ones on a background thread.
+        _executor: Thread reading the next snapshot, started on the first prefetch.
+        _pending: Future of the snapshot being prefetched, with its index.
+        _snapshots_read: Number of snapshots read from the file.
+        _refresh_interval: Time between re-evaluations of the interpolated field.
+    """
+    def __init__(self, file_name: str, prefetch: bool = True, refresh_interval: float = None):
+        """
+        Maps the snapshots without reading them.
+
+        Args:
+            file_name: Path to the .npz file.
+            prefetch: Read the next snapshot on a background thread.
+            refresh_interval: Time between re-evaluations of the interpolated field, by default
+                the shortest time between two snapshots divided by DEFAULT_SNAPSHOT_REFRESHES.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+            ValueError: If arrays are missing or their shapes do not match, or if the refresh
+                interval is not positive.
+        """
+        if refresh_interval is not None and refresh_interval <= 0:
+            raise ValueError("The refresh interval of velocity snapshots must be positive.")
+        from ..io.solution_reader import memmap_npz_array
+
+        with np.load(file_name) as data:
+            missing = {"t", "velocities"} - set(data.files)
+            if missing:
+                raise ValueError(f"Velocity snapshot file {file_name} is missing the arrays {sorted(missing)}.")
+            self._times = np.asarray(data["t"], dtype=float).reshape(-1)
+        self._data = memmap_npz_array(file_name, "velocities")
+
+        if self._data.ndim != 3 or self._data.shape[2] != 2 or len(self._data) != len(self._times):
+            raise ValueError(
+                f"Velocities in {file_name} must have shape ({len(self._times)}, n_cells, 2), got {self._data.shape}.")
+        if len(self._times) == 0 or np.any(np.diff(self._times) <= 0):
+            raise ValueError(f"Snapshot times in {file_name} must be increasing, with at least one snapshot.")
+
+        self._file_name = file_name
+        self._resident = {}
+        self._prefetch = prefetch
+        self._executor = None
+        self._pending = None
+        self._snapshots_read = 0
+        if refresh_interval is None and len(self._times) > 1:
+            refresh_interval = float(np.min(np.diff(self._times))) / DEFAULT_SNAPSHOT_REFRESHES
+        self._refresh_interval = refresh_interval
+        logger.info(
+            f"Velocity snapshots mapped from {file_name}: {len(self._times)} snapshots of {self._data.shape[1]} cells, "
+            f"refreshed every {refresh_interval}")
+
+    def velocities(self, points: np.ndarray, time_val: float = 0.0) -> np.ndarray:
+        if len(points) != self._data.shape[1]:
+            raise ValueError(
+                f"Velocity snapshots in {self._file_name} hold {self._data.shape[1]} cells, "
+                f"but velocities are requested at {len(points)} points.")
+
+        index, weight = self.bracket(time_val)
+        first = self.load_bracket(index)
+        if weight == 0.0:
+            return first.copy()
+        return (1.0 - weight) * first + weight * self._resident[index + 1]
+
+    def bracket(self, time_val: float) -> tuple[int, float]:
+        """
+        Finds the snapshots bracketing a time.
+
+        Args:
+            time_val: Simulation time.
+
+        Returns:
+            tuple: Index of the earlier snapshot and the interpolation weight in [0, 1] of the later one.
+        """
+        if len(self._times) == 1:
+            return 0, 0.0
+        index = int(np.clip(np.searchsorted(self._times, time_val, side="right") - 1, 0, len(self._times) - 2))
+        weight = (time_val - self._times[index]) / (self._times[index + 1] - self._times[index])
+        return index, float(np.clip(weight, 0.0, 1.0))
+
+    def load_bracket(self, index: int) -> np.ndarray:
+        """
+        Makes the snapshots index and index + 1 resident, drops all others and starts
+        prefetching the snapshot after them.
+
+        Args:
+            index: Index of the earlier snapshot.
+
+        Returns:
+            np.ndarray: The earlier snapshot, shape (n_cells, 2).
+        """
+        needed = range(index, min(index + 2, len(self._times)))
+        for i in needed:
+            if i not in self._resident:
+                self._resident[i] = self.take_snapshot(i)
+        for i in list(self._resident):
+            if i not in needed:
+                del self._resident[i]
+
+        following = needed[-1] + 1
+        if self._prefetch and following < len(self._times) and (self._pending is None or self._pending[0] != following):
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="velocity-prefetch")
+            self._pending = (following, self._executor.submit(self.read_snapshot, following))
+        return self._resident[index]
+
+    def take_snapshot(self, index: int) -> np.ndarray:
+        """
+        Gets a snapshot from the prefetch thread if it is being read there, otherwise reads it.
+
+        Args:
+            index: Index of the snapshot.
+
+        Returns:
+            np.ndarray: The snapshot, shape (n_cells, 2).
+        """
+        if self._pending is not None and self._pending[0] == index:
+            snapshot = self._pending[1].result()
+            self._pending = None
+            return snapshot
+        return self.read_snapshot(index)
+
+    def read_snapshot(self, index: int) -> np.ndarray:
+        """
+        Reads a snapshot from the memory-mapped file into memory.
+
+        Args:
+            index: Index of the snapshot.
+
+        Returns:
+            np.ndarray: The snapshot, shape (n_cells, 2).
+        """
+        snapshot = np.array(self._data[index], dtype=float)
+        self._snapshots_read += 1
+        return snapshot
+
+    def time_index(self, time_val: float) -> int:
+        if len(self._times) == 1:
+            return 0
+        # Outside the snapshots the velocities are constant, so the index stops changing there
+        time_val = float(np.clip(time_val, self._times[0], self._times[-1]))
+        return math.floor((time_val - self._times[0]) / self._refresh_interval)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+        self._pending = None
+        self._resident.clear()
+
+    @property
+    def time_dependent(self) -> bool:
+        return len(self._times) > 1
+
+    @property
+    def cell_values(self) -> bool:
+        return True
+
+    @property
+    def resident_snapshots(self) -> list[int]:
+        """Get the indices of the snapshots held in memory."""
+        return sorted(self._resident)
+
+    @property
+    def snapshots_read(self) -> int:
+        """Get the number of snapshots read from the file."""
+        return self._snapshots_read
+
+# Velocity field of the cells when no velocity provider is configured
+DEFAULT_VELOCITY = AnalyticVelocity(DEFAULT_U, DEFAULT_V)
+
+def create_velocity_provider(settings: dict) -> VelocityProvider:
+    """
+    Creates the velocity provider described by the 'velocity' section of a config.
+
+    Args:
+        settings: The section, with "type" either "analytic" (keys "u", "v" and "refreshInterval"),
+            "gridded" (key "file") or "snapshots" (keys "file" and "refreshInterval").
+
+    Returns:
+        VelocityProvider: The velocity provider.
+
+    Raises:
+        ValueError: If the type is not supported.
+    """
+    velocity_type = settings.get("type", "analytic")
+    if velocity_type == "analytic":
+        return AnalyticVelocity(settings.get("u", DEFAULT_U), settings.get("v", DEFAULT_V), settings.get("refreshInterval"))
+    if velocity_type == "gridded":
+        return GriddedVelocity(settings["file"])
+    if velocity_type == "snapshots":
+        return SnapshotVelocity(settings["file"], refresh_interval=settings.get("refreshInterval"))
+    raise ValueError(f"Unknown velocity type: {velocity_type}. Supported velocity types are: {list(VELOCITY_TYPES)}")
@@ -0,0 +1,168 @@
+import numpy as np
+import logging
+from .fishing_grounds import triangle_midpoints
+
+logger = logging.getLogger(__name__)
+
+# Average number of triangle midpoints per bin of the spatial index
+POINTS_PER_BIN = 4
+
+def points_in_polygon(points: np.ndarray, polygon: np.ndarray) -> np.ndarray:
+    """
+    Checks which points lie inside a polygon with the even-odd rule.
+
+    Args:
+        points: Coordinates of the points, shape (n_points, 2).
+        polygon: Vertices of the polygon in order, shape (n_vertices, 2). The polygon is closed
+            automatically, so the first vertex does not have to be repeated.
+
+    Returns:
+        np.ndarray: Boolean mask of the points inside the polygon.
+    """
+    x, y = points[:, 0], points[:, 1]
+    inside = np.zeros(len(points), dtype=bool)
+    x_prev, y_prev = polygon[-1]
+    for x_vertex, y_vertex in polygon:
+        # Edges crossing the horizontal line through a point flip it between inside and outside
+        crosses = (y_vertex > y) != (y_prev > y)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x_crossing = x_vertex + (y - y_vertex) * (x_prev - x_vertex) / (y_prev - y_vertex)
+        inside ^= crosses & (x < x_crossing)
+        x_prev, y_prev = x_vertex, y_vertex
+    return inside
+
+class UniformGrid:
+    """
+    Spatial index of points on a uniform grid of bins.
+
+    The points are sorted by bin, and the bins of one grid column are stored next to each
+    other, so the points in a box of bins are read as one slice per column.
+
+    Attributes:
+        _lower (np.ndarray): Lower left corner of the grid.
+        _bin_size (np.ndarray): Width and height of a bin.
+        _n_bins (int): Number of bins along each axis.
+        _order (np.ndarray): Point indices sorted by bin.
+        _bin_start (np.ndarray): Position in _order of the first point of each bin.
+    """
+    def __init__(self, points: np.ndarray, points_per_bin: int = POINTS_PER_BIN):
+        """
+        Sorts the points into the bins of the grid.
+
+        Args:
+            points: Coordinates of the points, shape (n_points, 2).
+            points_per_bin: Average number of points per bin, which sets the number of bins.
+        """
+        n_points = len(points)
+        self._n_bins = max(1, int(np.ceil(np.sqrt(n_points / points_per_bin))))
+        if n_points:
+            self._lower = points.min(axis=0)
+            extent = points.max(axis=0) - self._lower
+        else:
+            self._lower = np.zeros(2)
+            extent = np.zeros(2)
+        self._bin_size = np.where(extent > 0, extent / self._n_bins, 1.0)
+
+        bins = self._bins_of(points)
+        bin_ids = bins[:, 0] * self._n_bins + bins[:, 1]
+        self._order = np.argsort(bin_ids, kind="stable")
+        self._bin_start = np.searchsorted(bin_ids[self._order], np.arange(self._n_bins ** 2 + 1))
+
+    def _bins_of(self, points: np.ndarray) -> np.ndarray:
+        """
+        Finds the bin of each point, points outside the grid go to the nearest bin.
+
+        Args:
+            points: Coordinates of the points, shape (n_points, 2).
+
+        Returns:
+            np.ndarray: Column and row of the bin of each point, shape (n_points, 2).
+        """
+        bins = np.floor((np.asarray(points, dtype=float).reshape(-1, 2) - self._lower) / self._bin_size)
+        return np.clip(bins, 0, self._n_bins - 1).astype(np.int64)
+
+    def query_box(self, lower, upper) -> np.ndarray:
+        """
+        Finds the points in the bins overlapping a box. The result can contain points just
+        outside the box, but never misses a point inside it.
+
+        Args:
+            lower: Lower left corner (x_min, y_min) of the box.
+            upper: Upper right corner (x_max, y_max) of the box.
+
+        Returns:
+            np.ndarray: Indices of the candidate points.
+        """
+        (col_min, row_min), (col_max, row_max) = self._bins_of(np.array([lower, upper]))
+        slices = [
+            self._order[self._bin_start[col * self._n_bins + row_min]:self._bin_start[col * self._n_bins + row_max + 1]]
+            for col in range(col_min, col_max + 1)
+        ]
+        return np.concatenate(slices)
+
+class MonitoringZones:
+    """
+    Precomputed membership of the triangles in named polygon zones.
+
+    A triangle belongs to a zone if its midpoint lies inside the polygon. The candidates of
+    each zone are found with a uniform grid over the triangle midpoints, so only the triangles
+    near a zone are tested against its polygon. The members of all zones are stored as one
+    pair of flat index arrays, and the oil in every zone is a single weighted bincount.
+
+    Attributes:
+        _names: Name of each zone, in the order of the zone ids.
+        _cells (np.ndarray): Cell index of every (zone, cell) membership.
+        _zone_ids (np.ndarray): Zone id of every (zone, cell) membership.
+    """
+    def __init__(self, mesh, zones: dict):
+        """
+        Finds the triangles inside each zone.
+
+        Args:
+            mesh: The computational mesh containing the cells.
+            zones: Vertices [[x, y], ...] of the polygon of each zone, by name.
+        """
+        midpoints, is_triangle = triangle_midpoints(mesh)
+        triangle_cells = np.flatnonzero(is_triangle)
+        grid = UniformGrid(midpoints[triangle_cells])
+
+        self._names = list(zones)
+        members = []
+        for polygon in zones.values():
+            polygon = np.asarray(polygon, dtype=float)
+            candidates = grid.query_box(polygon.min(axis=0), polygon.max(axis=0))
+            cells = triangle_cells[candidates]
+            members.append(np.sort(cells[points_in_polygon(midpoints[cells], polygon)]))
+
+        self._cells = np.concatenate(members) if members else np.empty(0, dtype=np.int64)
+        self._zone_ids = np.repeat(np.arange(len(members)), [len(cells) for cells in members])
+        logger.info(f"Monitoring {len(self._names)} zones containing {len(self._cells)} triangles in total")
+
+    def oil_totals(self, oil: np.ndarray) -> np.ndarray:
+        """
+        Computes the oil in every zone.
+
+        Args:
+            oil: Oil amount of each cell, indexed by cell index.
+
+        Returns:
+            np.ndarray: Total oil amount in each zone, in the order of names.
+        """
+        return np.bincount(self._zone_ids, weights=oil[self._cells], minlength=len(self._names))
+
+    def cells_in(self, name: str) -> np.ndarray:
+        """
+        Gets the cells inside a zone.
+
+        Args:
+            name: Name of the zone.
+
+        Returns:
+            np.ndarray: Sorted indices of the triangles whose midpoint lies inside the zone.
+        """
+        return self._cells[self._zone_ids == self._names.index(name)]
+
+    @property
+    def names(self) -> list:
+        """Get the names of the zones."""
+        return self._names
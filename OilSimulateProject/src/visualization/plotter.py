@@ -1,13 +1,16 @@
-import io
-import matplotlib.pyplot as plt
+import numpy as np
 import matplotlib.tri as tri
 import matplotlib.patches as patches
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
 from PIL import Image
 from pathlib import Path  # To ensure Path operations
 from typing import List, Optional
+from .video_writer import VIDEO_FORMATS, open_video_writer
 
 class Animation:
-    def __init__(self, mesh=None, fps: int = 24, fishing_grounds: List[List[float]] = [[0.0, 0.0], [0.0, 0.0]], results_folder=None):
+    def __init__(self, mesh=None, fps: int = 24, fishing_grounds: List[List[float]] = [[0.0, 0.0], [0.0, 0.0]], results_folder=None,
+                 video_format: str = "gif", stream: bool = False, render_workers: int = 0):
         """
         Initializes the Animation class with mesh data, frame rate, fishing ground boundaries, and a results folder.
 
@@ -15,139 +18,195 @@ class Animation:
         :param fps: Frames per second for animations (default: 24).
         :param fishing_grounds: Coordinates for the fishing ground rectangle as [[x_min, x_max], [y_min, y_max]].
         :param results_folder: Folder to save rendered results (default: None).
+        :param video_format: Format of the animation, "gif", "mp4" or "webm" (default: "gif").
+        :param stream: Append each frame to the video file as soon as it is rendered instead of
+            keeping all frames in memory (default: False).
+        :param render_workers: Number of background processes rendering frames while the caller
+            continues, 0 renders in the calling process (default: 0).
         """
         if not mesh:
             raise ValueError("Mesh cannot be None")
+        if video_format not in VIDEO_FORMATS:
+            raise ValueError(f"Unknown video format: {video_format}. Supported formats are: {list(VIDEO_FORMATS)}")
         self._mesh = mesh
         self._points = self._mesh.points if self._mesh else []
-        self._x = [p.x for p in self._points]
-        self._y = [p.y for p in self._points]
+        coordinates = getattr(self._mesh, "point_coordinates", None)
+        if isinstance(coordinates, np.ndarray):
+            self._x = coordinates[:, 0]
+            self._y = coordinates[:, 1]
+        else:
+            self._x = [p.x for p in self._points]
+            self._y = [p.y for p in self._points]
         self._x_min, self._x_max = fishing_grounds[0]
         self._y_min, self._y_max = fishing_grounds[1]
         self._frame_count = 0
         self._fps = fps
         self._results_folder = Path(results_folder) if results_folder else Path(".")  # Ensure it's a Path
         self._frames: List[Image.Image] = []  # Store frames in memory
+        self._video_format = video_format
+        self._stream = stream
+        self._video_writer = None  # Opened on the first streamed frame
 
-    def render_frame(self, time_val: float = 0.0, total_oil: float = 0.0):
+        # Renderer shared by all frames, built on the first render
+        self._renderer = None
+        self._triangle_indices = None
+        self._triangles = None
+
+        # Background rendering, started on the first frame if render workers are requested
+        self._render_workers = render_workers
+        self._pipeline = None
+
+    def render_frame(self, time_val: float = 0.0, total_oil: float = 0.0, oil_amounts=None):
         """
-        Renders a single frame as a Pillow Image and appends it to the in-memory list of frames.
+        Renders a single frame as a Pillow Image and appends it to the in-memory list of frames,
+        or directly to the video file when streaming.
+
+        With render workers the frame is drawn in a background process, and frames are
+        stored in the order they were requested.
 
         :param time_val: Current simulation time (default: 0.0).
         :param total_oil: Total oil within the fishing grounds at this time (default: 0.0).
+        :param oil_amounts: Oil amount of each cell, indexed by cell index (default: read from the cells).
         """
-        from ..cell.triangle_cell import Triangle
+        triangle_oil = self._triangle_oil(oil_amounts)
 
-        # Extract triangle connectivity and oil data
-        triangles = [cell.points for cell in self._mesh.cells if isinstance(cell, Triangle)]
-        oil_amount = [cell.oil_amount for cell in self._mesh.cells if isinstance(cell, Triangle)]
+        if self._render_workers > 0:
+            if self._pipeline is None:
+                from .render_pipeline import RenderPipeline
+                self._pipeline = RenderPipeline(self._renderer_args(), self._store_frame, self._render_workers)
+            self._pipeline.submit(time_val, total_oil, triangle_oil)
+        else:
+            pixels = self._get_renderer().render(time_val, total_oil, triangle_oil)
+            self._store_frame(Image.fromarray(pixels))
+        self._frame_count += 1
 
-        if not triangles:
-            raise ValueError("No triangles in mesh")
+    def make_plot(self, time_val: float = 0.0, total_oil: float = 0.0, oil_amounts=None):
+        """
+        Renders and saves a single frame to a file.
 
-        # Generate the triangulation object
-        triang = tri.Triangulation(self._x, self._y, triangles)
+        :param time_val: Simulation time for the frame (default: 0.0).
+        :param total_oil: Total oil in the fishing grounds (default: 0.0).
+        :param oil_amounts: Oil amount of each cell, indexed by cell index (default: read from the cells).
+        """
+        # Default filename inside the results folder
+        filename = self._results_folder / "result.png"  # Ensure it is a Path object
 
-        # Calculate fishing rectangle dimensions
-        width = self._x_max - self._x_min
-        height = self._y_max - self._y_min
+        renderer = self._get_renderer()
+        renderer.update(time_val, total_oil, self._triangle_oil(oil_amounts))
 
-        fishing_rectangle = patches.Rectangle(
-            (self._x_min, self._y_min),  # Bottom-left corner
-            width,
-            height,
-            fill=False,
-            edgecolor="red",
-            linewidth=1
-        )
+        # Save the figure
+        try:
+            renderer.figure.savefig(filename, format='png', bbox_inches='tight')
+            print(f"Last frame saved as {filename}")
+        except Exception as e:
+            print(f"Failed to save last frame: {e}")
 
-        # Plot the current frame
-        fig, ax = plt.subplots()
-        tpc = ax.tripcolor(triang, facecolors=oil_amount, cmap='viridis', edgecolors='k', vmin=0, vmax=1)
-        fig.colorbar(tpc, label='Oil Amount')
+    def _store_frame(self, image: Image.Image):
+        """
+        Appends a rendered frame to the video file when streaming, or to the in-memory frames.
 
-        # Add titles and labels
-        ax.set_title(
-            "Oil Spill Simulation\n"
-            f"Time = {time_val:.2f} | Oil in Fishing Grounds = {total_oil:.2f}"
-        )
-        ax.add_patch(fishing_rectangle)
-        ax.set_xlabel('X')
-        ax.set_ylabel('Y')
-        ax.set_aspect('equal')
+        :param image: The rendered frame.
+        """
+        if self._stream:
+            if self._video_writer is None:
+                self._video_writer = open_video_writer(self.video_file, self._fps)
+            self._video_writer.append(image)
+        else:
+            self._frames.append(image)
 
-        # Save the plot to a memory buffer
-        buffer = io.BytesIO()
-        plt.savefig(buffer, format='png', bbox_inches='tight')
-        plt.close(fig)
+    def _triangle_oil(self, oil_amounts=None) -> np.ndarray:
+        """
+        Collects the oil amount of every triangle in the mesh.
 
-        # Convert buffer to Pillow image
-        buffer.seek(0)
-        image = Image.open(buffer)
-        image.load()  # Load image into memory
-        buffer.close()
+        :param oil_amounts: Oil amount of each cell, indexed by cell index (default: read from the cells).
+        :return: Oil amount of each triangle, in the order of the triangulation.
+        """
+        if self._triangle_indices is None:
+            self._find_triangles()
 
-        # Store the frame and update frame count
-        self._frames.append(image)
-        self._frame_count += 1
+        if oil_amounts is None:
+            return np.array([self._mesh.cells[i].oil_amount for i in self._triangle_indices], dtype=float)
+        return np.asarray(oil_amounts, dtype=float)[self._triangle_indices]
 
-    def make_plot(self, time_val: float = 0.0, total_oil: float = 0.0):
+    def _find_triangles(self):
         """
-        Renders and saves a single frame to a file.
-
-        :param time_val: Simulation time for the frame (default: 0.0).
-        :param total_oil: Total oil in the fishing grounds (default: 0.0).
+        Extracts the cell indices and connectivity of the triangles in the mesh.
         """
         from ..cell.triangle_cell import Triangle
 
-        # Default filename inside the results folder
-        filename = self._results_folder / "result.png"  # Ensure it is a Path object
-
-        # Extract triangle connectivity and oil data
-        triangles = [cell.points for cell in self._mesh.cells if isinstance(cell, Triangle)]
-        oil_amount = [cell.oil_amount for cell in self._mesh.cells if isinstance(cell, Triangle)]
+        triangle_indices = []
+        triangles = []
+        for i, cell in enumerate(self._mesh.cells):
+            if isinstance(cell, Triangle):
+                triangle_indices.append(i)
+                triangles.append(cell.points)
 
         if not triangles:
             raise ValueError("No triangles in mesh")
 
-        # Generate the triangulation object
-        triang = tri.Triangulation(self._x, self._y, triangles)
+        self._triangle_indices = np.array(triangle_indices, dtype=np.int64)
+        self._triangles = np.array(triangles, dtype=np.int64)
 
-        # Fishing grounds rectangle dimensions
-        width = self._x_max - self._x_min
-        height = self._y_max - self._y_min
+    def _renderer_args(self) -> tuple:
+        """
+        Returns the arguments of FrameRenderer for this animation, which can be sent to render workers.
 
-        fishing_rectangle = patches.Rectangle(
-            (self._x_min, self._y_min),
-            width,
-            height,
-            fill=False,
-            edgecolor="red",
-            linewidth=1
-        )
+        :return: Point coordinates, triangle connectivity and fishing ground boundaries.
+        """
+        if self._triangles is None:
+            self._find_triangles()
+        fishing_grounds = ((self._x_min, self._x_max), (self._y_min, self._y_max))
+        return (np.asarray(self._x, dtype=float), np.asarray(self._y, dtype=float), self._triangles, fishing_grounds)
 
-        # Plot the frame
-        fig, ax = plt.subplots()
-        tpc = ax.tripcolor(triang, facecolors=oil_amount, cmap='viridis', edgecolors='k', vmin=0, vmax=1)
-        fig.colorbar(tpc, label='Oil Amount')
+    def _get_renderer(self) -> "FrameRenderer":
+        """
+        Returns the renderer of this process, building it on first use.
 
-        # Add titles and labels
-        ax.set_title(
-            "Oil Spill Simulation\n"
-            f"Time = {time_val:.2f} | Oil in Fishing Grounds = {total_oil:.2f}"
-        )
-        ax.add_patch(fishing_rectangle)
-        ax.set_xlabel('X')
-        ax.set_ylabel('Y')
-        ax.set_aspect('equal')
+        :return: The frame renderer.
+        """
+        if self._renderer is None:
+            self._renderer = FrameRenderer(*self._renderer_args())
+        return self._renderer
 
-        # Save the figure
-        try:
-            plt.savefig(filename, format='png', bbox_inches='tight')
-            plt.close(fig)
-            print(f"Last frame saved as {filename}")
-        except Exception as e:
-            print(f"Failed to save last frame: {e}")
+    @property
+    def video_file(self) -> Path:
+        """
+        Returns the path of the animation file in the results folder.
+
+        :return: Path of the animation file.
+        """
+        return self._results_folder / f"animation.{self._video_format}"
+
+    def finish_video(self):
+        """
+        Completes the animation file. Streamed videos are closed, in-memory frames are
+        written to the video file.
+        """
+        self.wait_for_frames()
+        if self._stream:
+            if self._video_writer is None:
+                raise ValueError("No frames available to create video.")
+            self._video_writer.close()
+            self._video_writer = None
+            print(f"\nVideo saved as {self.video_file}")
+        elif self._video_format == "gif":
+            self.create_gif()
+        else:
+            if not self._frames:
+                raise ValueError("No frames available to create video.")
+            video_writer = open_video_writer(self.video_file, self._fps)
+            for frame in self._frames:
+                video_writer.append(frame)
+            video_writer.close()
+            print(f"\nVideo saved as {self.video_file}")
+
+    def wait_for_frames(self):
+        """
+        Waits until all frames handed to the render workers are stored, and stops the workers.
+        """
+        if self._pipeline is not None:
+            self._pipeline.close()
+            self._pipeline = None
 
     def create_gif(self):
         """
@@ -173,3 +232,103 @@ class Animation:
         )
 
         print(f"\nGIF saved as {gif_filename}")
+
+class FrameRenderer:
+    """
+    Draws the oil distribution on one reusable figure.
+
+    The triangulation, figure, colorbar and fishing ground rectangle are built once, each
+    frame only updates the face colors and the title.
+
+    Attributes:
+        _figure: Figure drawn on its own Agg canvas.
+        _axes: Axes holding the triangulation.
+        _tripcolor: Collection holding the face colors of the triangles.
+    """
+    def __init__(self, x, y, triangles, fishing_grounds):
+        """
+        Builds the figure.
+
+        :param x: X-coordinates of the mesh points.
+        :param y: Y-coordinates of the mesh points.
+        :param triangles: Point indices of each triangle, shape (n_triangles, 3).
+        :param fishing_grounds: Fishing ground rectangle as [[x_min, x_max], [y_min, y_max]].
+        """
+        # Generate the triangulation object
+        triang = tri.Triangulation(x, y, triangles)
+
+        # Calculate fishing rectangle dimensions
+        (x_min, x_max), (y_min, y_max) = fishing_grounds
+        fishing_rectangle = patches.Rectangle(
+            (x_min, y_min),  # Bottom-left corner
+            x_max - x_min,
+            y_max - y_min,
+            fill=False,
+            edgecolor="red",
+            linewidth=1
+        )
+
+        # The figure is not registered with pyplot, so it is drawn on its own Agg canvas
+        fig = Figure()
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot()
+        tpc = ax.tripcolor(triang, facecolors=np.zeros(len(triangles)), cmap='viridis', edgecolors='k', vmin=0, vmax=1)
+        fig.colorbar(tpc, ax=ax, label='Oil Amount')
+
+        # Add titles and labels, the title placeholder reserves the space of the real titles
+        ax.set_title(self.title(0.0, 0.0))
+        ax.add_patch(fishing_rectangle)
+        ax.set_xlabel('X')
+        ax.set_ylabel('Y')
+        ax.set_aspect('equal')
+        fig.tight_layout()
+
+        self._figure = fig
+        self._axes = ax
+        self._tripcolor = tpc
+
+    def update(self, time_val: float, total_oil: float, triangle_oil: np.ndarray):
+        """
+        Sets the oil amounts and the title of the figure.
+
+        :param time_val: Simulation time for the frame.
+        :param total_oil: Total oil in the fishing grounds.
+        :param triangle_oil: Oil amount of each triangle.
+        """
+        self._tripcolor.set_array(triangle_oil)
+        self._axes.set_title(self.title(time_val, total_oil))
+
+    def render(self, time_val: float, total_oil: float, triangle_oil: np.ndarray) -> np.ndarray:
+        """
+        Draws a frame and copies its pixels straight from the canvas buffer.
+
+        :param time_val: Simulation time for the frame.
+        :param total_oil: Total oil in the fishing grounds.
+        :param triangle_oil: Oil amount of each triangle.
+        :return: RGB pixels of the frame, shape (height, width, 3).
+        """
+        self.update(time_val, total_oil, triangle_oil)
+        self._figure.canvas.draw()
+        rgba = np.asarray(self._figure.canvas.buffer_rgba())
+
+        # Copy the pixels, the buffer is reused by the next draw
+        return np.array(rgba[..., :3])
+
+    @staticmethod
+    def title(time_val: float, total_oil: float) -> str:
+        """
+        Formats the title of a frame.
+
+        :param time_val: Simulation time for the frame.
+        :param total_oil: Total oil in the fishing grounds.
+        :return: The title text.
+        """
+        return (
+            "Oil Spill Simulation\n"
+            f"Time = {time_val:.2f} | Oil in Fishing Grounds = {total_oil:.2f}"
+        )
+
+    @property
+    def figure(self) -> Figure:
+        """Get the figure the frames are drawn on."""
+        return self._figure
@@ -0,0 +1,97 @@
+import numpy as np
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from PIL import Image
+
+# Renderer of the current worker process, built once by the pool initializer
+_worker_renderer = None
+
+def _init_render_worker(x, y, triangles, fishing_grounds):
+    """
+    Builds the frame renderer of a worker process.
+
+    :param x: X-coordinates of the mesh points.
+    :param y: Y-coordinates of the mesh points.
+    :param triangles: Point indices of each triangle, shape (n_triangles, 3).
+    :param fishing_grounds: Fishing ground rectangle as [[x_min, x_max], [y_min, y_max]].
+    """
+    from .plotter import FrameRenderer
+    global _worker_renderer
+    _worker_renderer = FrameRenderer(x, y, triangles, fishing_grounds)
+
+def _render_in_worker(time_val: float, total_oil: float, triangle_oil: np.ndarray) -> np.ndarray:
+    """
+    Renders one frame in a worker process.
+
+    :param time_val: Simulation time for the frame.
+    :param total_oil: Total oil in the fishing grounds.
+    :param triangle_oil: Oil amount of each triangle.
+    :return: RGB pixels of the frame.
+    """
+    return _worker_renderer.render(time_val, total_oil, triangle_oil)
+
+class RenderPipeline:
+    """
+    Renders frames in a pool of worker processes while the simulation continues.
+
+    Snapshots of the oil amounts are submitted in order, and the rendered frames are handed
+    to the frame sink in the same order. At most max_pending frames are in flight; submitting
+    more waits for the oldest frame, so memory use stays bounded when rendering is slower
+    than the simulation.
+
+    Attributes:
+        _executor (ProcessPoolExecutor): Pool of render workers.
+        _frame_sink: Callable receiving each rendered frame as a Pillow Image.
+        _max_pending (int): Maximum number of frames in flight.
+        _pending (deque): Futures of the frames in flight, oldest first.
+    """
+    def __init__(self, renderer_args: tuple, frame_sink, workers: int, max_pending: int = None):
+        """
+        Starts the render workers.
+
+        :param renderer_args: Arguments of FrameRenderer, built once in every worker.
+        :param frame_sink: Callable receiving each rendered frame as a Pillow Image.
+        :param workers: Number of worker processes.
+        :param max_pending: Maximum number of frames in flight (default: twice the number of workers).
+        :raises ValueError: If the number of workers is not positive.
+        """
+        if workers < 1:
+            raise ValueError("Number of render workers must be at least 1.")
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_render_worker, initargs=renderer_args)
+        self._frame_sink = frame_sink
+        self._max_pending = max_pending if max_pending is not None else 2 * workers
+        self._pending = deque()
+
+    def submit(self, time_val: float, total_oil: float, triangle_oil: np.ndarray):
+        """
+        Queues a frame for rendering, waiting for the oldest frame if the queue is full.
+
+        :param time_val: Simulation time for the frame.
+        :param total_oil: Total oil in the fishing grounds.
+        :param triangle_oil: Oil amount of each triangle.
+        """
+        while len(self._pending) >= self._max_pending:
+            self._store_oldest()
+
+        # The snapshot is sent to the worker later, so it must not share memory with the simulation
+        snapshot = np.array(triangle_oil, dtype=float)
+        self._pending.append(self._executor.submit(_render_in_worker, time_val, total_oil, snapshot))
+
+    def close(self):
+        """
+        Stores all frames in flight and stops the workers.
+        """
+        try:
+            while self._pending:
+                self._store_oldest()
+        finally:
+            self._executor.shutdown(cancel_futures=True)
+
+    def _store_oldest(self):
+        """
+        Waits for the oldest frame in flight and hands it to the frame sink.
+        """
+        pixels = self._pending.popleft().result()
+        self._frame_sink(Image.fromarray(pixels))
@@ -0,0 +1,102 @@
+import numpy as np
+from pathlib import Path
+from PIL import Image, GifImagePlugin
+
+# Supported video formats, the format is also the extension of the video file
+VIDEO_FORMATS = ("gif", "mp4", "webm")
+
+class GifWriter:
+    """
+    Writes a GIF animation frame by frame, so only the current frame is held in memory.
+
+    All frames share the palette of the first frame. The colorbar is part of every frame,
+    so the first frame already contains the full colormap.
+
+    Attributes:
+        _file: The open GIF file.
+        _duration (float): Display time of each frame in milliseconds.
+        _palette_image (Image.Image): Quantized first frame holding the shared palette.
+    """
+    def __init__(self, filename, fps: float):
+        """
+        Opens the GIF file.
+
+        :param filename: Path of the GIF file.
+        :param fps: Frames per second of the animation.
+        """
+        self._file = open(filename, "wb")
+        self._duration = 1000 / fps
+        self._palette_image = None
+
+    def append(self, image: Image.Image):
+        """
+        Quantizes a frame to the shared palette and appends it to the file.
+
+        :param image: The RGB frame.
+        """
+        if self._palette_image is None:
+            frame = image.quantize(colors=256, dither=Image.Dither.NONE)
+            header, _ = GifImagePlugin.getheader(frame, info={"loop": 0, "duration": self._duration})
+            for block in header:
+                self._file.write(block)
+            self._palette_image = frame
+        else:
+            frame = image.quantize(palette=self._palette_image, dither=Image.Dither.NONE)
+
+        for block in GifImagePlugin.getdata(frame, duration=self._duration):
+            self._file.write(block)
+
+    def close(self):
+        """
+        Writes the GIF trailer and closes the file.
+        """
+        if not self._file.closed:
+            self._file.write(b";")
+            self._file.close()
+
+class ImageioWriter:
+    """
+    Writes a video frame by frame through imageio, e.g. MP4 or WebM using ffmpeg.
+
+    Attributes:
+        _writer: The imageio writer.
+    """
+    def __init__(self, filename, fps: float):
+        """
+        Opens the video file.
+
+        :param filename: Path of the video file.
+        :param fps: Frames per second of the video.
+        """
+        import imageio.v2 as imageio
+        self._writer = imageio.get_writer(str(filename), fps=fps)
+
+    def append(self, image: Image.Image):
+        """
+        Appends a frame to the video.
+
+        :param image: The RGB frame.
+        """
+        self._writer.append_data(np.asarray(image))
+
+    def close(self):
+        """
+        Finishes the video and closes the file.
+        """
+        self._writer.close()
+
+def open_video_writer(filename, fps: float):
+    """
+    Opens a frame-by-frame writer for the format given by the file extension.
+
+    :param filename: Path of the video file, ending in .gif, .mp4 or .webm.
+    :param fps: Frames per second of the video.
+    :return: GifWriter for GIF files, ImageioWriter otherwise.
+    :raises ValueError: If the file extension is not a supported video format.
+    """
+    video_format = Path(filename).suffix.lstrip(".").lower()
+    if video_format not in VIDEO_FORMATS:
+        raise ValueError(f"Unknown video format: {video_format}. Supported formats are: {list(VIDEO_FORMATS)}")
+    if video_format == "gif":
+        return GifWriter(filename, fps)
+    return ImageioWriter(filename, fps)
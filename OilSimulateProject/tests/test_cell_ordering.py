@@ -0,0 +1,152 @@
+import pytest
+import numpy as np
+from unittest.mock import MagicMock, patch
+from src.io.mesh_reader import Mesh
+from src.io.cell_ordering import (
+    compute_cell_order, morton_order, rcm_order, to_original_order, from_original_order)
+from src.io.solution_writer import write_solution
+from src.io.solution_reader import read_oil_amounts
+from src.simulation.simulator import Simulation
+from src.io.config_reader import validate_and_fill_defaults
+
+@pytest.fixture
+def shuffled_grid():
+    """Create a meshio mock of a 12 x 12 grid of triangle pairs stored in random order, with a boundary line."""
+    n = 12
+    x, y = np.meshgrid(np.linspace(0.0, 1.0, n + 1), np.linspace(0.0, 1.0, n + 1))
+    points = np.column_stack([x.ravel(), y.ravel()])
+    triangles = []
+    for j in range(n):
+        for i in range(n):
+            corner = j * (n + 1) + i
+            triangles.append([corner, corner + 1, corner + n + 2])
+            triangles.append([corner, corner + n + 2, corner + n + 1])
+    triangles = np.array(triangles)[np.random.default_rng(3).permutation(2 * n * n)]
+
+    msh = MagicMock()
+    msh.points = points
+    msh.cells = [
+        MagicMock(type="line", data=np.array([[0, 1], [1, 2]])),
+        MagicMock(type="triangle", data=triangles)
+    ]
+    return msh
+
+def mean_index_distance(mesh):
+    """Get the mean index distance between the two cells of the faces between triangles."""
+    inner = mesh.face_neighbours >= 0
+    return np.mean(np.abs(mesh.face_owners[inner] - mesh.face_neighbours[inner]))
+
+@pytest.mark.parametrize("ordering", ["rcm", "morton"])
+@patch("src.io.mesh_reader.meshio.read")
+def test_reordered_mesh(mock_meshio_read, ordering, shuffled_grid):
+    """Test that renumbering permutes the cells and brings neighbouring cells closer in memory."""
+    mock_meshio_read.return_value = shuffled_grid
+    mesh = Mesh("mock_file.msh")
+    reordered = Mesh("mock_file.msh", cell_ordering=ordering)
+
+    assert mesh.cell_order is None
+    assert sorted(reordered.cell_order) == list(range(len(mesh.cells)))
+    assert reordered.midpoints == pytest.approx(mesh.midpoints[reordered.cell_order])
+    assert reordered.areas == pytest.approx(mesh.areas[reordered.cell_order], nan_ok=True)
+    for cell in reordered.cells:
+        original = mesh.cells[reordered.cell_order[cell.index]]
+        assert list(cell.points) == list(original.points)
+        assert {reordered.cell_order[n.index] for n in cell.neighbours} == {n.index for n in original.neighbours}
+
+    assert mean_index_distance(reordered) < mean_index_distance(mesh) / 4
+
+def test_orderings_of_a_row():
+    """Test both orderings on a strip of four triangles stored out of order."""
+    blocks = [np.array([[1, 2, 5], [0, 1, 4], [2, 6, 5], [1, 5, 4]])]
+    points = np.array([[0.0, 0.0], [1.0, 0.0], [2.0, 0.0], [3.0, 0.0], [0.0, 1.0], [1.0, 1.0], [2.0, 1.0]])
+    midpoints = points[blocks[0]].mean(axis=1)
+
+    assert list(morton_order(midpoints)) == [1, 3, 0, 2]
+    assert rcm_order(blocks).tolist() in ([1, 3, 0, 2], [2, 0, 3, 1])
+    with pytest.raises(ValueError, match="Unknown cell ordering"):
+        compute_cell_order("hilbert", midpoints, blocks)
+
+def test_original_order_round_trip():
+    """Test that values are converted between the mesh numbering and the file numbering."""
+    mesh = MagicMock(cell_order=np.array([2, 0, 1]))
+    values = np.array([20.0, 0.0, 10.0])
+
+    assert list(to_original_order(mesh, values)) == [0.0, 10.0, 20.0]
+    assert list(from_original_order(mesh, to_original_order(mesh, values))) == list(values)
+    assert to_original_order(MagicMock(cell_order=None), values) is values
+
+@patch("src.io.mesh_reader.meshio.read")
+def test_solution_file_uses_file_order(mock_meshio_read, shuffled_grid, tmp_path, monkeypatch):
+    """Test that a reordered mesh writes solutions in file order, which are read back in mesh order."""
+    monkeypatch.chdir(tmp_path)
+    mock_meshio_read.return_value = shuffled_grid
+    mesh = Mesh("mock_file.msh", cell_ordering="rcm")
+    oil = np.arange(len(mesh.cells), dtype=float)
+
+    write_solution(mesh, 0.5, 0.0, "test", oil_amounts=oil)
+    stored = read_oil_amounts("solutions/test_solution.txt", len(mesh.cells))
+
+    assert stored == pytest.approx(oil[np.argsort(mesh.cell_order)])
+    assert from_original_order(mesh, stored) == pytest.approx(oil)
+
+@patch("src.io.mesh_reader.meshio.read")
+def test_reordered_mesh_cache(mock_meshio_read, shuffled_grid, tmp_path):
+    """Test that every ordering has its own cache holding the permutation."""
+    mock_meshio_read.return_value = shuffled_grid
+    mesh_file = tmp_path / "mesh.msh"
+    mesh_file.write_text("mesh content")
+
+    mesh = Mesh(str(mesh_file), use_cache=True, cell_ordering="morton")
+    assert (tmp_path / "mesh.msh.morton.cache.npz").exists()
+    assert not (tmp_path / "mesh.msh.cache.npz").exists()
+
+    mock_meshio_read.reset_mock()
+    cached_mesh = Mesh(str(mesh_file), use_cache=True, cell_ordering="morton")
+    mock_meshio_read.assert_not_called()
+    assert list(cached_mesh.cell_order) == list(mesh.cell_order)
+    assert cached_mesh.midpoints == pytest.approx(mesh.midpoints)
+
+@pytest.mark.parametrize("engine, time_stepping", [
+    ("object", "fixed"), ("object", "adaptive"), ("vectorized", "fixed"), ("vectorized", "adaptive"),
+    ("vectorized", "local"), ("sparse", "fixed"), ("sparse", "adaptive"), ("implicit", "fixed")
+])
+@patch("src.simulation.simulator.Animation")
+@patch("src.io.mesh_reader.meshio.read")
+def test_simulation_independent_of_order(
+        mock_meshio_read, mock_animation, engine, time_stepping, shuffled_grid, tmp_path, monkeypatch):
+    """Test that a run on a renumbered mesh gives the same oil per cell of the mesh file for every engine."""
+    monkeypatch.chdir(tmp_path)
+    mock_meshio_read.return_value = shuffled_grid
+    results = {}
+    for ordering in (None, "rcm"):
+        mesh = Mesh("mock_file.msh", cell_ordering=ordering)
+        sim = Simulation(
+            mesh, (0.4, 0.5), ((0.0, 0.5), (0.0, 0.5)), 20, 0.0, 0.2, None, str(tmp_path), None, "test",
+            engine=engine, update_mode="two-phase", time_stepping=time_stepping
+        )
+        fishing_oil = sim.run_simulation()
+        results[ordering] = (to_original_order(mesh, sim.oil_amounts), fishing_oil)
+
+    assert results["rcm"][0] == pytest.approx(results[None][0])
+    assert results["rcm"][1] == pytest.approx(results[None][1])
+
+@patch("src.io.mesh_reader.meshio.read")
+def test_renumbered_cells_require_two_phase(mock_meshio_read, shuffled_grid):
+    """Test that the object engine defaults to the two-phase update on a renumbered mesh and rejects the sequential one."""
+    mock_meshio_read.return_value = shuffled_grid
+    mesh = Mesh("mock_file.msh", cell_ordering="rcm")
+    config = {
+        "settings": {"nSteps": 10, "tEnd": 1.0, "updateMode": "sequential"},
+        "geometry": {"meshName": "m.msh", "oilSpillCenter": [0.5, 0.5], "borders": [[0, 1], [0, 1]]},
+        "IO": {"cellOrdering": "rcm"}
+    }
+
+    sim = Simulation(mesh, (0.4, 0.5), ((0.0, 0.5), (0.0, 0.5)), 20, 0.0, 0.2, None, "", None, "test")
+    assert sim._update_mode == "two-phase"
+    with pytest.raises(ValueError, match="Renumbered cells require the 'two-phase' update mode"):
+        Simulation(mesh, (0.4, 0.5), ((0.0, 0.5), (0.0, 0.5)), 20, 0.0, 0.2, None, "", None, "test",
+                   update_mode="sequential")
+    with pytest.raises(ValueError, match="Renumbered cells require the 'two-phase' update mode"):
+        validate_and_fill_defaults(config, "test.toml")
+    del config["settings"]["updateMode"]
+    assert validate_and_fill_defaults(config, "test.toml")["settings"]["updateMode"] == "two-phase"
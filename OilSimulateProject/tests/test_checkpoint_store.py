@@ -0,0 +1,50 @@
+import pytest
+import numpy as np
+from unittest.mock import MagicMock
+from src.io.checkpoint_store import CheckpointWriter, CheckpointStore
+from src.simulation.simulator import Simulation
+
+def write_history(directory, n_states, n_cells=3, chunk_size=4):
+    """Write n_states oil states, where state i holds the value i in every cell."""
+    with CheckpointWriter(str(directory), n_cells, chunk_size=chunk_size) as writer:
+        for i in range(n_states):
+            writer.append(i * 10, 0.1 * i, np.full(n_cells, float(i)))
+
+def test_checkpoint_round_trip(tmp_path):
+    """Test that every state is read back from its chunk, including the last partial chunk."""
+    write_history(tmp_path, 10)
+
+    assert sorted(p.name for p in tmp_path.glob("chunk_*.npy")) == [
+        "chunk_000000.npy", "chunk_000001.npy", "chunk_000002.npy"
+    ]
+    store = CheckpointStore(str(tmp_path))
+    assert len(store) == 10
+    assert list(store.steps) == [i * 10 for i in range(10)]
+    for i in (0, 3, 4, 9):
+        assert store.read(i) == pytest.approx(np.full(3, float(i)))
+    assert store.oil_at_time(0.7) == pytest.approx(np.full(3, 7.0))
+
+def test_checkpoint_missing_time(tmp_path):
+    """Test that reading a time without a checkpoint is rejected."""
+    write_history(tmp_path, 3)
+
+    with pytest.raises(ValueError, match="No checkpoint saved at t = 0.15"):
+        CheckpointStore(str(tmp_path)).oil_at_time(0.15)
+
+def test_checkpoint_writer_replaces_old_run(tmp_path):
+    """Test that a new run does not mix its checkpoints with those of an earlier run."""
+    write_history(tmp_path, 10)
+    write_history(tmp_path, 2)
+
+    assert len(list(tmp_path.glob("chunk_*.npy"))) == 1
+    assert len(CheckpointStore(str(tmp_path))) == 2
+
+def test_restart_from_checkpoint(tmp_path):
+    """Test that a simulation restarted from a checkpoint directory starts from the state saved at tStart."""
+    write_history(tmp_path, 5)
+    mesh = MagicMock()
+    mesh.cells = [MagicMock(), MagicMock(), MagicMock()]
+
+    sim = Simulation(mesh, (0.0, 0.0), ((0, 1), (0, 1)), 10, 0.3, 1.0, None, str(tmp_path), str(tmp_path), "test")
+
+    assert sim.oil_amounts == pytest.approx(np.full(3, 3.0))
@@ -154,3 +154,224 @@ def test_load_all_configs_in_empty_folder(tmp_path):
     """Test error handling for folder with no TOML files."""
     with pytest.raises(FileNotFoundError):
         load_all_configs_in_folder(str(tmp_path))
+
+def test_validate_engine(create_toml_file):
+    """Test default and validation of the optional engine setting."""
+    config = validate_and_fill_defaults(read_toml_file(create_toml_file), "test.toml")
+    assert config["settings"]["engine"] == "object"
+
+    config["settings"]["engine"] = "quantum"
+    with pytest.raises(ValueError, match="Unknown 'settings.engine'"):
+        validate_and_fill_defaults(config, "test.toml")
+
+@pytest.mark.parametrize("engine, update_mode, expected", [
+    ("object", None, "sequential"),
+    ("vectorized", None, "two-phase"),
+    ("object", "two-phase", "two-phase"),
+])
+def test_validate_update_mode(create_toml_file, engine, update_mode, expected):
+    """Test default of the optional updateMode setting."""
+    config = read_toml_file(create_toml_file)
+    config["settings"]["engine"] = engine
+    if update_mode is not None:
+        config["settings"]["updateMode"] = update_mode
+
+    config = validate_and_fill_defaults(config, "test.toml")
+    assert config["settings"]["updateMode"] == expected
+
+def test_validate_vectorized_sequential(create_toml_file):
+    """Test that the vectorized engine cannot be combined with the sequential update mode."""
+    config = read_toml_file(create_toml_file)
+    config["settings"]["engine"] = "vectorized"
+    config["settings"]["updateMode"] = "sequential"
+
+    with pytest.raises(ValueError, match="requires the 'two-phase' update mode"):
+        validate_and_fill_defaults(config, "test.toml")
+
+def test_validate_solution_format(create_toml_file):
+    """Test default and validation of the optional solution format."""
+    config = validate_and_fill_defaults(read_toml_file(create_toml_file), "test.toml")
+    assert config["IO"]["solutionFormat"] == "text"
+
+    config["IO"]["solutionFormat"] = "hdf5"
+    with pytest.raises(ValueError, match="Unknown 'IO.solutionFormat'"):
+        validate_and_fill_defaults(config, "test.toml")
+
+def test_validate_cell_ordering(create_toml_file):
+    """Test that the optional cell ordering must be a supported ordering."""
+    config = read_toml_file(create_toml_file)
+    config["IO"] = {"cellOrdering": "rcm"}
+    assert validate_and_fill_defaults(config, "test.toml")["IO"]["cellOrdering"] == "rcm"
+
+    config["IO"]["cellOrdering"] = "hilbert"
+    with pytest.raises(ValueError, match="Unknown 'IO.cellOrdering'"):
+        validate_and_fill_defaults(config, "test.toml")
+
+@pytest.mark.parametrize("checkpoint_frequency", [0, -2, 1.5])
+def test_validate_checkpoint_frequency(create_toml_file, checkpoint_frequency):
+    """Test that the checkpoint frequency must be a positive integer."""
+    config = read_toml_file(create_toml_file)
+    config["IO"] = {"checkpointFrequency": checkpoint_frequency}
+
+    with pytest.raises(ValueError, match="'IO.checkpointFrequency'"):
+        validate_and_fill_defaults(config, "test.toml")
+
+def test_validate_write_frequency_and_fps(create_toml_file):
+    """Test the frame interval and playback speed settings."""
+    config = read_toml_file(create_toml_file)
+    config["IO"] = {"writeFrequency": 5}
+    config = validate_and_fill_defaults(config, "test.toml")
+    assert config["IO"]["fps"] == 10
+
+    config["IO"] = {"writeFrequency": 0}
+    with pytest.raises(ValueError, match="'IO.writeFrequency'"):
+        validate_and_fill_defaults(config, "test.toml")
+
+    config["IO"] = {"writeFrequency": 5, "fps": -1}
+    with pytest.raises(ValueError, match="'IO.fps'"):
+        validate_and_fill_defaults(config, "test.toml")
+
+@pytest.mark.parametrize("fishing_grounds, valid", [
+    ({"north": [[0.2, 0.6], [0.6, 0.9]]}, True),
+    ({"north": [[0.6, 0.2], [0.6, 0.9]]}, False),
+    ({"north": [0.2, 0.6, 0.6, 0.9]}, False),
+    ({"borders": [[0, 1], [0, 1]]}, False),
+    ([[0, 1], [0, 1]], False),
+])
+def test_validate_named_fishing_grounds(create_toml_file, fishing_grounds, valid):
+    """Test that named fishing grounds must be rectangles with a name other than 'borders'."""
+    config = read_toml_file(create_toml_file)
+    config["geometry"]["fishingGrounds"] = fishing_grounds
+
+    if valid:
+        validate_and_fill_defaults(config, "test.toml")
+    else:
+        with pytest.raises(ValueError, match="'geometry.fishingGrounds"):
+            validate_and_fill_defaults(config, "test.toml")
+
+@pytest.mark.parametrize("zones, valid", [
+    ({"intake": [[0.3, 0.3], [0.5, 0.3], [0.4, 0.5]]}, True),
+    ({"intake": [[0.3, 0.3], [0.5, 0.3]]}, False),
+    ({"intake": [[0.3, 0.3], [0.5, 0.3], [0.4]]}, False),
+    ([[0.3, 0.3], [0.5, 0.3], [0.4, 0.5]], False),
+])
+def test_validate_zones(create_toml_file, zones, valid):
+    """Test that monitoring zones must be polygons of at least three vertices."""
+    config = read_toml_file(create_toml_file)
+    config["geometry"]["zones"] = zones
+
+    if valid:
+        validate_and_fill_defaults(config, "test.toml")
+    else:
+        with pytest.raises(ValueError, match="'geometry.zones"):
+            validate_and_fill_defaults(config, "test.toml")
+
+def test_validate_adaptive_time_stepping(create_toml_file):
+    """Test that adaptive time stepping does not need nSteps and checks the CFL number."""
+    config = read_toml_file(create_toml_file)
+    del config["settings"]["nSteps"]
+    with pytest.raises(ValueError, match="Missing required 'settings.nSteps'"):
+        validate_and_fill_defaults(config, "test.toml")
+
+    config["settings"]["timeStepping"] = "adaptive"
+    config = validate_and_fill_defaults(config, "test.toml")
+    assert config["settings"]["cfl"] == 0.9
+
+    config["settings"]["cfl"] = 2
+    with pytest.raises(ValueError, match="'settings.cfl'"):
+        validate_and_fill_defaults(config, "test.toml")
+
+def test_validate_local_time_stepping(create_toml_file):
+    """Test the default and validation of the highest local time stepping level."""
+    config = read_toml_file(create_toml_file)
+    config["settings"]["timeStepping"] = "local"
+    config = validate_and_fill_defaults(config, "test.toml")
+    assert config["settings"]["maxLevel"] == 3
+
+    config["settings"]["maxLevel"] = -1
+    with pytest.raises(ValueError, match="'settings.maxLevel'"):
+        validate_and_fill_defaults(config, "test.toml")
+
+def test_validate_active_threshold(create_toml_file):
+    """Test that the active threshold is non-negative and needs the vectorized engine."""
+    config = read_toml_file(create_toml_file)
+    config["settings"]["activeThreshold"] = 1e-9
+    with pytest.raises(ValueError, match="requires the vectorized engine"):
+        validate_and_fill_defaults(config, "test.toml")
+
+    config["settings"]["engine"] = "vectorized"
+    config["settings"]["updateMode"] = "two-phase"
+    validate_and_fill_defaults(config, "test.toml")
+
+    config["settings"]["activeThreshold"] = -1.0
+    with pytest.raises(ValueError, match="'settings.activeThreshold'"):
+        validate_and_fill_defaults(config, "test.toml")
+
+def test_validate_velocity(create_toml_file):
+    """Test that the velocity section selects a supported provider with its keys."""
+    config = read_toml_file(create_toml_file)
+    config["velocity"] = {"u": "y - 0.2*x", "v": "-x"}
+    assert validate_and_fill_defaults(config, "test.toml")["velocity"]["type"] == "analytic"
+
+    config["velocity"]["refreshInterval"] = 0
+    with pytest.raises(ValueError, match="'velocity.refreshInterval'"):
+        validate_and_fill_defaults(config, "test.toml")
+
+    config["velocity"] = {"type": "snapshots", "file": "tides.npz", "refreshInterval": -0.1}
+    with pytest.raises(ValueError, match="'velocity.refreshInterval'"):
+        validate_and_fill_defaults(config, "test.toml")
+
+    config["velocity"] = {"type": "gridded"}
+    with pytest.raises(ValueError, match="requires 'velocity.file'"):
+        validate_and_fill_defaults(config, "test.toml")
+
+    config["velocity"] = {"type": "tidal"}
+    with pytest.raises(ValueError, match="Unknown 'velocity.type'"):
+        validate_and_fill_defaults(config, "test.toml")
+
+def test_validate_sparse_engine(create_toml_file):
+    """Test that the sparse engine is two-phase, rejects local time stepping and validates the jump."""
+    config = read_toml_file(create_toml_file)
+    config["settings"]["engine"] = "sparse"
+    config = validate_and_fill_defaults(config, "test.toml")
+    assert config["settings"]["updateMode"] == "two-phase"
+    assert config["settings"]["sparseJump"] == "matvec"
+
+    config["settings"]["sparseJump"] = "expm"
+    with pytest.raises(ValueError, match="Unknown 'settings.sparseJump'"):
+        validate_and_fill_defaults(config, "test.toml")
+
+    config["settings"]["sparseJump"] = "squaring"
+    config["settings"]["timeStepping"] = "local"
+    with pytest.raises(ValueError, match="cannot be used with local time stepping"):
+        validate_and_fill_defaults(config, "test.toml")
+
+def test_validate_implicit_engine(create_toml_file):
+    """Test that the implicit engine requires fixed time stepping."""
+    config = read_toml_file(create_toml_file)
+    config["settings"]["engine"] = "implicit"
+    assert validate_and_fill_defaults(config, "test.toml")["settings"]["updateMode"] == "two-phase"
+
+    config["settings"]["timeStepping"] = "adaptive"
+    with pytest.raises(ValueError, match="requires fixed time stepping"):
+        validate_and_fill_defaults(config, "test.toml")
+
+def test_validate_ensemble(create_toml_file):
+    """Test that a list of oil spill centers runs an ensemble with an array engine."""
+    config = read_toml_file(create_toml_file)
+    config["geometry"]["oilSpillCenter"] = [[0.5, 0.5], [0.4, 0.6]]
+    config["settings"]["engine"] = "sparse"
+    validate_and_fill_defaults(config, "test.toml")
+
+    config["settings"]["engine"] = "object"
+    with pytest.raises(ValueError, match="An ensemble requires"):
+        validate_and_fill_defaults(config, "test.toml")
+
+    config["settings"]["engine"] = "vectorized"
+    config["IO"]["checkpointFrequency"] = 5
+    with pytest.raises(ValueError, match="cannot be used with IO.checkpointFrequency"):
+        validate_and_fill_defaults(config, "test.toml")
+
+    config["geometry"]["oilSpillCenter"] = [[0.5, 0.5], [0.4]]
+    with pytest.raises(ValueError, match="list of \\[x, y\\] centers"):
+        validate_and_fill_defaults(config, "test.toml")
@@ -0,0 +1,44 @@
+import pytest
+from src.simulation.engine_options import default_engine, validate_engine_options
+from src.simulation.simulator import Simulation
+from src.io.config_reader import validate_and_fill_defaults
+
+INVALID_OPTIONS = [
+    (dict(engine="vectorized", update_mode="sequential"), "requires the 'two-phase' update mode"),
+    (dict(engine="sparse", time_stepping="local"), "cannot be used with local time stepping"),
+    (dict(engine="object", time_stepping="local"), "The object engine cannot be used with local time stepping"),
+    (dict(engine="implicit", time_stepping="adaptive"), "requires fixed time stepping"),
+    (dict(engine="implicit", sparse_jump="squaring"), "requires the 'matvec' sparse jump"),
+    (dict(engine="object", active_threshold=0.0), "requires the vectorized engine"),
+]
+
+def config_for(options: dict) -> dict:
+    """Create a config using the given engine options."""
+    keys = {"engine": "engine", "update_mode": "updateMode", "time_stepping": "timeStepping",
+            "sparse_jump": "sparseJump", "active_threshold": "activeThreshold"}
+    settings = {"nSteps": 10, "tEnd": 1.0, **{keys[key]: value for key, value in options.items()}}
+    return {"settings": settings, "geometry": {"meshName": "m.msh", "oilSpillCenter": [0.5, 0.5], "borders": [[0, 1], [0, 1]]}}
+
+@pytest.mark.parametrize("options, match", INVALID_OPTIONS)
+def test_invalid_options_rejected_alike(options, match, graded_mesh):
+    """Test that the simulation and the config reader reject a combination with the same message."""
+    with pytest.raises(ValueError, match=match) as error:
+        validate_engine_options(**options)
+    with pytest.raises(ValueError, match=match) as simulation_error:
+        Simulation(graded_mesh, (0.5, 0.5), ((0, 1), (0, 1)), 10, 0.0, 1.0, None, "", None, "test", **options)
+    with pytest.raises(ValueError, match=match) as config_error:
+        validate_and_fill_defaults(config_for(options), "test.toml")
+
+    assert str(simulation_error.value) == str(error.value)
+    assert str(config_error.value).endswith(str(error.value))
+
+@pytest.mark.parametrize("time_stepping, expected", [("fixed", "object"), ("local", "vectorized")])
+def test_default_engine(time_stepping, expected):
+    """Test that local time stepping defaults to the engine whose face data it uses."""
+    assert default_engine(time_stepping) == expected
+    assert validate_and_fill_defaults(config_for({"time_stepping": time_stepping}), "test.toml")["settings"]["engine"] == expected
+
+@pytest.mark.parametrize("engine, expected", [("object", "sequential"), ("sparse", "two-phase")])
+def test_default_update_mode(engine, expected):
+    """Test that the update mode defaults to the one of the engine."""
+    assert validate_engine_options(engine) == expected
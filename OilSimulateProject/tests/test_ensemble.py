@@ -0,0 +1,76 @@
+import pytest
+import numpy as np
+from unittest.mock import patch
+from src.simulation.ensemble import EnsembleSimulation
+from src.simulation.flux_engine import FluxEngine
+from src.simulation.simulator import Simulation
+from src.io.zone_series import read_zone_series
+
+CENTERS = [(0.3, 0.5), (0.6, 0.4), (0.9, 0.5)]
+FISHING_GROUNDS = ((0.4, 1.0), (0.0, 1.0))
+
+def test_batched_flux_engine(graded_mesh):
+    """Test that a batched step gives the step of each member."""
+    engine = FluxEngine(graded_mesh, 0.05)
+    oil = np.random.default_rng(1).random((4, len(graded_mesh.cells)))
+    fluxes = engine.face_fluxes(oil)
+
+    for k in range(len(oil)):
+        member_fluxes = engine.face_fluxes(oil[k])
+        assert fluxes[k] == pytest.approx(member_fluxes)
+        assert engine.oil_change(oil, fluxes)[k] == pytest.approx(engine.oil_change(oil[k], member_fluxes))
+        assert engine.boundary_outflow(fluxes)[k] == pytest.approx(engine.boundary_outflow(member_fluxes))
+
+@pytest.mark.parametrize("engine, time_stepping", [
+    ("vectorized", "fixed"), ("vectorized", "adaptive"), ("sparse", "fixed"), ("implicit", "fixed")
+])
+@patch("src.simulation.simulator.Animation")
+def test_ensemble_matches_separate_runs(mock_animation, engine, time_stepping, graded_mesh, tmp_path, monkeypatch):
+    """Test that every member of an ensemble follows the run of its own oil spill center."""
+    monkeypatch.chdir(tmp_path)
+    settings = dict(engine=engine, write_frequency=3, time_stepping=time_stepping)
+    ensemble = EnsembleSimulation(
+        graded_mesh, CENTERS, FISHING_GROUNDS, 10, 0.0, 0.5, str(tmp_path), "ensemble", **settings)
+    final_oil = ensemble.run_simulation()
+
+    series = ensemble.fishing_ground_series["borders"]
+    assert series.shape == (len(ensemble.sample_times), 3)
+    for k, center in enumerate(CENTERS):
+        sim = Simulation(
+            graded_mesh, center, FISHING_GROUNDS, 10, 0.0, 0.5, None, str(tmp_path), None, "single", **settings)
+        assert final_oil[k] == pytest.approx(sim.run_simulation())
+        assert ensemble.oil_amounts[k] == pytest.approx(sim.oil_amounts)
+        assert series[-1, k] == pytest.approx(final_oil[k])
+
+@patch("src.simulation.simulator.Animation")
+def test_ensemble_outputs(mock_animation, graded_mesh, tmp_path, monkeypatch):
+    """Test the per-member time series of every fishing ground and the final solution file."""
+    monkeypatch.chdir(tmp_path)
+    ensemble = EnsembleSimulation(
+        graded_mesh, CENTERS, FISHING_GROUNDS, 9, 0.0, 0.9, str(tmp_path), "ensemble",
+        engine="sparse", write_frequency=3, named_fishing_grounds={"west": ((0.0, 0.4), (0.0, 1.0))})
+    final_oil = ensemble.run_simulation()
+
+    times, borders = read_zone_series(str(tmp_path / "fishing_grounds_borders.csv"))
+    assert list(borders) == ["member_0", "member_1", "member_2"]
+    assert times == pytest.approx([0.0, 0.3, 0.6, 0.9])
+    assert borders["member_1"] == pytest.approx(ensemble.fishing_ground_series["borders"][:, 1], rel=1e-5)
+    _, west = read_zone_series(str(tmp_path / "fishing_grounds_west.csv"))
+    assert west["member_0"][-1] == pytest.approx(ensemble.fishing_ground_oil["west"][0], rel=1e-5)
+
+    with np.load(tmp_path / "solutions" / "ensemble_ensemble.npz") as solution:
+        assert solution["oil"] == pytest.approx(ensemble.oil_amounts)
+        assert solution["oil_spill_centers"] == pytest.approx(np.array(CENTERS))
+        assert solution["total_oil_in_fishing_grounds"] == pytest.approx(final_oil)
+        assert float(solution["time"]) == pytest.approx(0.9)
+
+@pytest.mark.parametrize("centers, kwargs, match", [
+    ([], {}, "oil spill center"),
+    ([(0.5, 0.5, 0.0)], {}, "oil spill center"),
+    (CENTERS, {"engine": "object"}, "requires one of the engines"),
+    (CENTERS, {"time_stepping": "local"}, "local time stepping"),
+])
+def test_ensemble_invalid(centers, kwargs, match, graded_mesh, tmp_path):
+    """Test that an ensemble needs centers and an engine that advances all members together."""
+    with pytest.raises(ValueError, match=match):
+        EnsembleSimulation(graded_mesh, centers, FISHING_GROUNDS, 10, 0.0, 0.5, str(tmp_path), "ensemble", **kwargs)
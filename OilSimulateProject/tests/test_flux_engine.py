@@ -0,0 +1,148 @@
+import pytest
+import numpy as np
+from src.cell.triangle_cell import Triangle
+from src.cell.line_cell import Line
+from src.simulation.flux_engine import FluxEngine
+from src.simulation.simulator import Simulation
+
+@pytest.fixture
+def small_mesh():
+    """Create a small mesh of two triangles and a boundary line with neighbours and normals."""
+    class Point:
+        def __init__(self, x, y):
+            self.x = x
+            self.y = y
+
+    class MockMesh:
+        def __init__(self):
+            self.points = [
+                Point(0.0, 0.0),   # point 0
+                Point(1.0, 0.0),   # point 1
+                Point(0.0, 1.0),   # point 2
+                Point(1.0, 1.0)    # point 3
+            ]
+            self.cells = []
+
+    mesh = MockMesh()
+    mesh.cells.extend([
+        Line(0, [0, 1], mesh),
+        Triangle(1, [0, 1, 2], mesh),
+        Triangle(2, [1, 3, 2], mesh)
+    ])
+    for cell in mesh.cells:
+        cell.store_neighbours_and_edges()
+        cell.store_outward_normals()
+    return mesh
+
+def test_faces_match_triangle_neighbours(small_mesh):
+    """Test that every triangle/neighbour pair becomes one face."""
+    engine = FluxEngine(small_mesh, 0.1)
+
+    expected_pairs = [
+        (cell.index, ngh.index)
+        for cell in small_mesh.cells if isinstance(cell, Triangle)
+        for ngh in cell.neighbours
+    ]
+    assert engine.n_faces == len(expected_pairs)
+    assert list(zip(engine.owners, engine.neighbours)) == expected_pairs
+
+def test_oil_change_matches_flux_function(small_mesh, tmp_path):
+    """Test that the vectorized fluxes equal the per-facet flux function evaluated on the old state."""
+    delta_t = 0.1
+    engine = FluxEngine(small_mesh, delta_t)
+    sim = Simulation(small_mesh, (0.0, 0.0), ((0, 1), (0, 1)), 10, 0.0, 1.0, None, str(tmp_path), None, "test")
+
+    oil = sim.oil_amounts
+    expected = np.zeros(len(small_mesh.cells))
+    for cell in small_mesh.cells:
+        if isinstance(cell, Triangle):
+            for i, ngh in enumerate(cell.neighbours):
+                v_avg = 0.5 * (np.array(cell.velocity_field) + np.array(ngh.velocity_field))
+                v_vector = cell.outward_normals[i] * np.linalg.norm(cell.edge_vectors[i])
+                expected[cell.index] -= (delta_t / cell.area) * sim.g(oil[cell.index], oil[ngh.index], v_vector, v_avg)
+
+    assert engine.oil_change(oil) == pytest.approx(expected)
+
+def test_vectorized_engine_selection(small_mesh, tmp_path):
+    """Test that the simulation advances the cells with the vectorized engine."""
+    sim = Simulation(
+        small_mesh, (0.0, 0.0), ((0, 1), (0, 1)), 10, 0.0, 1.0, None, str(tmp_path), None, "test",
+        engine="vectorized"
+    )
+    oil_before = sim.oil_amounts.copy()
+    expected = oil_before + FluxEngine(small_mesh, 0.1).oil_change(oil_before)
+
+    sim.oil_movement()
+
+    assert sim.oil_amounts == pytest.approx(expected)
+
+def test_unknown_engine(small_mesh, tmp_path):
+    """Test that an unsupported engine is rejected."""
+    with pytest.raises(ValueError, match="Unknown engine"):
+        Simulation(
+            small_mesh, (0.0, 0.0), ((0, 1), (0, 1)), 10, 0.0, 1.0, None, str(tmp_path), None, "test",
+            engine="quantum"
+        )
+
+def test_two_phase_object_engine_matches_vectorized(small_mesh, tmp_path):
+    """Test that the buffered object engine gives the same result as the vectorized engine."""
+    sim = Simulation(
+        small_mesh, (0.0, 0.0), ((0, 1), (0, 1)), 10, 0.0, 1.0, None, str(tmp_path), None, "test",
+        update_mode="two-phase"
+    )
+    oil_before = sim.oil_amounts.copy()
+    expected = oil_before + FluxEngine(small_mesh, 0.1).oil_change(oil_before)
+
+    sim.oil_movement()
+
+    assert sim.oil_amounts == pytest.approx(expected)
+
+@pytest.mark.parametrize("engine, update_mode", [
+    ("object", "two-phase"),
+    ("vectorized", "two-phase"),
+])
+def test_two_phase_conserves_mass(small_mesh, tmp_path, engine, update_mode):
+    """Test that mass lost from the domain equals the outflow through the boundary."""
+    sim = Simulation(
+        small_mesh, (0.5, 0.5), ((0, 1), (0, 1)), 10, 0.0, 1.0, None, str(tmp_path), None, "test",
+        engine=engine, update_mode=update_mode
+    )
+    initial_mass, _ = sim.check_mass_balance()
+    for _ in range(5):
+        sim.oil_movement()
+    total_mass, mass_error = sim.check_mass_balance()
+
+    assert total_mass < initial_mass
+    assert mass_error == pytest.approx(0.0, abs=1e-12)
+
+def test_vectorized_engine_requires_two_phase(small_mesh, tmp_path):
+    """Test that the vectorized engine cannot run in sequential mode."""
+    with pytest.raises(ValueError, match="requires the 'two-phase' update mode"):
+        Simulation(
+            small_mesh, (0.0, 0.0), ((0, 1), (0, 1)), 10, 0.0, 1.0, None, str(tmp_path), None, "test",
+            engine="vectorized", update_mode="sequential"
+        )
+
+def test_max_stable_time_step(small_mesh):
+    """Test that the stable time step is the largest step keeping every oil amount non-negative."""
+    engine = FluxEngine(small_mesh, 0.1)
+    stable_delta_t = engine.max_stable_time_step()
+    oil = np.array([0.0, 1.0, 1.0])
+
+    engine.set_time_step(stable_delta_t)
+    assert np.min(oil + engine.oil_change(oil)) >= -1e-12
+    engine.set_time_step(1.5 * stable_delta_t)
+    assert np.min(oil + engine.oil_change(oil)) < 0.0
+
+def test_active_faces_grow_by_layers(graded_mesh):
+    """Test that the active region holds the cells above the threshold plus the requested layers of neighbours."""
+    engine = FluxEngine(graded_mesh, 0.01)
+    oil = np.zeros(len(graded_mesh.cells))
+    oil[0] = 1.0
+
+    for layers in range(3):
+        faces = engine.active_faces(oil, 0.0, layers)
+        touched = set(engine.owners[faces]) | set(engine.neighbours[faces])
+        # Cells of the strip form a chain, so every layer adds one cell
+        assert touched == set(range(layers + 2))
+    assert len(engine.active_faces(oil, 1.0)) == 0
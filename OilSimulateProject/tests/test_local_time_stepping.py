@@ -0,0 +1,64 @@
+import pytest
+import numpy as np
+from unittest.mock import patch
+from src.simulation.flux_engine import FluxEngine
+from src.simulation.local_time_stepping import LocalTimeStepper
+from src.simulation.simulator import Simulation
+
+def test_levels_respect_local_stable_steps(graded_mesh):
+    """Test that every cell steps below its own stable step and that small cells get higher levels."""
+    engine = FluxEngine(graded_mesh, 0.1)
+    stepper = LocalTimeStepper(engine, cfl=0.9, max_level=3)
+
+    cell_steps = stepper.macro_delta_t / 2.0 ** stepper.cell_levels
+    assert np.all(cell_steps <= 0.9 * engine.stable_time_steps() * (1 + 1e-12))
+    assert stepper.cell_levels[0] < stepper.cell_levels[-2]
+    assert stepper.speedup > 1.0
+
+def test_local_steps_conserve_mass(graded_mesh):
+    """Test that the oil mass in the domain plus the boundary outflow stays constant and oil stays non-negative."""
+    engine = FluxEngine(graded_mesh, 0.1)
+    stepper = LocalTimeStepper(engine, cfl=1.0, max_level=3)
+    areas = np.array([getattr(cell, "area", 0.0) for cell in graded_mesh.cells])
+    oil = np.where(areas > 0, 1.0, 0.0)
+    initial_mass = np.sum(oil * areas)
+
+    outflow = sum(stepper.step(oil, stepper.macro_delta_t) for _ in range(10))
+
+    assert outflow > 0.0
+    assert np.sum(oil * areas) + outflow == pytest.approx(initial_mass, abs=1e-12)
+    assert np.min(oil) >= 0.0
+
+def test_single_level_matches_global_step(graded_mesh):
+    """Test that local time stepping with one level is the global upwind step."""
+    engine = FluxEngine(graded_mesh, 0.1)
+    stepper = LocalTimeStepper(engine, cfl=0.9, max_level=0)
+    oil = np.linspace(0.0, 1.0, len(graded_mesh.cells))
+
+    engine.set_time_step(stepper.macro_delta_t)
+    expected = oil + engine.oil_change(oil)
+    stepper.step(oil, stepper.macro_delta_t)
+
+    assert oil == pytest.approx(expected)
+    assert stepper.flux_evaluations == engine.n_faces
+
+@patch("src.simulation.simulator.Animation")
+def test_local_time_stepping_simulation(mock_animation, graded_mesh, tmp_path, monkeypatch):
+    """Test that a local time stepping run ends at tEnd with a balanced mass."""
+    monkeypatch.chdir(tmp_path)
+    sim = Simulation(
+        graded_mesh, (0.9, 0.5), ((0, 1), (0, 1)), None, 0.0, 0.5, None, str(tmp_path), None, "test",
+        time_stepping="local", max_level=2
+    )
+    macro_delta_t = LocalTimeStepper(FluxEngine(graded_mesh, 0.1), 0.9, 2).macro_delta_t
+    balances = []
+    check_mass_balance = sim.check_mass_balance
+    def record_mass_balance():
+        balances.append(check_mass_balance())
+        return balances[-1]
+    sim.check_mass_balance = record_mass_balance
+
+    sim.run_simulation()
+
+    assert sim.steps_taken == int(np.ceil(0.5 / macro_delta_t))
+    assert all(mass_error == pytest.approx(0.0, abs=1e-12) for _, mass_error in balances)
@@ -2,8 +2,9 @@ import pytest
 import logging
 import argparse
 from unittest.mock import patch, MagicMock, ANY
-from main import setup_logging, run_simulation_for_config, main
+from main import setup_logging, run_simulation_for_config, run_batch, print_batch_summary, main
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
 @pytest.fixture
 def mock_config():
@@ -39,6 +40,69 @@ def test_run_simulation_for_config(mock_get_logger, mock_simulation, mock_mesh,
     mock_simulation.assert_called_once()
     mock_simulation.return_value.run_simulation.assert_called_once()
 
+@patch('main.Mesh')
+@patch('main.Simulation')
+def test_run_simulation_for_config_reuses_mesh(mock_simulation, mock_mesh, mock_config, tmp_path, monkeypatch):
+    """Test that configs sharing a mesh load it only once when a mesh dictionary is passed."""
+    monkeypatch.chdir(tmp_path)
+    meshes = {}
+
+    run_simulation_for_config(mock_config, 'first.toml', meshes)
+    run_simulation_for_config(mock_config, 'second.toml', meshes)
+
+    mock_mesh.assert_called_once()
+    assert list(meshes.values()) == [mock_mesh.return_value]
+    assert mock_simulation.call_count == 2
+    assert all(call.args[0] is mock_mesh.return_value for call in mock_simulation.call_args_list)
+
+@patch('main.run_simulation_for_config')
+def test_run_batch_sequential(mock_run_simulation):
+    """Test that configs run in this process share their meshes and stop at the first failing config."""
+    mock_run_simulation.side_effect = lambda cfg, cfg_filename, meshes: {"config": cfg_filename}
+
+    assert run_batch({"a.toml": {}, "b.toml": {}}, jobs=1) == [{"config": "a.toml"}, {"config": "b.toml"}]
+    assert mock_run_simulation.call_args_list[0].args[2] is mock_run_simulation.call_args_list[1].args[2]
+
+    mock_run_simulation.reset_mock()
+    mock_run_simulation.side_effect = ValueError("broken config")
+    with pytest.raises(ValueError, match="broken config"):
+        run_batch({"a.toml": {}, "b.toml": {}}, jobs=1)
+    mock_run_simulation.assert_called_once()
+
+@patch('main.ProcessPoolExecutor', ThreadPoolExecutor)
+@patch('main.run_simulation_for_config')
+def test_run_batch_reports_failures(mock_run_simulation):
+    """Test that a failing config in a pool is reported in the summary and does not stop the batch."""
+    def run(cfg, cfg_filename, meshes):
+        if cfg_filename == "a.toml":
+            raise ValueError("broken config")
+        return {"config": cfg_filename, "runtime": 1.0, "fishing_grounds_oil": 2.0}
+    mock_run_simulation.side_effect = run
+
+    summaries = run_batch({"a.toml": {}, "b.toml": {}}, jobs=2)
+
+    assert summaries == [
+        {"config": "a.toml", "error": "broken config"},
+        {"config": "b.toml", "runtime": 1.0, "fishing_grounds_oil": 2.0},
+    ]
+
+def test_print_batch_summary(capsys):
+    """Test that the batch summary lists every config."""
+    print_batch_summary([
+        {"config": "a.toml", "error": "broken config"},
+        {"config": "b.toml", "runtime": 1.5, "fishing_grounds_oil": 2.25},
+    ])
+
+    output = capsys.readouterr().out
+    assert "a.toml  FAILED: broken config" in output
+    assert "1.50" in output and "2.2500" in output
+
+def test_print_batch_summary_ensemble(capsys):
+    """Test that the summary of an ensemble shows the range of the final oil over the members."""
+    print_batch_summary([{"config": "e.toml", "runtime": 2.0, "steps": 11, "fishing_grounds_oil": [0.5, 2.25, 1.0]}])
+
+    assert "0.5000 to 2.2500" in capsys.readouterr().out
+
 @patch('argparse.ArgumentParser.parse_args')
 @patch('main.load_single_config_file')
 @patch('main.run_simulation_for_config')
@@ -58,7 +122,7 @@ def test_main_argument_parsing(mock_args):
     test_cases = [
         (argparse.Namespace(find=None, folder=None, config_file='custom.toml'), 'custom.toml'),
         (argparse.Namespace(find=None, folder=None, config_file=None), 'input.toml'),
-        (argparse.Namespace(find='all', folder='custom_folder', config_file=None), 'custom_folder'),
+        (argparse.Namespace(find='all', folder='custom_folder', config_file=None, jobs=1), 'custom_folder'),
     ]
     
     for args, expected in test_cases:
@@ -80,7 +144,7 @@ def test_main_argument_parsing(mock_args):
     test_cases = [
         (argparse.Namespace(find=None, folder=None, config_file='custom.toml'), 'custom.toml'),
         (argparse.Namespace(find=None, folder=None, config_file=None), 'config_files/input.toml'),
-        (argparse.Namespace(find='all', folder='custom_folder', config_file=None), 'custom_folder'),
+        (argparse.Namespace(find='all', folder='custom_folder', config_file=None, jobs=1), 'custom_folder'),
         (argparse.Namespace(find=None, folder='custom_folder', config_file='custom.toml'), 'custom_folder/custom.toml'),
     ]
 
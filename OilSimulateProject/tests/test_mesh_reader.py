@@ -1,6 +1,9 @@
 import pytest
 from unittest.mock import MagicMock, patch
-from src.io.mesh_reader import Mesh, Point
+import numpy as np
+from src.io.mesh_reader import Mesh, Point, PointList
+from src.io.mesh_cache import cache_cell_code, save_mesh_cache, load_mesh_cache
+from src.cell.triangle_cell import Triangle
 
 class TestMesh:
     @pytest.fixture
@@ -115,3 +118,129 @@ class TestMesh:
         mesh.find_outward_normals()
 
         first_cell.store_outward_normals.assert_called_once(), "Outward normal calculation for the first cell should be called."
+
+    @patch("src.io.mesh_reader.meshio.read")
+    def test_find_candidate_neighbours(self, mock_meshio_read, mock_meshio_data):
+        """Test that the edge index finds the same neighbours as a full scan of the mesh."""
+        mock_meshio_data.cells = [
+            MagicMock(type="line", data=[[0, 1], [1, 3]]),
+            MagicMock(type="triangle", data=[[0, 1, 2], [1, 3, 2]])
+        ]
+        mock_meshio_read.return_value = mock_meshio_data
+
+        mesh = Mesh("mock_file.msh")
+        candidates = mesh.find_candidate_neighbours()
+
+        for cell, cell_candidates in zip(mesh.cells, candidates):
+            assert cell not in cell_candidates, "A cell should not be its own candidate."
+
+        for cell in mesh.cells:
+            scanned = type(cell)(cell.index, cell.points, mesh)
+            scanned.store_neighbours_and_edges()
+            assert [n.index for n in cell.neighbours] == [n.index for n in scanned.neighbours], \
+                "Neighbour ordering should match a full scan of the mesh."
+
+    @patch("src.io.mesh_reader.meshio.read")
+    def test_mesh_cache(self, mock_meshio_read, mock_meshio_data, tmp_path):
+        """Test that a cached mesh is loaded without reading the mesh file and matches the original."""
+        mock_meshio_data.cells = [
+            MagicMock(type="line", data=[[0, 1], [1, 3]]),
+            MagicMock(type="triangle", data=[[0, 1, 2], [1, 3, 2]])
+        ]
+        mock_meshio_read.return_value = mock_meshio_data
+        mesh_file = tmp_path / "mesh.msh"
+        mesh_file.write_text("mesh content")
+
+        mesh = Mesh(str(mesh_file), use_cache=True)
+        assert (tmp_path / "mesh.msh.cache.npz").exists(), "The cache should be written next to the mesh."
+
+        mock_meshio_read.reset_mock()
+        with patch("src.io.mesh_reader.Mesh.find_neighbours_and_edges") as mock_find_neighbours, \
+                patch("src.io.mesh_reader.Mesh.find_outward_normals") as mock_find_normals:
+            cached_mesh = Mesh(str(mesh_file), use_cache=True)
+        mock_meshio_read.assert_not_called()
+        mock_find_neighbours.assert_not_called()
+        mock_find_normals.assert_not_called()
+
+        assert list(cached_mesh.face_owners) == list(mesh.face_owners)
+        assert list(cached_mesh.face_neighbours) == list(mesh.face_neighbours)
+        assert cached_mesh.face_normals == pytest.approx(mesh.face_normals)
+        for cell, cached_cell in zip(mesh.cells, cached_mesh.cells):
+            assert type(cell) is type(cached_cell)
+            assert list(cell.points) == list(cached_cell.points)
+            assert [n.index for n in cell.neighbours] == [n.index for n in cached_cell.neighbours]
+            assert cell.edge_vectors == cached_cell.edge_vectors
+            assert [[(p.x, p.y) for p in points] for points in cell.edge_points] == \
+                [[(p.x, p.y) for p in points] for points in cached_cell.edge_points]
+            for normal, cached_normal in zip(getattr(cell, "outward_normals", []), getattr(cached_cell, "outward_normals", [])):
+                assert list(normal) == pytest.approx(list(cached_normal))
+        assert cached_mesh.midpoints == pytest.approx(mesh.midpoints)
+
+        # Changing the mesh file invalidates the cache
+        mesh_file.write_text("changed mesh content")
+        Mesh(str(mesh_file), use_cache=True)
+        mock_meshio_read.assert_called_once()
+
+    @patch("src.io.mesh_reader.meshio.read")
+    def test_mesh_cache_cell_subclass(self, mock_meshio_read, mock_meshio_data, tmp_path):
+        """Test that subclasses of the cell classes are cached with the code of their base class."""
+        class CoastalTriangle(Triangle):
+            pass
+
+        mock_meshio_read.return_value = mock_meshio_data
+        mesh = Mesh("mock_file.msh")
+        for cell in mesh.cells:
+            if isinstance(cell, Triangle):
+                cell.__class__ = CoastalTriangle
+        cache_file = str(tmp_path / "mesh.cache.npz")
+
+        save_mesh_cache(mesh, cache_file, "hash")
+
+        assert [cache_cell_code(cell) for cell in mesh.cells] == [0, 0, 1]
+        assert list(load_mesh_cache(cache_file, "hash")["cell_types"]) == [0, 0, 1]
+        with pytest.raises(ValueError, match="cannot be stored in the mesh cache"):
+            cache_cell_code(MagicMock())
+
+    @patch("src.io.mesh_reader.meshio.read")
+    def test_point_coordinates_array(self, mock_meshio_read, mock_meshio_data):
+        """Test that points are stored in one contiguous array and exposed as Point views."""
+        mock_meshio_read.return_value = mock_meshio_data
+
+        mesh = Mesh("mock_file.msh")
+
+        assert isinstance(mesh.point_coordinates, np.ndarray)
+        assert mesh.point_coordinates.shape == (4, 2)
+        assert mesh.point_coordinates.dtype == np.float64
+        assert mesh.point_coordinates.flags["C_CONTIGUOUS"]
+        assert isinstance(mesh.points, PointList)
+        assert (mesh.points[3].x, mesh.points[3].y) == (1.0, 1.0)
+        assert [(p.x, p.y) for p in mesh.points[1:3]] == [(1.0, 0.0), (0.0, 1.0)]
+
+    @patch("src.io.mesh_reader.meshio.read")
+    def test_batched_geometry(self, mock_meshio_read, mock_meshio_data):
+        """Test that the geometry arrays of the mesh match the per-cell calculations."""
+        mock_meshio_data.cells = [
+            MagicMock(type="line", data=[[0, 1], [1, 3]]),
+            MagicMock(type="triangle", data=[[0, 1, 2], [1, 3, 2]])
+        ]
+        mock_meshio_read.return_value = mock_meshio_data
+
+        mesh = Mesh("mock_file.msh")
+
+        for cell in mesh.cells:
+            assert cell.midpoint == pytest.approx(type(cell)(cell.index, cell.points, mesh).calculate_midpoint())
+            if hasattr(cell, "area"):
+                assert mesh.areas[cell.index] == pytest.approx(cell.calculate_area())
+            else:
+                assert np.isnan(mesh.areas[cell.index])
+
+        assert list(zip(mesh.face_owners, mesh.face_neighbours)) == [(2, 0), (2, 3), (3, 1), (3, 2)]
+        for owner, edge, normal in zip(mesh.face_owners, mesh.face_edge_vectors, mesh.face_normals):
+            assert np.linalg.norm(normal) == pytest.approx(1.0)
+            assert np.dot(normal, edge) == pytest.approx(0.0)
+
+        # The normal of the shared edge points from each triangle towards the other
+        shared = np.flatnonzero(mesh.face_neighbours == 3)[0]
+        to_neighbour = mesh.midpoints[3] - mesh.midpoints[2]
+        assert np.dot(mesh.face_normals[shared], to_neighbour) > 0
+        assert mesh.cells[2].outward_normals[1] == pytest.approx(mesh.face_normals[shared])
@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import MagicMock
 from pathlib import Path
 from PIL import Image
+from src.cell.triangle_cell import Triangle
 from src.visualization.plotter import Animation
 
 # Fixtures
@@ -19,6 +20,23 @@ def mock_mesh():
     ]
     return mock
 
+@pytest.fixture
+def triangle_mesh():
+    """Fixture to create a mesh with two triangle cells."""
+    class Point:
+        def __init__(self, x, y):
+            self.x = x
+            self.y = y
+
+    class MockMesh:
+        def __init__(self):
+            self.points = [Point(0.0, 0.0), Point(1.0, 0.0), Point(0.0, 1.0), Point(1.0, 1.0)]
+            self.cells = []
+
+    mesh = MockMesh()
+    mesh.cells.extend([Triangle(0, [0, 1, 2], mesh), Triangle(1, [1, 3, 2], mesh)])
+    return mesh
+
 @pytest.fixture
 def animation_instance(mock_mesh, tmp_path):
     """Fixture to create an instance of Animation class."""
@@ -81,3 +99,72 @@ def test_make_plot_error_handling(animation_instance):
 
     with pytest.raises(Exception):
         animation_instance.make_plot(time_val=1.0, total_oil=0.5)
+
+def test_render_frames_reuse_figure(triangle_mesh, tmp_path):
+    """Test that frames are drawn on one figure and only differ in the rendered oil amounts."""
+    animation = Animation(mesh=triangle_mesh, fps=24, fishing_grounds=[[0.0, 0.5], [0.0, 0.5]], results_folder=tmp_path)
+
+    animation.render_frame(time_val=0.0, total_oil=0.0, oil_amounts=[0.0, 0.0])
+    renderer = animation._renderer
+    animation.render_frame(time_val=0.0, total_oil=0.0, oil_amounts=[0.0, 0.0])
+    animation.render_frame(time_val=0.0, total_oil=0.0, oil_amounts=[1.0, 0.0])
+
+    assert animation._renderer is renderer, "The figure should be built only once."
+    assert animation._frame_count == 3
+    first, repeated, changed = animation._frames
+    assert first.mode == "RGB"
+    assert first.size == changed.size
+    assert first.tobytes() == repeated.tobytes()
+    assert first.tobytes() != changed.tobytes()
+
+    animation.make_plot(time_val=1.0, total_oil=0.5, oil_amounts=[0.5, 0.5])
+    assert (tmp_path / "result.png").exists()
+
+def test_streamed_gif(triangle_mesh, tmp_path):
+    """Test that streamed frames are written to the GIF file instead of being kept in memory."""
+    animation = Animation(mesh=triangle_mesh, fps=10, fishing_grounds=[[0.0, 0.5], [0.0, 0.5]], results_folder=tmp_path,
+                          stream=True)
+
+    for oil in ([0.0, 0.0], [1.0, 0.0], [0.0, 1.0]):
+        animation.render_frame(time_val=0.0, total_oil=0.0, oil_amounts=oil)
+    assert animation._frames == [], "Streamed frames should not be kept in memory."
+
+    animation.finish_video()
+
+    with Image.open(tmp_path / "animation.gif") as gif:
+        assert gif.n_frames == 3
+        assert gif.info["duration"] == 100
+        assert gif.size == (640, 480)
+
+def test_streamed_mp4(triangle_mesh, tmp_path):
+    """Test that frames can be streamed to an MP4 file through imageio."""
+    pytest.importorskip("imageio_ffmpeg")
+    animation = Animation(mesh=triangle_mesh, fps=10, fishing_grounds=[[0.0, 0.5], [0.0, 0.5]], results_folder=tmp_path,
+                          video_format="mp4", stream=True)
+
+    for oil in ([0.0, 0.0], [1.0, 0.0]):
+        animation.render_frame(time_val=0.0, total_oil=0.0, oil_amounts=oil)
+    animation.finish_video()
+
+    assert (tmp_path / "animation.mp4").stat().st_size > 0
+
+def test_invalid_video_format(mock_mesh):
+    """Test that an unsupported video format is rejected."""
+    with pytest.raises(ValueError, match="Unknown video format"):
+        Animation(mesh=mock_mesh, video_format="avi")
+
+def test_render_workers_keep_frame_order(triangle_mesh, tmp_path):
+    """Test that frames rendered in worker processes match the in-process frames, in submission order."""
+    oil_states = [[0.1 * i, 1.0 - 0.1 * i] for i in range(6)]
+    serial = Animation(mesh=triangle_mesh, fps=10, fishing_grounds=[[0.0, 0.5], [0.0, 0.5]], results_folder=tmp_path)
+    parallel = Animation(mesh=triangle_mesh, fps=10, fishing_grounds=[[0.0, 0.5], [0.0, 0.5]], results_folder=tmp_path,
+                         render_workers=2)
+
+    for i, oil in enumerate(oil_states):
+        serial.render_frame(time_val=0.1 * i, total_oil=oil[0], oil_amounts=oil)
+        parallel.render_frame(time_val=0.1 * i, total_oil=oil[0], oil_amounts=oil)
+    parallel.wait_for_frames()
+
+    assert len(parallel._frames) == len(oil_states)
+    for serial_frame, parallel_frame in zip(serial._frames, parallel._frames):
+        assert serial_frame.tobytes() == parallel_frame.tobytes()
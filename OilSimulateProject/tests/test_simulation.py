@@ -3,6 +3,7 @@ import numpy as np
 from unittest import mock
 from unittest.mock import MagicMock, Mock, patch
 from src.simulation.simulator import Simulation
+from src.simulation.flux_engine import FluxEngine
 from src.cell.triangle_cell import Triangle
 import os
 
@@ -160,3 +161,112 @@ def test_flux_function(u_i, u_ngh, v_vector, v_avg, expected_flux, mock_mesh, tm
     flux = sim.g(u_i, u_ngh, v_vector, v_avg)
     
     assert flux == pytest.approx(expected_flux)
+
+def test_simulations_share_mesh(graded_mesh, tmp_path):
+    """Test that simulations sharing a mesh keep separate oil states and leave the cells untouched."""
+    first = Simulation(graded_mesh, (0.3, 0.3), ((0, 1), (0, 1)), 10, 0.0, 1.0, None, str(tmp_path), None, "first")
+    second = Simulation(graded_mesh, (0.7, 0.7), ((0, 1), (0, 1)), 10, 0.0, 1.0, None, str(tmp_path), None, "second")
+    first_oil = first.oil_amounts.copy()
+
+    second.oil_movement()
+
+    assert first.oil_amounts == pytest.approx(first_oil)
+    assert not np.allclose(first.oil_amounts, second.oil_amounts)
+
+@patch("src.simulation.simulator.Animation")
+def test_write_frequency_samples_steps(mock_animation, graded_mesh, tmp_path, monkeypatch):
+    """Test that frames are only rendered on sampled steps, while the mass balance covers all steps."""
+    monkeypatch.chdir(tmp_path)
+    sim = Simulation(
+        graded_mesh, (0.5, 0.5), ((0, 1), (0, 1)), 10, 0.0, 1.0, 10, str(tmp_path), None, "test",
+        update_mode="two-phase", write_frequency=4
+    )
+    sampled_steps = []
+    check_mass_balance = sim.check_mass_balance
+    def record_mass_balance():
+        sampled_steps.append(check_mass_balance())
+        return sampled_steps[-1]
+    sim.check_mass_balance = record_mass_balance
+
+    final_oil = sim.run_simulation()
+
+    # Initial frame plus steps 0, 4, 8 and the last step 10
+    animation = mock_animation.return_value
+    assert animation.render_frame.call_count == 5
+    assert [call.kwargs["time_val"] for call in animation.render_frame.call_args_list] == \
+        pytest.approx([0.0, 0.0, 0.4, 0.8, 1.0])
+    animation.finish_video.assert_called_once()
+    assert len(sampled_steps) == 4
+    assert all(mass_error == pytest.approx(0.0, abs=1e-12) for _, mass_error in sampled_steps)
+    assert final_oil == pytest.approx(sim.check_fishing_grounds(10))
+
+def test_named_fishing_grounds(graded_mesh, tmp_path):
+    """Test that every fishing ground sums the oil of the triangles whose midpoint lies inside it."""
+    sim = Simulation(
+        graded_mesh, (0.5, 0.5), ((0, 0.5), (0, 0.5)), 10, 0.0, 1.0, None, str(tmp_path), None, "test",
+        named_fishing_grounds={"left": ((0, 0.5), (0, 1)), "everywhere": ((0, 1), (0, 1))}
+    )
+    oil = sim.oil_amounts
+
+    total_oil = sim.check_fishing_grounds(0)
+
+    # Triangle 0 has its midpoint at (1/6, 1/3), triangle 1 at (1/3, 2/3), the line is never counted
+    assert total_oil == pytest.approx(oil[0])
+    assert sim.fishing_ground_oil == pytest.approx(
+        {"borders": oil[0], "left": oil[0] + oil[1], "everywhere": np.sum(oil[:-1])})
+
+@patch("src.simulation.simulator.Animation")
+def test_adaptive_time_stepping_reaches_end_time(mock_animation, graded_mesh, tmp_path, monkeypatch):
+    """Test that adaptive time stepping takes the largest stable steps and ends exactly at tEnd."""
+    monkeypatch.chdir(tmp_path)
+    sim = Simulation(
+        graded_mesh, (0.5, 0.5), ((0, 1), (0, 1)), None, 0.0, 1.0, 10, str(tmp_path), None, "test",
+        engine="vectorized", time_stepping="adaptive", cfl=0.5
+    )
+    stable_delta_t = 0.5 * FluxEngine(graded_mesh, 0.1).max_stable_time_step()
+
+    sim.run_simulation()
+
+    times = [call.kwargs["time_val"] for call in mock_animation.return_value.render_frame.call_args_list]
+    assert sim.steps_taken == int(np.ceil(1.0 / stable_delta_t))
+    assert times[0] == 0.0 and times[-1] == 1.0
+    assert np.diff(times[1:-1]) == pytest.approx(stable_delta_t)
+    assert np.min(sim.oil_amounts) >= 0.0
+
+def test_fixed_time_stepping_requires_steps(graded_mesh, tmp_path):
+    """Test that fixed time stepping needs nSteps and that the CFL number is checked."""
+    with pytest.raises(ValueError, match="nSteps"):
+        Simulation(graded_mesh, (0.5, 0.5), ((0, 1), (0, 1)), None, 0.0, 1.0, None, str(tmp_path), None, "test")
+    with pytest.raises(ValueError, match="CFL"):
+        Simulation(
+            graded_mesh, (0.5, 0.5), ((0, 1), (0, 1)), None, 0.0, 1.0, None, str(tmp_path), None, "test",
+            time_stepping="adaptive", cfl=1.5
+        )
+
+def test_active_region_matches_full_sweep(graded_mesh, tmp_path):
+    """Test that skipping faces outside the active region leaves the result unchanged for a zero threshold."""
+    runs = []
+    for active_threshold in (None, 0.0):
+        sim = Simulation(
+            graded_mesh, (0.1, 0.5), ((0, 1), (0, 1)), 40, 0.0, 0.4, None, str(tmp_path), None, "test",
+            engine="vectorized", active_threshold=active_threshold
+        )
+        # Start from a slick on the first cells only, so the region has to follow it
+        sim.oil_amounts[:] = 0.0
+        sim.oil_amounts[:2] = 1.0
+        sim.check_mass_balance()
+        for _ in range(40):
+            sim.oil_movement()
+        runs.append((sim.oil_amounts.copy(), sim.check_mass_balance()[1]))
+
+    (full_oil, _), (active_oil, mass_error) = runs
+    assert np.array_equal(active_oil, full_oil)
+    assert mass_error == pytest.approx(0.0, abs=1e-12)
+
+def test_active_threshold_requires_vectorized_engine(graded_mesh, tmp_path):
+    """Test that active-region flux evaluation is only available for the vectorized engine."""
+    with pytest.raises(ValueError, match="Active-region flux evaluation"):
+        Simulation(
+            graded_mesh, (0.5, 0.5), ((0, 1), (0, 1)), 10, 0.0, 1.0, None, str(tmp_path), None, "test",
+            active_threshold=0.0
+        )
@@ -0,0 +1,66 @@
+import pytest
+import numpy as np
+from src.io.solution_writer import write_solution
+from src.io.solution_reader import (
+    read_oil_amounts,
+    read_solution_metadata,
+    solution_format
+)
+
+@pytest.fixture
+def mock_mesh():
+    """Create a mesh with four cells holding oil amounts."""
+    class Cell:
+        def __init__(self, oil_amount):
+            self.oil_amount = oil_amount
+
+    class MockMesh:
+        def __init__(self):
+            self.cells = [Cell(0.0), Cell(0.25), Cell(1.5), Cell(0.125)]
+
+    return MockMesh()
+
+@pytest.mark.parametrize("fmt, extension", [("text", "txt"), ("binary", "npz")])
+def test_solution_round_trip(mock_mesh, tmp_path, monkeypatch, fmt, extension):
+    """Test that a written solution is read back with its format detected automatically."""
+    monkeypatch.chdir(tmp_path)
+    oil = np.array([0.0, 0.5, 0.75, 2.0])
+
+    write_solution(mock_mesh, 0.4, 1.25, "test", oil_amounts=oil, solution_format=fmt)
+
+    solution_file = tmp_path / "solutions" / f"test_solution.{extension}"
+    assert solution_format(str(solution_file)) == fmt
+    assert read_oil_amounts(str(solution_file), 4) == pytest.approx(oil)
+    assert read_solution_metadata(str(solution_file)) == {"time": 0.4, "total_oil_in_fishing_grounds": 1.25}
+
+def test_binary_solution_is_memory_mapped(mock_mesh, tmp_path, monkeypatch):
+    """Test that binary oil amounts are mapped copy-on-write, so updates do not change the file."""
+    monkeypatch.chdir(tmp_path)
+    write_solution(mock_mesh, 0.4, 1.25, "test", solution_format="binary")
+    solution_file = str(tmp_path / "solutions" / "test_solution.npz")
+
+    oil = read_oil_amounts(solution_file, 4)
+    assert isinstance(oil, np.memmap)
+    assert oil == pytest.approx([cell.oil_amount for cell in mock_mesh.cells])
+
+    oil += 1.0
+    assert read_oil_amounts(solution_file, 4) == pytest.approx([cell.oil_amount for cell in mock_mesh.cells])
+
+def test_binary_solution_validation(tmp_path):
+    """Test that binary solutions must match the mesh and hold non-negative oil amounts."""
+    solution_file = tmp_path / "solution.npy"
+    np.save(solution_file, np.array([0.5, 1.0]))
+
+    assert read_oil_amounts(str(solution_file), 2) == pytest.approx([0.5, 1.0])
+    with pytest.raises(ValueError, match="the mesh has 3 cells"):
+        read_oil_amounts(str(solution_file), 3)
+
+    np.save(solution_file, np.array([0.5, -1.0]))
+    with pytest.raises(ValueError, match="Oil amount cannot be negative"):
+        read_oil_amounts(str(solution_file), 2)
+
+def test_unknown_solution_format(mock_mesh, tmp_path, monkeypatch):
+    """Test that an unsupported solution format is rejected."""
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(ValueError, match="Unknown solution format"):
+        write_solution(mock_mesh, 0.4, 1.25, "test", solution_format="hdf5")
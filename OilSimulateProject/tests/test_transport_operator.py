@@ -0,0 +1,109 @@
+import pytest
+import numpy as np
+from unittest.mock import patch
+from src.simulation.flux_engine import FluxEngine
+from src.simulation.simulator import Simulation
+from scipy.sparse.linalg import splu
+from src.simulation.transport_operator import TransportOperator, ImplicitTransportOperator
+
+@pytest.fixture
+def engine(graded_mesh):
+    """Flux engine of the graded mesh at 0.9 times its largest stable time step."""
+    engine = FluxEngine(graded_mesh, 1.0)
+    engine.set_time_step(0.9 * engine.max_stable_time_step())
+    return engine
+
+@pytest.fixture
+def oil(graded_mesh):
+    """Oil amounts of the triangles increasing from left to right, none on the boundary line."""
+    oil = np.linspace(1.0, 2.0, len(graded_mesh.cells))
+    oil[-1] = 0.0
+    return oil
+
+def test_step_matches_flux_engine(engine, oil):
+    """Test that one mat-vec gives the oil change and boundary outflow of the flux engine."""
+    operator = TransportOperator(engine)
+    fluxes = engine.face_fluxes(oil)
+
+    new_oil, outflow = operator.step(oil)
+
+    assert new_oil == pytest.approx(oil + engine.oil_change(oil, fluxes))
+    assert outflow == pytest.approx(engine.boundary_outflow(fluxes))
+
+@pytest.mark.parametrize("n_steps", [1, 6, 13])
+def test_squaring_matches_repeated_steps(engine, oil, n_steps):
+    """Test that a matrix power built by repeated squaring equals n_steps single steps."""
+    operator = TransportOperator(engine)
+    expected, expected_outflow = oil, 0.0
+    for _ in range(n_steps):
+        expected, outflow = operator.step(expected)
+        expected_outflow += outflow
+
+    for method in ("matvec", "squaring"):
+        new_oil, outflow = operator.advance(oil, n_steps, method)
+        assert new_oil == pytest.approx(expected)
+        assert outflow == pytest.approx(expected_outflow)
+
+def test_propagate_approaches_small_steps(engine, oil):
+    """Test that the expm_multiply propagation is the limit of many small steps."""
+    duration = 4 * engine.delta_t
+    engine.set_time_step(duration / 4096)
+    expected, _ = TransportOperator(engine).advance(oil, 4096)
+
+    assert TransportOperator(engine).propagate(oil, duration) == pytest.approx(expected, rel=1e-3)
+
+@pytest.mark.parametrize("sparse_jump", ["matvec", "squaring"])
+@patch("src.simulation.simulator.Animation")
+def test_sparse_engine_matches_vectorized(mock_animation, sparse_jump, graded_mesh, tmp_path, monkeypatch):
+    """Test that the sparse engine with postponed steps reproduces the vectorized engine."""
+    monkeypatch.chdir(tmp_path)
+    args = (graded_mesh, (0.9, 0.5), ((0, 1), (0, 1)), 20, 0.0, 0.5, 10, str(tmp_path), None, "test")
+    vectorized = Simulation(*args, engine="vectorized", write_frequency=6)
+    vectorized.run_simulation()
+    sparse = Simulation(*args, engine="sparse", write_frequency=6, sparse_jump=sparse_jump)
+    balances = []
+    check_mass_balance = sparse.check_mass_balance
+    def record_mass_balance():
+        balances.append(check_mass_balance())
+        return balances[-1]
+    sparse.check_mass_balance = record_mass_balance
+
+    sparse.run_simulation()
+
+    assert sparse.oil_amounts == pytest.approx(vectorized.oil_amounts)
+    assert len(balances) == 5
+    assert all(mass_error == pytest.approx(0.0, abs=1e-12) for _, mass_error in balances)
+
+def test_implicit_step_solves_backward_euler(engine, oil, graded_mesh):
+    """Test that a step far beyond the CFL limit solves the backward Euler system, stays
+    non-negative and balances the mass."""
+    engine.set_time_step(50 * engine.delta_t)
+    operator = ImplicitTransportOperator(engine)
+    areas = np.array([getattr(cell, "area", 0.0) for cell in graded_mesh.cells])
+
+    new_oil, outflow = operator.step(oil)
+
+    assert operator.system_matrix @ new_oil == pytest.approx(oil)
+    assert np.all(new_oil >= 0)
+    assert areas @ oil - areas @ new_oil == pytest.approx(outflow)
+    with pytest.raises(ValueError, match="does not support"):
+        operator.advance(oil, 2, "squaring")
+
+@patch("src.simulation.simulator.Animation")
+def test_implicit_engine_factorizes_once(mock_animation, graded_mesh, tmp_path, monkeypatch):
+    """Test that the factorization is reused for all steps of the same length and velocities."""
+    monkeypatch.chdir(tmp_path)
+    sim = Simulation(
+        graded_mesh, (0.9, 0.5), ((0, 1), (0, 1)), 4, 0.0, 2.0, None, str(tmp_path), None, "test",
+        engine="implicit")
+    with patch("scipy.sparse.linalg.splu", wraps=splu) as factorize:
+        sim.run_simulation()
+
+    assert factorize.call_count == 1
+    assert np.all(sim.oil_amounts >= 0)
+
+def test_implicit_engine_requires_fixed_time_stepping(graded_mesh):
+    """Test that the implicit engine rejects time steppings bound to the stable time step."""
+    with pytest.raises(ValueError, match="requires fixed time stepping"):
+        Simulation(graded_mesh, (0.9, 0.5), ((0, 1), (0, 1)), None, 0.0, 1.0, None, "", None, "test",
+                   engine="implicit", time_stepping="adaptive")
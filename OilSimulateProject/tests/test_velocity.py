@@ -0,0 +1,180 @@
+import pytest
+import numpy as np
+from unittest.mock import patch
+from src.simulation.flux_engine import FluxEngine
+from src.simulation.simulator import Simulation
+from src.simulation.velocity import (
+    AnalyticVelocity, GriddedVelocity, SnapshotVelocity, DEFAULT_VELOCITY, create_velocity_provider)
+
+def test_default_velocity_matches_cells(graded_mesh):
+    """Test that the default provider gives the velocity fields of the cells."""
+    midpoints = np.array([cell.midpoint for cell in graded_mesh.cells])
+    expected = np.array([cell.velocity_field for cell in graded_mesh.cells])
+
+    assert DEFAULT_VELOCITY.velocities(midpoints) == pytest.approx(expected)
+    assert expected[:, 0] == pytest.approx(midpoints[:, 1] - 0.2 * midpoints[:, 0])
+    assert not DEFAULT_VELOCITY.time_dependent
+
+def test_analytic_velocity_time_index():
+    """Test that a time-dependent expression is constant within each refresh interval."""
+    velocity = AnalyticVelocity("sin(pi*t) + 0*x", "1", refresh_interval=0.25)
+    points = np.array([[0.0, 0.0], [1.0, 2.0]])
+
+    assert velocity.time_dependent
+    assert [velocity.time_index(t) for t in (0.0, 0.2, 0.25, 0.6)] == [0, 0, 1, 2]
+    assert velocity.velocities(points, 0.5) == pytest.approx(np.array([[1.0, 1.0], [1.0, 1.0]]))
+
+@pytest.mark.parametrize("u, v, refresh_interval, match", [
+    ("y -", "-x", None, "Invalid velocity expression"),
+    ("__import__('os')", "-x", None, "Unknown names"),
+    ("t", "-x", None, "refresh interval"),
+    ("(lambda: ().__class__.__base__.__subclasses__())()", "-x", None, "may only call"),
+    ("(lambda: x)", "-x", None, "Unsupported syntax"),
+    ("x.__class__", "-x", None, "Unsupported syntax"),
+    ("[x for x in (1, 2)][0]", "-x", None, "Unsupported syntax"),
+    ("sin(x)[0]", "-x", None, "Unsupported syntax"),
+    ("'a' + x", "-x", None, "only contain numbers"),
+])
+def test_analytic_velocity_invalid(u, v, refresh_interval, match):
+    """Test that invalid expressions are rejected."""
+    with pytest.raises(ValueError, match=match):
+        AnalyticVelocity(u, v, refresh_interval)
+
+def test_gridded_velocity(tmp_path):
+    """Test bilinear interpolation, clamping outside the grid and snapshot selection."""
+    x = np.array([0.0, 1.0, 2.0])
+    y = np.array([0.0, 1.0])
+    X, Y = np.meshgrid(x, y)
+    file_name = tmp_path / "currents.npz"
+    np.savez(file_name, x=x, y=y, t=np.array([0.0, 1.0]),
+             u=np.stack([X + 2 * Y, -X]), v=np.stack([np.zeros_like(X), Y]))
+    velocity = GriddedVelocity(str(file_name))
+    points = np.array([[0.5, 0.5], [1.5, 0.25], [3.0, -1.0]])
+
+    # A bilinear field is reproduced exactly inside the grid
+    assert velocity.velocities(points, 0.5) == pytest.approx(np.array([[1.5, 0.0], [2.0, 0.0], [2.0, 0.0]]))
+    assert velocity.velocities(points, 1.5) == pytest.approx(np.array([[-0.5, 0.5], [-1.5, 0.25], [-2.0, 0.0]]))
+    assert velocity.time_dependent
+    assert [velocity.time_index(t) for t in (-1.0, 0.0, 0.99, 1.0, 5.0)] == [0, 0, 0, 1, 1]
+
+def test_gridded_velocity_invalid_shape(tmp_path):
+    """Test that velocity components must match the grid."""
+    file_name = tmp_path / "currents.npz"
+    np.savez(file_name, x=np.array([0.0, 1.0]), y=np.array([0.0, 1.0]), u=np.zeros((3, 2)), v=np.zeros((2, 2)))
+    with pytest.raises(ValueError, match="must have shape"):
+        GriddedVelocity(str(file_name))
+
+def test_create_velocity_provider():
+    """Test that the config section selects the provider."""
+    velocity = create_velocity_provider({"type": "analytic", "u": "1", "v": "x"})
+    assert velocity.expressions == ("1", "x")
+    with pytest.raises(ValueError, match="Unknown velocity type"):
+        create_velocity_provider({"type": "tidal"})
+
+def test_set_velocities_updates_face_flow(graded_mesh):
+    """Test that new cell velocities replace the cached face flows."""
+    engine = FluxEngine(graded_mesh, 0.1)
+    uniform = np.tile([1.0, 0.0], (len(graded_mesh.cells), 1))
+    engine.set_velocities(uniform)
+
+    assert engine.face_flow == pytest.approx(FluxEngine(graded_mesh, 0.1, uniform).face_flow)
+    assert np.all(engine.face_flow[engine.boundary] > 0)
+
+@pytest.mark.parametrize("engine", ["object", "vectorized"])
+@patch("src.simulation.simulator.Animation")
+def test_velocities_refreshed_on_time_index_change(mock_animation, engine, graded_mesh, tmp_path, monkeypatch):
+    """Test that a time-dependent provider is only evaluated when its time index changes."""
+    monkeypatch.chdir(tmp_path)
+    velocity = AnalyticVelocity("t + 0*x", "0", refresh_interval=0.25)
+    sim = Simulation(
+        graded_mesh, (0.5, 0.5), ((0, 1), (0, 1)), 9, 0.0, 0.9, None, str(tmp_path), None, "test",
+        engine=engine, update_mode="two-phase", velocity=velocity
+    )
+    with patch.object(velocity, "velocities", wraps=velocity.velocities) as evaluate:
+        sim.run_simulation()
+
+    # Steps start at t = 0, 0.1, ..., 0.9, the time index changes at 0.3, 0.5 and 0.8
+    assert [call.args[1] for call in evaluate.call_args_list] == pytest.approx([0.3, 0.5, 0.8])
+
+@pytest.fixture
+def snapshot_file(tmp_path):
+    """Write five snapshots of three cells, where snapshot k holds the velocity (k, -k) everywhere."""
+    times = np.array([0.0, 1.0, 2.0, 3.0, 4.0])
+    velocities = np.stack([np.tile([k, -k], (3, 1)) for k in range(len(times))]).astype(float)
+    file_name = tmp_path / "tides.npz"
+    np.savez(file_name, t=times, velocities=velocities)
+    return str(file_name)
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_snapshot_velocity_interpolates_in_time(snapshot_file, prefetch):
+    """Test linear interpolation between the bracketing snapshots and constant values outside."""
+    velocity = SnapshotVelocity(snapshot_file, prefetch=prefetch)
+    points = np.zeros((3, 2))
+
+    assert velocity.velocities(points, 1.25) == pytest.approx(np.tile([1.25, -1.25], (3, 1)))
+    assert velocity.velocities(points, -1.0) == pytest.approx(np.tile([0.0, 0.0], (3, 1)))
+    assert velocity.velocities(points, 9.0) == pytest.approx(np.tile([4.0, -4.0], (3, 1)))
+    assert velocity.time_index(9.0) == velocity.time_index(4.0)
+    velocity.close()
+
+def test_snapshot_velocity_keeps_bracket_resident(snapshot_file):
+    """Test that only the bracketing snapshots stay in memory and each snapshot is read once."""
+    velocity = SnapshotVelocity(snapshot_file)
+    points = np.zeros((3, 2))
+
+    for time_val in np.arange(0.0, 4.0, 0.25):
+        velocity.velocities(points, time_val)
+        assert velocity.resident_snapshots == [int(time_val), int(time_val) + 1]
+
+    assert velocity.snapshots_read == 5
+    velocity.close()
+
+def test_snapshot_velocity_invalid(snapshot_file, tmp_path):
+    """Test that the snapshots must match the mesh and have the expected layout."""
+    velocity = SnapshotVelocity(snapshot_file, prefetch=False)
+    with pytest.raises(ValueError, match="hold 3 cells"):
+        velocity.velocities(np.zeros((4, 2)), 0.0)
+
+    file_name = tmp_path / "invalid.npz"
+    np.savez(file_name, t=np.array([0.0, 1.0]), velocities=np.zeros((3, 3, 2)))
+    with pytest.raises(ValueError, match="must have shape"):
+        SnapshotVelocity(str(file_name))
+
+def test_snapshot_velocity_time_index(snapshot_file):
+    """Test that the time index changes every refresh interval, a tenth of the snapshot spacing by default."""
+    times = (-1.0, 0.0, 0.35, 0.99, 2.55, 9.0)
+    assert [SnapshotVelocity(snapshot_file).time_index(t) for t in times] == [0, 0, 3, 9, 25, 40]
+    times = (-1.0, 0.0, 0.3, 0.99, 1.0, 2.6, 3.5, 9.0)
+    assert [SnapshotVelocity(snapshot_file, refresh_interval=0.5).time_index(t) for t in times] == \
+        [0, 0, 0, 1, 2, 5, 7, 8]
+    with pytest.raises(ValueError, match="must be positive"):
+        SnapshotVelocity(snapshot_file, refresh_interval=0.0)
+
+@pytest.mark.parametrize("refresh_interval, refresh_times", [
+    (None, [0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9, 1.0]), (0.25, [0.3, 0.5, 0.8, 1.0])
+])
+@patch("src.simulation.simulator.Animation")
+def test_snapshot_velocity_simulation(mock_animation, refresh_interval, refresh_times, graded_mesh, tmp_path, monkeypatch):
+    """Test that snapshots of the default field are interpolated only when the time index changes."""
+    monkeypatch.chdir(tmp_path)
+    cell_velocities = np.array([cell.velocity_field for cell in graded_mesh.cells])
+    file_name = tmp_path / "tides.npz"
+    np.savez(file_name, t=np.array([0.0, 0.5, 1.0]),
+             velocities=np.stack([cell_velocities, 3 * cell_velocities, cell_velocities]))
+    velocity = SnapshotVelocity(str(file_name), refresh_interval=refresh_interval)
+
+    args = (graded_mesh, (0.9, 0.5), ((0, 1), (0, 1)), 10, 0.0, 1.0, None, str(tmp_path), None, "test")
+    sim = Simulation(*args, engine="vectorized", velocity=velocity)
+    with patch.object(velocity, "velocities", wraps=velocity.velocities) as evaluate:
+        sim.run_simulation()
+    assert [call.args[1] for call in evaluate.call_args_list] == pytest.approx(refresh_times)
+
+    expected = Simulation(*args, engine="vectorized")
+    for n in expected.time_steps():
+        if any(expected._current_time == pytest.approx(t) for t in refresh_times):
+            scale = np.interp(expected._current_time, [0.0, 0.5, 1.0], [1.0, 3.0, 1.0])
+            expected._flux_engine.set_velocities(scale * cell_velocities)
+        expected.vectorized_oil_movement()
+
+    assert sim.oil_amounts == pytest.approx(expected.oil_amounts)
+    assert velocity.resident_snapshots == []
@@ -0,0 +1,117 @@
+import pytest
+import numpy as np
+from unittest.mock import patch
+from src.cell.triangle_cell import Triangle
+from src.cell.line_cell import Line
+from src.simulation.zones import points_in_polygon, UniformGrid, MonitoringZones
+from src.simulation.simulator import Simulation
+from src.io.zone_series import ZoneSeriesWriter, read_zone_series
+
+@pytest.fixture
+def grid_mesh():
+    """Create a mesh of the unit square split into 2 * 8 * 8 triangles, with one boundary line."""
+    class Point:
+        def __init__(self, x, y):
+            self.x = x
+            self.y = y
+
+    class MockMesh:
+        def __init__(self):
+            self.points = []
+            self.cells = []
+
+    n = 8
+    mesh = MockMesh()
+    for i in range(n + 1):
+        for j in range(n + 1):
+            mesh.points.append(Point(i / n, j / n))
+
+    mesh.cells.append(Line(0, [0, n + 1], mesh))
+    for i in range(n):
+        for j in range(n):
+            p = i * (n + 1) + j
+            mesh.cells.append(Triangle(len(mesh.cells), [p, p + n + 1, p + 1], mesh))
+            mesh.cells.append(Triangle(len(mesh.cells), [p + n + 1, p + n + 2, p + 1], mesh))
+    return mesh
+
+def test_points_in_concave_polygon():
+    """Test the even-odd rule on an L-shaped polygon."""
+    polygon = np.array([[0, 0], [2, 0], [2, 1], [1, 1], [1, 2], [0, 2]], dtype=float)
+    points = np.array([[0.5, 0.5], [1.5, 0.5], [0.5, 1.5], [1.5, 1.5], [3.0, 0.5], [-0.5, 1.0]])
+
+    assert points_in_polygon(points, polygon).tolist() == [True, True, True, False, False, False]
+
+def test_uniform_grid_query_contains_box():
+    """Test that a box query returns every point inside the box."""
+    rng = np.random.default_rng(0)
+    points = rng.random((500, 2))
+    grid = UniformGrid(points)
+
+    candidates = grid.query_box((0.2, 0.3), (0.45, 0.9))
+    inside = np.flatnonzero(
+        (points[:, 0] >= 0.2) & (points[:, 0] <= 0.45) & (points[:, 1] >= 0.3) & (points[:, 1] <= 0.9))
+
+    assert set(inside) <= set(candidates)
+    assert len(candidates) < len(points)
+    assert len(np.unique(candidates)) == len(candidates)
+
+def test_zone_membership_matches_brute_force(grid_mesh):
+    """Test that the indexed membership equals testing every triangle against every polygon."""
+    zones = {
+        "triangle": [[0.1, 0.1], [0.9, 0.2], [0.3, 0.8]],
+        "l_shape": [[0, 0], [0.6, 0], [0.6, 0.3], [0.3, 0.3], [0.3, 0.6], [0, 0.6]],
+        "outside": [[2, 2], [3, 2], [3, 3]],
+    }
+    monitored = MonitoringZones(grid_mesh, zones)
+
+    triangles = [cell for cell in grid_mesh.cells if isinstance(cell, Triangle)]
+    midpoints = np.array([cell.midpoint for cell in triangles])
+    for name, polygon in zones.items():
+        inside = points_in_polygon(midpoints, np.array(polygon, dtype=float))
+        expected = [cell.index for cell, is_inside in zip(triangles, inside) if is_inside]
+        assert monitored.cells_in(name).tolist() == expected
+    assert len(monitored.cells_in("outside")) == 0
+
+def test_zone_oil_totals(grid_mesh):
+    """Test that the oil in each zone is the sum over its triangles."""
+    zones = {"left": [[0, 0], [0.5, 0], [0.5, 1], [0, 1]], "all": [[-1, -1], [2, -1], [2, 2], [-1, 2]]}
+    monitored = MonitoringZones(grid_mesh, zones)
+    oil = np.arange(len(grid_mesh.cells), dtype=float)
+
+    totals = monitored.oil_totals(oil)
+
+    assert totals[0] == pytest.approx(oil[monitored.cells_in("left")].sum())
+    # The boundary line (cell 0) is never counted
+    assert totals[1] == pytest.approx(oil[1:].sum())
+
+def test_zone_series_round_trip(tmp_path):
+    """Test that the written time series is read back per zone."""
+    filename = str(tmp_path / "zones.csv")
+    with ZoneSeriesWriter(filename, ["a", "b"]) as writer:
+        writer.append(0.0, np.array([1.0, 2.0]))
+        writer.append(0.5, np.array([0.5, 1.5]))
+        with pytest.raises(ValueError, match="2 zones"):
+            writer.append(1.0, np.array([1.0]))
+
+    times, series = read_zone_series(filename)
+
+    assert times == pytest.approx([0.0, 0.5])
+    assert series["a"] == pytest.approx([1.0, 0.5])
+    assert series["b"] == pytest.approx([2.0, 1.5])
+
+@patch("src.simulation.simulator.Animation")
+def test_simulation_writes_zone_series(mock_animation, grid_mesh, tmp_path, monkeypatch):
+    """Test that the oil in each zone is logged on every sampled step."""
+    monkeypatch.chdir(tmp_path)
+    zones = {"centre": [[0.25, 0.25], [0.75, 0.25], [0.75, 0.75], [0.25, 0.75]]}
+    sim = Simulation(
+        grid_mesh, (0.5, 0.5), ((0, 1), (0, 1)), 10, 0.0, 0.1, None, str(tmp_path), None, "test",
+        update_mode="two-phase", write_frequency=5, zones=zones
+    )
+
+    sim.run_simulation()
+
+    times, series = read_zone_series(str(tmp_path / "zones.csv"))
+    assert times == pytest.approx([0.0, 0.05, 0.1])
+    assert series["centre"][-1] == pytest.approx(sim.zone_oil["centre"])
+    assert sim.zone_oil["centre"] == pytest.approx(sim.oil_amounts[MonitoringZones(grid_mesh, zones).cells_in("centre")].sum())